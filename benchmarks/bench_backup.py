@@ -0,0 +1,121 @@
+# bench_backup.py
+# backup.copy_database on a multi-gigabyte WAL database while a writer thread keeps committing:
+# backup throughput, the writer's worst commit stall and the WAL's peak size during the copy, whether the
+# copy had to pin a read snapshot, and restore time.
+# Usage: python benchmarks/bench_backup.py [--size-mb 2048] [--pages 1024] [--write-every 0.002]
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+import statistics
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+import backup
+
+ROW_BYTES = 64 * 1024
+
+def build(path, size_mb):
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE saved_resumes (id INTEGER PRIMARY KEY, user_id INTEGER, data_dump BLOB)")
+    rows = size_mb * 1024 * 1024 // ROW_BYTES
+    blob = os.urandom(ROW_BYTES)  # incompressible, so the file really is size_mb on disk
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO saved_resumes (user_id, data_dump) VALUES (?, ?)", ((i % 10_000, blob) for i in range(rows)))
+    conn.execute("COMMIT")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return rows
+
+class Writer(threading.Thread):
+    """Small commits at a steady rate, like queue workers saving matches; records each commit's latency."""
+    def __init__(self, path, every):
+        super().__init__(daemon=True)
+        self.path, self.every = path, every
+        self.latencies, self.stop = [], threading.Event()
+
+    def run(self):
+        conn = sqlite3.connect(self.path, isolation_level=None, timeout=60)
+        conn.execute("PRAGMA busy_timeout=60000")
+        while not self.stop.is_set():
+            t0 = time.perf_counter()
+            conn.execute("INSERT INTO saved_resumes (user_id, data_dump) VALUES (?, ?)", (-1, b"x" * 512))
+            self.latencies.append(time.perf_counter() - t0)
+            time.sleep(self.every)
+        conn.close()
+
+class WalWatcher(threading.Thread):
+    def __init__(self, db_path):
+        super().__init__(daemon=True)
+        self.path, self.peak, self.stop = db_path + "-wal", 0, threading.Event()
+
+    def run(self):
+        while not self.stop.is_set():
+            if os.path.exists(self.path): self.peak = max(self.peak, os.path.getsize(self.path))
+            time.sleep(0.01)
+
+def under_load(path, every, fn):
+    writer, wal = Writer(path, every), WalWatcher(path)
+    writer.start()
+    time.sleep(0.5)
+    baseline = len(writer.latencies)
+    wal.start()
+    result = fn()
+    wal.stop.set()
+    writer.stop.set()
+    writer.join()
+    during = writer.latencies[baseline:]
+    result["wal_peak"] = wal.peak
+    return result, writer.latencies[:baseline], during
+
+def report(label, stats, idle, during):
+    mb = stats["bytes"] / 1e6
+    print(f"{label:28s} {mb:8.0f} MB in {stats['seconds']:6.2f}s = {mb / stats['seconds']:7.0f} MB/s | "
+          f"writer commits during copy: {len(during):5d}, median {statistics.median(during) * 1000:6.2f} ms, "
+          f"max stall {max(during) * 1000:7.1f} ms (idle max {max(idle) * 1000:.1f} ms) | "
+          f"WAL peak {stats['wal_peak'] / 1e6:.1f} MB, restarts {stats['restarts']}, pinned {stats['pinned']}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--pages", type=int, default=backup.PAGES_PER_STEP)
+    parser.add_argument("--write-every", type=float, default=0.002)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "portfolio.db")
+        t0 = time.perf_counter()
+        rows = build(src, args.size_mb)
+        print(f"built {os.path.getsize(src) / 1e6:.0f} MB ({rows} rows) in {time.perf_counter() - t0:.1f}s")
+
+        dst = os.path.join(tmp, "quiet.db")
+        wal = WalWatcher(src)
+        wal.start()
+        stats = backup.copy_database(src, dst, pages=args.pages)
+        wal.stop.set()
+        print(f"{'stepped, no writer':28s} {stats['bytes'] / 1e6:8.0f} MB in {stats['seconds']:6.2f}s | "
+              f"WAL peak {wal.peak / 1e6:.1f} MB, restarts {stats['restarts']}, pinned {stats['pinned']}")
+
+        dst = os.path.join(tmp, "stepped.db")
+        stats, idle, during = under_load(src, args.write_every, lambda: backup.copy_database(src, dst, pages=args.pages))
+        report(f"stepped ({args.pages} pages/step)", stats, idle, during)
+        conn = sqlite3.connect(dst)
+        copied = conn.execute("SELECT count(*) FROM saved_resumes WHERE user_id >= 0").fetchone()[0]
+        conn.close()
+        print(f"  snapshot rows {copied} of the {rows} built, plus the writer's rows up to the snapshot")
+
+        dst = os.path.join(tmp, "single.db")
+        stats, idle, during = under_load(src, args.write_every,
+                                         lambda: backup.copy_database(src, dst, pages=-1, pause=0))
+        report("single step", stats, idle, during)
+
+        t0 = time.perf_counter()
+        backup.restore(dst, src, safety_copy=False)
+        print(f"restore of {os.path.getsize(dst) / 1e6:.0f} MB over the live file: {time.perf_counter() - t0:.2f}s")
+
+if __name__ == "__main__":
+    main()
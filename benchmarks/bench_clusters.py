@@ -0,0 +1,105 @@
+# bench_clusters.py
+# cluster_classifier (hashing + logistic regression, memory-mapped) against the Pathfinder's
+# rank_career_clusters (one point per keyword hit): accuracy, load time and per-document latency.
+# The model is trained on synthetic resumes and tested on unseen ones, on their summary line alone
+# (a few keywords), on that line plus everyday resume sentences that contain no cluster keyword (but
+# do contain substrings of some: "rapidly" holds "api", "digital" holds "git"), and on JDs labelled
+# with the cluster they target.
+# Usage: python benchmarks/bench_clusters.py [--train 2000] [--test 1000] [--batch 256]
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import make_corpus
+from career_data import rank_career_clusters
+from cluster_classifier import build_model, ClusterClassifier
+
+EVERYDAY = ["Promoted to a senior position after two years.", "Thrived in a rapidly changing environment.",
+            "Comfortable with digital tools and remote collaboration.", "Proposed a company-wide volunteering program.",
+            "Recognized for a positive attitude and punctuality.", "Mentored new hires during their first quarter.",
+            "Fluent in English and Spanish.", "Available to relocate."]
+
+def keyword_top1(texts):
+    return [rank_career_clusters(t)[0][0] for t in texts]
+
+def calibration_error(probs, correct, bins=10):
+    """Expected calibration error: |confidence - accuracy| averaged over confidence bins."""
+    conf = probs.max(axis=1)
+    edges = np.linspace(0, 1, bins + 1)
+    err = 0.0
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        mask = (conf > lo) & (conf <= hi)
+        if mask.any(): err += mask.mean() * abs(conf[mask].mean() - correct[mask].mean())
+    return err
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", type=int, default=2000)
+    parser.add_argument("--test", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+
+    train = make_corpus(args.train, "medium", seed=31)
+    test = make_corpus(args.test, "medium", seed=32)
+    jd_cluster = lambda r: r["jd"].split(" Specialist")[0]
+    sets = {
+        "full resumes": ([r["resume"] for r in test], [r["cluster"] for r in test]),
+        "summary line only": ([r["resume_data"]["summary"] for r in test], [r["cluster"] for r in test]),
+        "summary + everyday": ([r["resume_data"]["summary"] + " " + " ".join(random.Random(i).sample(EVERYDAY, 3))
+                                for i, r in enumerate(test)], [r["cluster"] for r in test]),
+        "job descriptions": ([r["jd"].split("\n", 1)[1] for r in test], [jd_cluster(r) for r in test]),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        # Summary lines alongside full resumes, so the held-out split the temperature is fitted on has short texts too
+        meta = build_model([r["resume"] for r in train] + [r["resume_data"]["summary"] for r in train],
+                           [r["cluster"] for r in train] * 2, tmp)
+        print(f"trained on {meta['n_docs']} texts in {time.perf_counter() - t0:.1f}s "
+              f"(held-out accuracy {meta['holdout']['accuracy']:.1%}, temperature {meta['temperature']:.2f})")
+        size = sum(os.path.getsize(os.path.join(tmp, n)) for n in os.listdir(tmp))
+
+        t0 = time.perf_counter()
+        model = ClusterClassifier(tmp)
+        t_mmap = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        np.load(os.path.join(tmp, "coef.npy")).sum()
+        t_full = time.perf_counter() - t0
+        print(f"load: memory-mapped {t_mmap * 1000:.2f} ms vs. reading the {size / 1e6:.1f} MB of weights {t_full * 1000:.1f} ms")
+
+        print(f"\n{'test set':20} {'keyword hits':>13} {'classifier':>11} {'top-3':>7} {'ECE':>6}")
+        for name, (texts, labels) in sets.items():
+            labels = np.array(labels)
+            kw = np.mean(np.array(keyword_top1(texts)) == labels)
+            probs = model.predict_proba(texts)
+            pred = np.array(model.classes)[probs.argmax(axis=1)]
+            top3 = np.mean([l in [c for c, _ in row] for l, row in zip(labels, model.top_k(texts, 3))])
+            ece = calibration_error(probs, pred == labels)
+            print(f"{name:20} {kw:13.1%} {np.mean(pred == labels):11.1%} {top3:7.1%} {ece:6.3f}")
+
+        texts = sets["full resumes"][0]
+        model.top_k(texts[:args.batch], 3)  # warm the mapped pages
+        t0 = time.perf_counter()
+        for i in range(0, len(texts), args.batch): model.top_k(texts[i:i + args.batch], 3)
+        t_batch = (time.perf_counter() - t0) / len(texts)
+        single = []
+        for t in texts[:200]:
+            t0 = time.perf_counter()
+            model.top_k([t], 3)
+            single.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        keyword_top1(texts)
+        t_kw = (time.perf_counter() - t0) / len(texts)
+        words = statistics.mean(len(t.split()) for t in texts)
+        print(f"\nlatency (~{words:.0f}-word resumes): batches of {args.batch} {t_batch * 1000:.3f} ms/doc, "
+              f"single doc median {statistics.median(single) * 1000:.2f} ms, keyword hits {t_kw * 1000:.3f} ms/doc")
+
+if __name__ == "__main__":
+    main()
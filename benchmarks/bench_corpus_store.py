@@ -0,0 +1,138 @@
+# bench_corpus_store.py
+# corpus_store.CorpusStore at corpus scale: bulk append throughput, open time, random-read latency
+# (page cache warm, and cold after evicting the files with posix_fadvise), delete + compaction, next to
+# loading the same JDs from a JSONL file into memory, which is what any non-mapped corpus has to do.
+# Documents are the benchmark corpus's distinct JDs cycled with a per-document tag.
+# Usage: python benchmarks/bench_corpus_store.py [--docs 1000000] [--distinct 2000] [--reads 100000] [--jsonl 100000]
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import make_corpus
+from corpus_store import CorpusStore
+
+BATCH = 10_000
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool")
+
+def evict(path):
+    """Drops a file's clean pages from the page cache (no root needed), so the next read goes to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try: os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally: os.close(fd)
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS"): return int(line.split()[1]) / 1024
+    return 0.0
+
+def percentiles(samples):
+    s = sorted(samples)
+    return f"p50 {s[len(s) // 2] * 1e6:6.1f} us  p99 {s[int(len(s) * 0.99)] * 1e6:7.1f} us"
+
+def timed_reads(fn, ids):
+    out = []
+    for i in ids:
+        t0 = time.perf_counter()
+        fn(i)
+        out.append(time.perf_counter() - t0)
+    return out
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--jsonl", type=int, default=100_000, help="docs in the JSONL comparison")
+    args = parser.parse_args()
+    rng = random.Random(5)
+    jds = [(r["jd"], r["cluster"]) for r in make_corpus(args.distinct, "medium", seed=50)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corpus")
+        t0 = time.perf_counter()
+        with CorpusStore(path, writable=True) as store:
+            for start in range(0, args.docs, BATCH):
+                store.extend([(f"{jds[i % len(jds)][0]}\nRef {i}", {"cluster": jds[i % len(jds)][1], "source": "bench"})
+                              for i in range(start, min(start + BATCH, args.docs))])
+            stats = store.stats()
+        t_build = time.perf_counter() - t0
+        size = stats["data_bytes"] + stats["index_bytes"]
+        print(f"appended {stats['documents']:,} docs ({stats['data_bytes'] / 1e9:.2f} GB text+meta, "
+              f"{stats['index_bytes'] / 1e6:.0f} MB index) in {t_build:.1f}s = {size / t_build / 1e6:.0f} MB/s, "
+              f"fsync per {BATCH:,}-doc batch")
+
+        # --- open ---
+        opens = []
+        for _ in range(20):
+            t0 = time.perf_counter()
+            reader = CorpusStore(path)
+            opens.append(time.perf_counter() - t0)
+        probe = (f"import sys, time; sys.path.append({SRC!r}); t0 = time.perf_counter(); "
+                 f"from corpus_store import CorpusStore; s = CorpusStore({path!r}); s.text({args.docs - 1}); "
+                 f"print((time.perf_counter() - t0) * 1000)")
+        fresh = [float(subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True).stdout) for _ in range(5)]
+        rss_before = rss_mb()
+        print(f"open: median {statistics.median(opens) * 1000:.2f} ms in-process; new worker process "
+              f"(import + open + first read) median {statistics.median(fresh):.1f} ms")
+
+        # --- random reads ---
+        ids = [rng.randrange(args.docs) for _ in range(args.reads)]
+        for p in (reader.docs_path, reader.index_path): evict(p)
+        cold = timed_reads(reader.text, ids)
+        warm = timed_reads(reader.text, ids)
+        positions = reader.positions(ids).tolist()
+        views = timed_reads(reader.view, positions)
+        t0 = time.perf_counter()
+        for i in range(0, len(ids), 1000): reader.texts(ids[i:i + 1000])
+        t_batch = (time.perf_counter() - t0) / len(ids)
+        print(f"{len(ids):,} random text(id), first touch after eviction: {percentiles(cold)}")
+        print(f"same ids again, page cache warm:            {percentiles(warm)}")
+        print(f"same ids as view(pos), zero-copy:           {percentiles(views)}")
+        print(f"texts(1000 ids) batches: {t_batch * 1e6:.1f} us/doc;  meta(id) e.g. {reader.meta(ids[0])}")
+        print(f"reader RSS growth after {args.reads:,} random reads: {rss_mb() - rss_before:.0f} MB "
+              f"(mapped pages, shared with every other reader)")
+
+        # --- JSONL comparison ---
+        jsonl = os.path.join(tmp, "corpus.jsonl")
+        n_json = min(args.jsonl, args.docs)
+        with open(jsonl, "w", encoding="utf-8") as f:
+            for i in range(n_json):
+                f.write(json.dumps({"text": f"{jds[i % len(jds)][0]}\nRef {i}", "cluster": jds[i % len(jds)][1]}) + "\n")
+        t0 = time.perf_counter()
+        with open(jsonl, encoding="utf-8") as f:
+            loaded = [json.loads(line) for line in f]
+        t_json = time.perf_counter() - t0
+        print(f"JSONL alternative: loading {n_json:,} docs into memory took {t_json * 1000:.0f} ms "
+              f"(grows linearly with the corpus; {len(loaded):,} dicts held per worker)")
+        del loaded
+
+        # --- delete + compact ---
+        doomed = sorted(rng.sample(range(args.docs), args.docs // 10))
+        doomed_set = set(doomed)
+        survivor = next(i for i in ids if i not in doomed_set)
+        with CorpusStore(path, writable=True) as store:
+            t0 = time.perf_counter()
+            store.delete(doomed)
+            t_delete = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            kept, removed, freed = store.compact()
+            t_compact = time.perf_counter() - t0
+        # The old generation's files are unlinked, but a reader that hasn't refreshed still has them mapped
+        before = reader.text(survivor)
+        reader.refresh()
+        print(f"delete {len(doomed):,} ids: {t_delete:.2f}s;  compact: kept {kept:,}, removed {removed:,}, "
+              f"freed {freed / 1e6:.0f} MB in {t_compact:.1f}s")
+        print(f"unrefreshed reader still served doc {survivor} from the old generation; after refresh "
+              f"(generation {reader.gen}) it reads back identical: {reader.text(survivor) == before}")
+
+if __name__ == "__main__":
+    main()
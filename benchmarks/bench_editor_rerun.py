@@ -0,0 +1,67 @@
+# bench_editor_rerun.py
+# Time per keystroke-equivalent edit in the Smart Editor, driven headlessly with AppTest: each edit
+# appends a few characters to the Experience text area and runs the resulting rerun, after a login,
+# a PDF upload, a JD and a scan. Also reports which panels the edit's rerun repainted: after a
+# fragment-scoped rerun AppTest's element tree only holds the fragments that ran, so an untimed full
+# rerun follows each edit to bring the editor back into the tree.
+# Usage: python benchmarks/bench_editor_rerun.py [--edits 30] [--pages 4] [--app path/to/dashboard.py]
+#   Compare against an older dashboard by copying it next to dashboard.py (it imports its siblings):
+#   git show <rev>:src/resume_tool/dashboard.py > src/resume_tool/dashboard_old.py
+import os
+import sys
+import time
+import argparse
+import statistics
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SRC)
+
+from bench_upload import make_pdf
+
+JD = "Hiring a backend engineer: python, sql, docker, kubernetes, aws and ci/cd pipelines."
+PANELS = {"sidebar": "Command Center", "header": "Welcome back", "pathfinder": "Industry Compatibility",
+          "audit": "ATS Intelligence", "editor": "Workspace", "preview": "Live Preview"}
+
+def _button(at, label):
+    for b in at.button:
+        if label in b.label: return b
+    raise LookupError(f"button {label!r} not rendered")
+
+def repainted(at):
+    shown = " ".join(str(e.value) for kind in (at.title, at.markdown, at.subheader) for e in kind)
+    return [name for name, marker in PANELS.items() if marker in shown]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edits", type=int, default=30)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--app", default=os.path.join(SRC, "dashboard.py"))
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.abspath(args.app), default_timeout=300)
+    at.run()
+    at.text_input[0].input("admin123"); _button(at, "Sign In").click(); at.run()
+    at.sidebar.get("file_uploader")[0].upload("resume.pdf", make_pdf(args.pages), "application/pdf"); at.run()
+    at.sidebar.text_area[0].input(JD); at.run()
+    _button(at, "Run Scan").click(); at.run()
+
+    times = []
+    for i in range(args.edits):
+        box = at.text_area(key="exp_input")
+        box.input(box.value + f" k{i}")
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+        if at.exception: raise RuntimeError(at.exception[0].value)
+        panels, preview = repainted(at), " ".join(str(e.value) for e in at.markdown)
+        at.run()
+    print(f"{os.path.basename(args.app)}: {args.edits} edits to a {args.pages}-page resume")
+    print(f"ms per edit: median {statistics.median(times) * 1000:.1f}  p95 {sorted(times)[int(len(times) * 0.95) - 1] * 1000:.1f}  "
+          f"min {min(times) * 1000:.1f}")
+    print(f"panels repainted by an edit: {', '.join(panels)}")
+    print(f"last edit visible in the preview: {f'k{args.edits - 1}' in preview}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# bench_history.py
+# Per-user history queries on a pre-migration portfolio.db (free-form created_at strings, no user_id
+# indexes) vs. the same rows after migrations.upgrade: query plans and latency at 10k users.
+# Usage: python benchmarks/bench_history.py [--users 10000] [--versions 5] [--projects 3] [--lookups 500]
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import statistics
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+from sqlalchemy import create_engine
+
+import migrations
+
+# The tables as the baseline models created them
+LEGACY_DDL = """
+CREATE TABLE users (id INTEGER NOT NULL, username VARCHAR, password_hash VARCHAR, saved_name VARCHAR,
+    saved_email VARCHAR, saved_phone VARCHAR, saved_linkedin VARCHAR, saved_summary TEXT, saved_experience TEXT,
+    saved_skills TEXT, saved_references TEXT, saved_role VARCHAR, PRIMARY KEY (id));
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+CREATE INDEX ix_users_id ON users (id);
+CREATE TABLE portfolio_projects (id INTEGER NOT NULL, user_id INTEGER, title VARCHAR, industry VARCHAR,
+    situation TEXT, task TEXT, action TEXT, result TEXT, evidence_url VARCHAR, PRIMARY KEY (id),
+    FOREIGN KEY(user_id) REFERENCES users (id));
+CREATE INDEX ix_portfolio_projects_id ON portfolio_projects (id);
+CREATE INDEX ix_portfolio_projects_title ON portfolio_projects (title);
+CREATE TABLE saved_resumes (id INTEGER NOT NULL, user_id INTEGER, version_name VARCHAR, created_at VARCHAR,
+    data_dump TEXT, PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES users (id));
+CREATE INDEX ix_saved_resumes_id ON saved_resumes (id);
+"""
+# Formats a free-form String column ends up holding
+LEGACY_STAMPS = ["%Y-%m-%d %H:%M", "%d/%m/%Y", "%b %d, %Y", "%Y-%m-%dT%H:%M:%S"]
+
+QUERIES = {
+    "latest version": "SELECT id, version_name, created_at FROM saved_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1",
+    "version history": "SELECT id, version_name, created_at FROM saved_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 20",
+    "projects": "SELECT id, title FROM portfolio_projects WHERE user_id = ?",
+}
+
+def populate(path, users, versions, projects, rng):
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_DDL)
+    start = datetime(2024, 1, 1)
+    filler = "x" * 1500  # data_dump / STAR text weight, so a table scan costs what it would in production
+    rows_v, rows_p = [], []
+    for uid in range(1, users + 1):
+        for v in range(versions):
+            stamp = (start + timedelta(minutes=rng.randint(0, 900_000))).strftime(rng.choice(LEGACY_STAMPS))
+            rows_v.append((uid, f"Version {v + 1}", stamp, filler))
+        rows_p += [(uid, f"Project {p}", "Tech", filler, "", "", "") for p in range(projects)]
+    rows_v = rng.sample(rows_v, len(rows_v))  # versions arrive interleaved across users
+    conn.executemany("INSERT INTO users (id, username) VALUES (?, ?)", [(u, f"user{u}") for u in range(1, users + 1)])
+    conn.executemany("INSERT INTO saved_resumes (user_id, version_name, created_at, data_dump) VALUES (?, ?, ?, ?)", rows_v)
+    conn.executemany("INSERT INTO portfolio_projects (user_id, title, industry, situation, task, action, result) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?)", rows_p)
+    conn.commit()
+    conn.close()
+
+def python_latest(conn, user_id):
+    """What a free-form String forced: fetch every version, parse the stamps, sort in Python."""
+    rows = conn.execute("SELECT id, version_name, created_at FROM saved_resumes WHERE user_id = ?", (user_id,)).fetchall()
+    return max(rows, key=lambda r: migrations.parse_timestamp(r[2]) or datetime.min, default=None)
+
+def measure(path, user_ids, label):
+    conn = sqlite3.connect(path)
+    print(f"\n{label}")
+    for name, sql in QUERIES.items():
+        plan = "; ".join(r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}", (1,)))
+        times = []
+        for uid in user_ids:
+            t0 = time.perf_counter(); conn.execute(sql, (uid,)).fetchall(); times.append(time.perf_counter() - t0)
+        print(f"  {name:16s} median {statistics.median(times) * 1000:7.3f} ms  p95 {_p95(times) * 1000:7.3f} ms   plan: {plan}")
+    if label.startswith("before"):
+        times = []
+        for uid in user_ids:
+            t0 = time.perf_counter(); python_latest(conn, uid); times.append(time.perf_counter() - t0)
+        print(f"  {'latest (Python)':16s} median {statistics.median(times) * 1000:7.3f} ms  p95 {_p95(times) * 1000:7.3f} ms   "
+              f"(SQL ORDER BY on mixed-format strings is wrong, so this is the correct pre-migration answer)")
+    conn.close()
+
+def _p95(values):
+    return sorted(values)[int(len(values) * 0.95)]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--versions", type=int, default=5)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "portfolio.db")
+        t0 = time.perf_counter()
+        populate(path, args.users, args.versions, args.projects, rng)
+        print(f"{args.users} users, {args.users * args.versions} versions, {args.users * args.projects} projects "
+              f"({os.path.getsize(path) / 1e6:.0f} MB) built in {time.perf_counter() - t0:.1f}s")
+        user_ids = rng.sample(range(1, args.users + 1), min(args.lookups, args.users))
+
+        measure(path, user_ids, "before (legacy schema)")
+        engine = create_engine(f"sqlite:///{path}")
+        t0 = time.perf_counter()
+        applied = migrations.upgrade(engine)
+        print(f"\nmigrations.upgrade applied {applied} in {time.perf_counter() - t0:.2f}s")
+        engine.dispose()
+        measure(path, user_ids, "after (typed created_at + indexes)")
+
+if __name__ == "__main__":
+    main()
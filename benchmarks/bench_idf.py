@@ -0,0 +1,55 @@
+# bench_idf.py
+# Load time and lookup cost of the memory-mapped IDF weights vs. a JSON dict of the same data.
+# Usage: python benchmarks/bench_idf.py [n_docs] [n_terms]
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+from keyword_weights import build_from_token_sets, KeywordWeights
+
+def main():
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    n_terms = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    rng = random.Random(11)
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    vocab = sorted({"".join(rng.choice(alphabet) for _ in range(rng.randint(3, 14))) for _ in range(n_terms)})
+    # Zipf-ish usage so the DF spread looks like real postings
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    docs = [set(rng.choices(vocab, weights=weights, k=120)) for _ in range(n_docs)]
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        t0 = time.perf_counter(); build_from_token_sets(docs, out_dir); t_build = time.perf_counter() - t0
+
+        # Baseline: the same table as a JSON dict, parsed into memory on load
+        kw = KeywordWeights(out_dir)
+        json_path = os.path.join(out_dir, "idf.json")
+        with open(json_path, "w") as f:
+            json.dump({t.decode(): float(w) for t, w in zip(kw.vocab, kw.idf)}, f)
+        del kw
+
+        t0 = time.perf_counter(); table = json.load(open(json_path)); t_json = time.perf_counter() - t0
+        t0 = time.perf_counter(); kw = KeywordWeights(out_dir); t_mmap = time.perf_counter() - t0
+
+        probes = rng.sample(vocab, 1000) + ["zzzzunseen"] * 50
+        t0 = time.perf_counter()
+        for t in probes: kw.weight(t)
+        t_single = (time.perf_counter() - t0) / len(probes)
+        t0 = time.perf_counter(); kw.weights(probes); t_batch = (time.perf_counter() - t0) / len(probes)
+        t0 = time.perf_counter()
+        for _ in range(100): kw.rank(probes[:40])
+        t_rank = (time.perf_counter() - t0) / 100
+
+        print(f"corpus: {n_docs} docs, {len(table)} distinct terms (build {t_build:.2f}s)")
+        print(f"load  json dict:   {t_json * 1000:8.2f} ms")
+        print(f"load  mmap arrays: {t_mmap * 1000:8.2f} ms")
+        print(f"lookup single:     {t_single * 1e6:8.2f} us/term")
+        print(f"lookup batch:      {t_batch * 1e6:8.2f} us/term")
+        print(f"rank 40 gaps:      {t_rank * 1e6:8.2f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_nlp_executor.py
+# N session threads tokenizing a popularity-skewed mix of JDs: direct get_tokens calls vs. the
+# shared NLPExecutor, which coalesces identical in-flight texts.
+# Usage: python benchmarks/bench_nlp_executor.py [--threads 16] [--requests 40] [--distinct 20] [--mode auto]
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import make_corpus
+from ats_auditor import clean_text, get_tokens, set_tokenizer_mode
+from nlp_executor import NLPExecutor
+
+def workload(threads, requests, distinct, seed=3):
+    """Per-thread request lists; JD popularity follows a Zipf-like curve, as on a job board."""
+    jds = [r["jd"] for r in make_corpus(distinct, "large", seed)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    rng = random.Random(seed)
+    return [rng.choices(jds, weights, k=requests) for _ in range(threads)]
+
+def drive(per_thread, call):
+    start = threading.Barrier(len(per_thread))
+    def worker(texts):
+        start.wait()
+        for t in texts: call(t)
+    pool = [threading.Thread(target=worker, args=(texts,)) for texts in per_thread]
+    t0 = time.perf_counter()
+    for th in pool: th.start()
+    for th in pool: th.join()
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=40, help="per thread")
+    parser.add_argument("--distinct", type=int, default=20)
+    parser.add_argument("--mode", choices=["auto", "spacy", "nltk", "fast"], default="auto")
+    args = parser.parse_args()
+    set_tokenizer_mode(args.mode)
+
+    per_thread = workload(args.threads, args.requests, args.distinct)
+    total = args.threads * args.requests
+    get_tokens(clean_text(per_thread[0][0]))  # load the model outside the timings
+
+    t_direct = drive(per_thread, lambda t: get_tokens(clean_text(t)))
+    executor = NLPExecutor()
+    t_exec = drive(per_thread, executor.tokens)
+    s = executor.stats()
+    executor.shutdown()
+
+    print(f"{args.threads} threads x {args.requests} requests over {args.distinct} distinct JDs (mode {args.mode})")
+    print(f"direct get_tokens:  {t_direct:7.2f}s  {total / t_direct:8.0f} req/s  ({total} tokenizations)")
+    print(f"NLPExecutor:        {t_exec:7.2f}s  {total / t_exec:8.0f} req/s  ({s['started']} tokenizations, "
+          f"{s['coalesced']} coalesced = {s['coalesced'] / total:.0%})")
+    print(f"queue wait: mean {s['queue_wait_mean_ms']:.2f} ms  max {s['queue_wait_max_ms']:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# bench_phrases.py
+# Cost of the phrase stage next to the single-word token path, as the phrase list grows from the
+# cluster keywords to tens of thousands of entries, plus how many cluster phrases each path keeps intact.
+# Usage: python benchmarks/bench_phrases.py [n_docs] [--mode auto|spacy|nltk|fast]
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import make_corpus
+from ats_auditor import clean_text, get_tokens, set_tokenizer_mode
+from phrase_extractor import PhraseExtractor, cluster_phrases, get_nlp
+
+def synthetic_phrases(n, rng):
+    """Filler phrases so the trie holds n entries; most never occur, like a big mined term list."""
+    syllables = ["ka", "lo", "mi", "ne", "ra", "tu", "vi", "zo", "pe", "si", "da", "fu"]
+    word = lambda: "".join(rng.choices(syllables, k=rng.randint(2, 4)))
+    return [" ".join(word() for _ in range(rng.randint(2, 3))) for _ in range(n)]
+
+def timed_pass(fn, texts):
+    t0 = time.perf_counter()
+    out = [fn(t) for t in texts]
+    return out, (time.perf_counter() - t0) / len(texts) * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("n", nargs="?", type=int, default=400)
+    parser.add_argument("--mode", choices=["auto", "spacy", "nltk", "fast"], default="auto")
+    args = parser.parse_args()
+    set_tokenizer_mode(args.mode)
+
+    records = make_corpus(args.n, "medium")
+    texts = [r["resume"] for r in records] + [r["jd"] for r in records]
+    get_tokens(clean_text(texts[0]))
+
+    tokens, t_tokens = timed_pass(lambda t: get_tokens(clean_text(t)), texts)
+    print(f"get_tokens (mode {args.mode}): {t_tokens:7.3f} ms/doc")
+
+    base = cluster_phrases()
+    rng = random.Random(1)
+    for n_phrases in (len(base), 10_000, 50_000):
+        phrases = base + synthetic_phrases(n_phrases - len(base), rng)
+        t0 = time.perf_counter()
+        extractor = PhraseExtractor(phrases, noun_chunks=False)
+        t_build = time.perf_counter() - t0
+        found, t_match = timed_pass(extractor.extract, texts)
+        print(f"phrases {extractor.size:6d}: build {t_build * 1000:7.1f} ms, match {t_match:6.3f} ms/doc "
+              f"(+{t_match / t_tokens:.0%} on top of get_tokens)")
+
+    chunker = PhraseExtractor(base)
+    _, t_chunks = timed_pass(chunker.extract, texts)
+    note = "" if get_nlp() else " (no spaCy model: chunks disabled, known phrases only)"
+    print(f"cluster phrases + noun chunks: {t_chunks:7.3f} ms/doc{note}")
+
+    # Cluster phrases present in the text: kept as one keyword vs. only as loose words
+    present = kept_words = kept_phrases = 0
+    for text, toks, phr in zip(texts, tokens, found):
+        cleaned = f" {clean_text(text)} "
+        for p in base:
+            if f" {p} " not in cleaned: continue
+            present += 1
+            kept_phrases += p in phr
+            kept_words += all(w in toks for w in p.split())
+    print(f"cluster phrase occurrences: {present}; kept intact by the phrase stage: {kept_phrases}; "
+          f"all words survive get_tokens (as loose words only): {kept_words}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# bench_pipeline.py
+# End-to-end time to build application packs for a batch of postings: the manual sequential flow
+# (get_analysis_data, then generate_cover_letter, then simulate_interview, one posting at a time) vs.
+# application_pipeline at several concurrency limits. Model calls are simulated with a fixed latency
+# (no API key or network needed) so only the orchestration differs; the question bank is emptied before
+# each pipeline run, so every pack still asks the model for its questions.
+# Usage: python benchmarks/bench_pipeline.py [--jds 100] [--top 10] [--letter-s 2.0] [--questions-s 1.2]
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from corpus import make_corpus
+from ats_auditor import get_analysis_data
+from database import Base
+from models import ApplicationPack, InterviewQuestion, QuestionKeyword
+from match_engine import IncrementalMatcher
+import application_pipeline
+
+class SimulatedAI:
+    """Same call signatures as AIService; each call blocks for a fixed time, like a model round trip."""
+    def __init__(self, letter_s, questions_s):
+        self.letter_s, self.questions_s = letter_s, questions_s
+
+    def generate_cover_letter(self, resume_text, job_description):
+        time.sleep(self.letter_s)
+        return "Dear Hiring Manager, ..."
+
+    def is_configured(self):
+        return True
+
+    def simulate_interview(self, job_description, count=3):
+        time.sleep(self.questions_s)
+        return ["Tell me about a time you led a migration.", "How do you prioritise?", "Why this role?"]
+
+def sequential(ai, resume, jds, top_n, Session):
+    scored = sorted(((get_analysis_data(resume, jd)["match_score"], i) for i, jd in enumerate(jds)), reverse=True)
+    with Session() as db:
+        for score, i in scored[:top_n]:
+            letter = ai.generate_cover_letter(resume, jds[i])
+            questions = ai.simulate_interview(jds[i])
+            db.add(ApplicationPack(jd_text=jds[i], match_score=float(score), cover_letter=letter,
+                                   interview_questions=str(questions), status="ready"))
+            db.commit()
+
+def empty_bank(Session):
+    with Session() as db:
+        db.query(QuestionKeyword).delete()
+        db.query(InterviewQuestion).delete()
+        db.commit()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jds", type=int, default=100)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--letter-s", type=float, default=2.0)
+    parser.add_argument("--questions-s", type=float, default=1.2)
+    args = parser.parse_args()
+
+    records = make_corpus(args.jds, "medium", seed=11)
+    resume, jds = records[0]["resume"], [r["jd"] for r in records]
+    ai = SimulatedAI(args.letter_s, args.questions_s)
+    get_analysis_data(resume, jds[0])  # warm the tokenizer outside the timings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        print(f"{args.jds} postings, packs for the top {args.top}; simulated model calls "
+              f"{args.letter_s}s (cover letter) + {args.questions_s}s (questions)")
+
+        t0 = time.perf_counter()
+        sequential(ai, resume, jds, args.top, Session)
+        t_seq = time.perf_counter() - t0
+        print(f"sequential by hand:          {t_seq:7.2f}s")
+
+        for concurrency in (1, 4, args.top):
+            empty_bank(Session)
+            pipeline = application_pipeline.ApplicationPipeline(ai, Session, top_n=args.top, concurrency=concurrency,
+                                                                matcher=IncrementalMatcher())
+            packs = application_pipeline.asyncio.run(pipeline.run(resume, jds))
+            ready = sum(p["status"] == "ready" for p in packs)
+            print(f"pipeline, concurrency {concurrency:3d}: {pipeline.timings['total']:7.2f}s  "
+                  f"(scoring {pipeline.timings['score']:.2f}s, {ready} packs ready) -> {t_seq / pipeline.timings['total']:.1f}x")
+
+        threshold = sorted(p["match_score"] for p in packs)[-args.top]
+        empty_bank(Session)
+        pipeline = application_pipeline.ApplicationPipeline(ai, Session, top_n=None, min_score=threshold,
+                                                            concurrency=args.top, matcher=IncrementalMatcher())
+        application_pipeline.asyncio.run(pipeline.run(resume, jds))
+        print(f"streaming (min_score {threshold:.1f}): {pipeline.timings['total']:7.2f}s  "
+              f"(model calls start while the batch is still being scored)")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
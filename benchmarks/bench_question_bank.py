@@ -0,0 +1,89 @@
+# bench_question_bank.py
+# Hit rate and latency of question_bank.QuestionBank on unseen JDs once it has been filled from past
+# model responses, against calling the model for every JD. The model is simulated: it writes questions
+# from the JD's own keywords and is not actually waited on; its latency is the --model-s assumption.
+# Usage: python benchmarks/bench_question_bank.py [--history 400] [--requests 200] [--model-s 2.5]
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from corpus import make_corpus
+from ats_auditor import extract_keywords
+from database import Base
+from models import InterviewQuestion
+from question_bank import QuestionBank
+
+TEMPLATES = ["Walk me through a project where you relied on {a}. What would you change?",
+             "How do you balance {a} against {b} when deadlines are tight?",
+             "Tell me about a time {a} went wrong. How did you recover?",
+             "What metrics tell you that your {a} work is succeeding?",
+             "How would you introduce {a} to a team that has never used it?"]
+
+class SimulatedAI:
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    def is_configured(self):
+        return True
+
+    def simulate_interview(self, job_description, count=3):
+        self.calls += 1
+        words = sorted(k for k in extract_keywords(job_description) if len(k) > 3) or ["teamwork"]
+        return [self.rng.choice(TEMPLATES).format(a=self.rng.choice(words), b=self.rng.choice(words)) for _ in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, default=400, help="past JDs whose model responses fill the bank")
+    parser.add_argument("--requests", type=int, default=200, help="new JDs served afterwards")
+    parser.add_argument("--model-s", type=float, default=2.5, help="assumed model round trip")
+    args = parser.parse_args()
+
+    history = [r["jd"] for r in make_corpus(args.history, "medium", seed=21)]
+    fresh = [r["jd"] for r in make_corpus(args.requests, "medium", seed=22)]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        ai = SimulatedAI()
+        bank = QuestionBank(Session, ai)
+
+        t0 = time.perf_counter()
+        added = sum(bank.add(jd, ai.simulate_interview(jd, 3)) for jd in history)
+        print(f"bank filled from {args.history} past responses: {added} questions in {time.perf_counter() - t0:.1f}s")
+
+        ai.calls = 0
+        bank.stats.update(requests=0, bank_hits=0, model_calls=0, bank_ms=0.0, model_ms=0.0)
+        latencies, served = [], []
+        for jd in fresh:
+            t0 = time.perf_counter()
+            result = bank.get_questions(jd, 3)
+            if result["source"] == "bank":
+                latencies.append(time.perf_counter() - t0)
+                served += [(jd.split(" Specialist")[0], q) for q in result["questions"]]
+        s = bank.stats
+        hit_rate = s["bank_hits"] / s["requests"]
+        print(f"{s['requests']} new JDs: {s['bank_hits']} served from the bank ({hit_rate:.0%}), {s['model_calls']} model calls")
+        if latencies:
+            print(f"bank serve latency: median {statistics.median(latencies) * 1000:.1f} ms, "
+                  f"max {max(latencies) * 1000:.1f} ms (tokenizing the JD included)")
+        with Session() as db:
+            cluster_of = dict(db.execute(select(InterviewQuestion.question, InterviewQuestion.cluster)).all())
+        on_topic = sum(cluster_of.get(q) == target for target, q in served)
+        print(f"served questions first asked for a JD of the same cluster: {on_topic}/{len(served)}")
+        saved = s["bank_hits"] * args.model_s - sum(latencies)
+        print(f"model time avoided at {args.model_s}s/call: {saved:.0f}s "
+              f"({saved / s['requests']:.2f}s per request on average)")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
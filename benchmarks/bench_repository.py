@@ -0,0 +1,119 @@
+# bench_repository.py
+# Typical list screens read through plain ORM access (lazy relationships, full rows, OFFSET paging)
+# vs. repository.py: SQL statements issued, bytes of column data loaded into Python, and latency.
+# Usage: python benchmarks/bench_repository.py [--users 10000] [--versions 5] [--projects 3]
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event, insert, select, inspect
+from sqlalchemy.orm import sessionmaker
+
+from corpus import make_resume
+from career_data import CAREER_CLUSTERS
+from database import Base
+from models import User, PortfolioProject, SavedResume
+import migrations
+import repository
+
+def populate(engine, users, versions, projects, rng):
+    clusters = list(CAREER_CLUSTERS)
+    draft = make_resume(rng, clusters[0], 800)
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": u, "username": f"user{u}", "saved_name": draft["name"],
+                                     "saved_summary": draft["summary"], "saved_experience": draft["experience"],
+                                     "saved_skills": draft["skills"], "saved_references": draft.get("references", "")}
+                                    for u in range(1, users + 1)])
+        dump = str(make_resume(rng, clusters[1], 800))
+        conn.execute(insert(SavedResume), [{"user_id": u, "version_name": f"Version {v}", "data_dump": dump,
+                                            "created_at": start + timedelta(hours=rng.randint(0, 8000))}
+                                           for u in range(1, users + 1) for v in range(versions)])
+        star = " ".join(["delivered"] * 150)
+        conn.execute(insert(PortfolioProject), [{"user_id": u, "title": f"Project {p}", "industry": "Tech", "situation": star,
+                                                 "task": star, "action": star, "result": star}
+                                                for u in range(1, users + 1) for p in range(projects)])
+
+class Meter:
+    """Counts statements on the engine and sums the size of every attribute value the ORM loads."""
+    def __init__(self, engine):
+        self.queries = self.loaded = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+        event.listen(Base, "load", self._load, propagate=True)
+        event.listen(Base, "refresh", self._refresh, propagate=True)
+
+    def _count(self, *args):
+        self.queries += 1
+
+    def _load(self, target, context):
+        self.loaded += sum(_size(v) for v in inspect(target).dict.values())
+
+    def _refresh(self, target, context, attrs):
+        self.loaded += sum(_size(inspect(target).dict.get(a)) for a in attrs or ())
+
+    def run(self, db, screen):
+        db.expunge_all()
+        self.queries = self.loaded = 0
+        t0 = time.perf_counter()
+        result = screen(db)
+        elapsed = time.perf_counter() - t0
+        # Rows the ORM didn't map (the one-query admin list) count at face value
+        extra = sum(_size(v) for row in result if isinstance(row, dict) for v in row.values())
+        return self.queries, self.loaded + extra, elapsed
+
+def _size(value):
+    return len(value) if isinstance(value, (str, bytes)) else (8 if isinstance(value, (int, float, datetime)) else 0)
+
+# --- SCREENS: (name, naive, repository) ---
+def screens(user_id, page_no):
+    def naive_admin(db):
+        users = db.scalars(select(User).order_by(User.id).limit(50)).all()
+        return [{"id": u.id, "username": u.username, "projects": len(u.projects), "versions": len(u.resumes)} for u in users]
+    def naive_history(db):
+        user = db.get(User, user_id)
+        return sorted(user.resumes, key=lambda r: r.created_at, reverse=True)[:20]
+    def naive_portfolio(db):
+        return [(p.id, p.title) for p in db.get(User, user_id).projects]
+    def offset_deep(db):
+        return db.scalars(select(User).order_by(User.id).offset(page_no * 50).limit(50)).all()
+    def keyset_deep(db):
+        return repository.list_users(db, after=page_no * 50, limit=50)[0]  # cursor = last id of the previous page
+    return [
+        ("admin user list (50 + counts)", naive_admin, lambda db: repository.list_users_with_counts(db, limit=50)[0]),
+        ("version history (20 newest)", naive_history, lambda db: repository.list_versions(db, user_id)[0]),
+        ("portfolio project titles", naive_portfolio, lambda db: repository.list_projects(db, user_id)[0]),
+        (f"user list page {page_no}", offset_deep, keyset_deep),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--versions", type=int, default=5)
+    parser.add_argument("--projects", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        migrations.upgrade(engine)
+        t0 = time.perf_counter()
+        populate(engine, args.users, args.versions, args.projects, random.Random(5))
+        print(f"{args.users} users x {args.versions} versions x {args.projects} projects built in {time.perf_counter() - t0:.1f}s\n")
+        meter = Meter(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            print(f"{'screen':32s} {'plain ORM':>34s}   {'repository':>34s}")
+            for name, naive, repo in screens(args.users // 2, args.users // 50 - 1):
+                for fn in (naive, repo): meter.run(db, fn)  # warm the page cache for both
+                (qn, bn, tn), (qr, br, tr) = meter.run(db, naive), meter.run(db, repo)
+                print(f"{name:32s} {qn:5d} q {bn / 1e3:9.1f} KB {tn * 1000:8.2f} ms   {qr:5d} q {br / 1e3:9.1f} KB {tr * 1000:8.2f} ms")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
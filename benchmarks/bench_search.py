@@ -0,0 +1,91 @@
+# bench_search.py
+# FTS5 search (search_index.py) vs. loading a user's projects and versions into Python and scanning.
+# Builds a throwaway SQLite database: one heavy user plus background users, STAR text and resume
+# versions generated from the synthetic corpus.
+# Usage: python benchmarks/bench_search.py [--projects 5000] [--versions 2000] [--other-users 20]
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select, insert
+from sqlalchemy.orm import sessionmaker
+
+from corpus import make_resume, _sentence
+from career_data import CAREER_CLUSTERS
+from expert_tips import POWER_VERBS
+from database import Base
+from models import User, PortfolioProject, SavedResume
+import search_index
+
+QUERIES = ["kubernetes migration", "patient care", "sponsorship activation", "risk management", "inventory",
+           "machine learning", "budget", "stakeholder roadmap", "ticket sales", "emr"]
+
+def populate(engine, heavy_projects, heavy_versions, other_users, rng):
+    clusters = list(CAREER_CLUSTERS)
+    def project(uid):
+        kws = CAREER_CLUSTERS[rng.choice(clusters)]["keywords"]
+        return {"user_id": uid, "title": f"{rng.choice(kws).title()} initiative", "industry": rng.choice(clusters),
+                "situation": _sentence(rng, kws, POWER_VERBS, 20), "task": _sentence(rng, kws, POWER_VERBS, 15),
+                "action": _sentence(rng, kws, POWER_VERBS, 30), "result": _sentence(rng, kws, POWER_VERBS, 15)}
+    def version(uid, i):
+        return {"user_id": uid, "version_name": f"Version {i}", "created_at": datetime(2026, 1, 1 + i % 28),
+                "data_dump": json.dumps(make_resume(rng, rng.choice(clusters), 300))}
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": u, "username": f"user{u}"} for u in range(1, other_users + 2)])
+        counts = {1: (heavy_projects, heavy_versions)}
+        counts.update({u: (heavy_projects // 10, heavy_versions // 10) for u in range(2, other_users + 2)})
+        for uid, (n_p, n_v) in counts.items():
+            conn.execute(insert(PortfolioProject), [project(uid) for _ in range(n_p)])
+            conn.execute(insert(SavedResume), [version(uid, i) for i in range(n_v)])
+
+def python_scan(db, user_id, query):
+    """The pre-FTS way: pull everything for the user and substring-match every word."""
+    words = query.lower().split()
+    hits = []
+    for p in db.scalars(select(PortfolioProject).where(PortfolioProject.user_id == user_id)):
+        blob = " ".join(filter(None, [p.title, p.industry, p.situation, p.task, p.action, p.result])).lower()
+        if all(w in blob for w in words): hits.append(p.id)
+    for r in db.scalars(select(SavedResume).where(SavedResume.user_id == user_id)):
+        data = json.loads(r.data_dump or "{}")
+        blob = " ".join(str(v) for v in data.values()).lower()
+        if all(w in blob for w in words): hits.append(r.id)
+    return hits
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--versions", type=int, default=2000)
+    parser.add_argument("--other-users", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        if not search_index.install(engine):
+            print("❌ This SQLite build has no FTS5."); return
+        t0 = time.perf_counter()
+        populate(engine, args.projects, args.versions, args.other_users, random.Random(4))
+        print(f"populated {args.projects} projects + {args.versions} versions for the user "
+              f"(+{args.other_users} lighter users) in {time.perf_counter() - t0:.1f}s, triggers included")
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            fts, scan = [], []
+            for q in QUERIES:
+                t0 = time.perf_counter(); search_index.search(db, 1, q, limit=20); fts.append(time.perf_counter() - t0)
+                t0 = time.perf_counter(); python_scan(db, 1, q); scan.append(time.perf_counter() - t0)
+                db.expunge_all()
+            print(f"FTS5 search (top 20, snippets): median {statistics.median(fts) * 1000:7.2f} ms  max {max(fts) * 1000:7.2f} ms")
+            print(f"Python load + scan:             median {statistics.median(scan) * 1000:7.2f} ms  max {max(scan) * 1000:7.2f} ms")
+            print(f"example: {search_index.search(db, 1, QUERIES[1], limit=1)}")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
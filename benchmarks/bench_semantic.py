@@ -0,0 +1,91 @@
+# bench_semantic.py
+# Accuracy and latency of the LSA scorer next to the keyword score, plus IVF recall vs. brute force.
+# Usage: python benchmarks/bench_semantic.py [pairs.jsonl]
+#   pairs.jsonl lines: {"resume": "...", "jd": "...", "label": 0 or 1}
+#   Without a file, a synthetic set is drawn from CAREER_CLUSTERS where matching pairs use
+#   *different* keywords of the same cluster (the synonym case keyword overlap can't see).
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+from career_data import CAREER_CLUSTERS
+from ats_auditor import clean_text, get_tokens, score_token_sets
+from semantic_matcher import build_model, SemanticModel
+
+FILLER = ["team", "delivered", "results", "daily", "support", "company", "growth", "reporting", "projects", "goals"]
+
+def synthetic_doc(rng, keywords):
+    words = rng.sample(FILLER, 5) + keywords
+    rng.shuffle(words)
+    return " ".join(words)
+
+def synthetic_data(rng, n_corpus=3000, n_pairs=600):
+    clusters = list(CAREER_CLUSTERS)
+    corpus = [synthetic_doc(rng, rng.sample(CAREER_CLUSTERS[c]["keywords"], 5)) for c in rng.choices(clusters, k=n_corpus)]
+    pairs = []
+    for _ in range(n_pairs):
+        c = rng.choice(clusters)
+        kws = CAREER_CLUSTERS[c]["keywords"][:]
+        rng.shuffle(kws)
+        jd = synthetic_doc(rng, kws[:4])
+        if rng.random() < 0.5:
+            pairs.append((synthetic_doc(rng, kws[4:8]), jd, 1))
+        else:
+            other = rng.choice([o for o in clusters if o != c])
+            pairs.append((synthetic_doc(rng, rng.sample(CAREER_CLUSTERS[other]["keywords"], 4)), jd, 0))
+    return corpus, pairs
+
+def auc(scores, labels):
+    """Probability a random matching pair outscores a random non-matching one."""
+    scores, labels = np.asarray(scores, dtype=float), np.asarray(labels)
+    pos, neg = scores[labels == 1], scores[labels == 0]
+    if not len(pos) or not len(neg): return float("nan")
+    return float(((pos[:, None] > neg[None, :]).sum() + 0.5 * (pos[:, None] == neg[None, :]).sum()) / (len(pos) * len(neg)))
+
+def best_accuracy(scores, labels):
+    scores, labels = np.asarray(scores, dtype=float), np.asarray(labels)
+    return max(float(((scores >= t) == labels).mean()) for t in np.unique(scores))
+
+def main():
+    rng = random.Random(5)
+    corpus, pairs = synthetic_data(rng)
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            pairs = [(d["resume"], d["jd"], int(d["label"])) for d in map(json.loads, f) if d]
+        corpus = [jd for _, jd, _ in pairs]
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        t0 = time.perf_counter(); build_model(corpus, model_dir); t_build = time.perf_counter() - t0
+        t0 = time.perf_counter(); model = SemanticModel(model_dir); t_load = time.perf_counter() - t0
+        labels = [l for _, _, l in pairs]
+
+        t0 = time.perf_counter()
+        kw_scores = [score_token_sets(get_tokens(clean_text(r)), get_tokens(clean_text(j)))["match_score"] for r, j, _ in pairs]
+        t_kw = (time.perf_counter() - t0) / len(pairs)
+        t0 = time.perf_counter()
+        lsa_scores = [model.similarity(r, j) for r, j, _ in pairs]
+        t_lsa = (time.perf_counter() - t0) / len(pairs)
+
+        print(f"corpus: {len(corpus)} docs (build {t_build:.2f}s, mmap load {t_load * 1000:.2f} ms); pairs: {len(pairs)}")
+        print(f"{'scorer':<10}{'AUC':>8}{'best acc':>10}{'ms/pair':>10}")
+        print(f"{'keyword':<10}{auc(kw_scores, labels):>8.3f}{best_accuracy(kw_scores, labels):>10.3f}{t_kw * 1000:>10.2f}")
+        print(f"{'lsa':<10}{auc(lsa_scores, labels):>8.3f}{best_accuracy(lsa_scores, labels):>10.3f}{t_lsa * 1000:>10.2f}")
+
+        # ANN: IVF probe vs. exact scan over every stored JD vector
+        queries = [r for r, _, _ in pairs[:200]]
+        q = model.embed(queries)
+        exact = np.argsort(-(np.asarray(model.doc_vectors) @ q.T), axis=0)[:10].T
+        t0 = time.perf_counter()
+        approx = [model.search(text, top_k=10) for text in queries]
+        t_ann = (time.perf_counter() - t0) / len(queries)
+        recall = np.mean([len({model.ids[i] for i in e} & {doc_id for doc_id, _ in a}) / 10 for e, a in zip(exact, approx)])
+        print(f"ivf search: {t_ann * 1000:.2f} ms/query, recall@10 {recall:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# bench_suite.py
+# Regression benchmarks for the hot paths, on the synthetic corpus from corpus.py.
+# Usage:
+#   python benchmarks/bench_suite.py run [--sizes small medium large] [--n 40] [--repeat 3] [--only get_tokens ...]
+#                                        [--tokenizer auto|spacy|nltk|fast] [-o results.json]
+#   python benchmarks/bench_suite.py compare <baseline.json> <current.json> [--threshold 0.15]
+# `compare` exits with status 1 when any benchmark's median got slower than the threshold allows.
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import statistics
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import SIZES, make_corpus
+
+# --- 1. BENCHMARKS ---
+# Each entry takes the corpus and returns (fn, args list): fn(*args) is timed once per record.
+def _bench_get_tokens(records):
+    from ats_auditor import clean_text, get_tokens
+    return get_tokens, [(clean_text(r["resume"]),) for r in records]
+
+def _bench_analysis(records):
+    from ats_auditor import get_analysis_data
+    return get_analysis_data, [(r["resume"], r["jd"]) for r in records]
+
+def _bench_audit(records):
+    from ats_auditor import perform_general_audit
+    return perform_general_audit, [(r["resume"],) for r in records]
+
+def _bench_parse_sections(records):
+    from resume_parser import parse_contact_info, parse_resume_sections
+    return lambda text: (parse_contact_info(text), parse_resume_sections(text)), [(r["resume"],) for r in records]
+
+def _bench_parse_dict(records):
+    from services.file_handlers import parse_resume_to_dict
+    return parse_resume_to_dict, [(r["resume"],) for r in records]
+
+def _bench_translate(records):
+    from expert_tips import INDUSTRY_TRANSLATORS, translate_text
+    industries = list(INDUSTRY_TRANSLATORS)
+    return translate_text, [(r["resume_data"]["experience"], industries[i % len(industries)]) for i, r in enumerate(records)]
+
+def _bench_pathfinder(records):
+    from career_data import rank_career_clusters
+    return rank_career_clusters, [(r["resume"],) for r in records]
+
+def _bench_pdf(records):
+    from resume_export import create_pdf
+    return create_pdf, [(r["resume_data"],) for r in records]
+
+def _bench_docx(records):
+    from resume_export import create_docx
+    return create_docx, [(r["resume_data"],) for r in records]
+
+BENCHMARKS = {
+    "get_tokens": _bench_get_tokens,
+    "get_analysis_data": _bench_analysis,
+    "perform_general_audit": _bench_audit,
+    "parse_resume_sections": _bench_parse_sections,
+    "parse_resume_to_dict": _bench_parse_dict,
+    "translate_text": _bench_translate,
+    "rank_career_clusters": _bench_pathfinder,
+    "create_pdf": _bench_pdf,
+    "create_docx": _bench_docx,
+}
+
+# --- 2. RUNNER ---
+def time_calls(fn, calls, repeat=3):
+    """Per-call latencies (seconds) over `repeat` passes, after one untimed warm-up call."""
+    fn(*calls[0])
+    samples = []
+    for _ in range(repeat):
+        for args in calls:
+            t0 = time.perf_counter()
+            fn(*args)
+            samples.append(time.perf_counter() - t0)
+    return samples
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "calls": len(ordered),
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000, 4),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "ops_per_s": round(len(ordered) / sum(ordered), 1) if sum(ordered) else None,
+    }
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    import ats_auditor
+    return {"python": platform.python_version(), "platform": platform.platform(), "commit": commit,
+            "spacy": ats_auditor.get_nlp() is not None, "tokenizer": ats_auditor.get_tokenizer_mode(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def run(sizes, n, repeat, only=None, seed=0):
+    results = {"env": environment(), "config": {"n": n, "repeat": repeat, "seed": seed}, "results": {}}
+    for size in sizes:
+        records = make_corpus(n, size, seed)
+        for name, setup in BENCHMARKS.items():
+            if only and name not in only: continue
+            key = f"{name}[{size}]"
+            try:
+                fn, calls = setup(records)
+                stats = summarize(time_calls(fn, calls, repeat))
+            except Exception as e:  # e.g. no spaCy model and no NLTK data: record it and keep going
+                reason = next((l.strip() for l in str(e).splitlines() if any(c.isalpha() for c in l)), "")
+                results["results"][key] = {"error": f"{type(e).__name__}: {reason}"}
+                print(f"{key:36} skipped ({results['results'][key]['error']})")
+                continue
+            results["results"][key] = stats
+            print(f"{key:36} median {stats['median_ms']:10.3f} ms   p95 {stats['p95_ms']:10.3f} ms")
+    return results
+
+# --- 3. REGRESSION CHECK ---
+def compare(baseline, current, threshold=0.15):
+    """(rows, regressions): rows are (name, base_ms, current_ms, ratio) for benchmarks present in both files."""
+    rows, regressions = [], []
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base or "median_ms" not in base or "median_ms" not in cur: continue
+        ratio = cur["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf")
+        rows.append((name, base["median_ms"], cur["median_ms"], ratio))
+        if ratio > 1 + threshold: regressions.append(name)
+    return rows, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resume tool benchmark suite")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_run = sub.add_parser("run")
+    p_run.add_argument("--sizes", nargs="+", choices=SIZES, default=["small", "medium"])
+    p_run.add_argument("--n", type=int, default=40, help="records per size")
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--only", nargs="+", choices=BENCHMARKS)
+    p_run.add_argument("--tokenizer", choices=["auto", "spacy", "nltk", "fast"], default=None)
+    p_run.add_argument("-o", "--out", default="bench_results.json")
+    p_cmp = sub.add_parser("compare")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown of the median, e.g. 0.15 = 15%%")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "run":
+        if args.tokenizer:
+            from ats_auditor import set_tokenizer_mode
+            set_tokenizer_mode(args.tokenizer)
+        results = run(args.sizes, args.n, args.repeat, args.only, args.seed)
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Saved {len(results['results'])} results to {args.out}")
+        return 0
+
+    with open(args.baseline) as f: baseline = json.load(f)
+    with open(args.current) as f: current = json.load(f)
+    rows, regressions = compare(baseline, current, args.threshold)
+    for name, base_ms, cur_ms, ratio in rows:
+        flag = "  ❌ REGRESSION" if name in regressions else ("  ✅ faster" if ratio < 1 - args.threshold else "")
+        print(f"{name:36} {base_ms:10.3f} -> {cur_ms:10.3f} ms  ({ratio:5.2f}x){flag}")
+    if (baseline["env"].get("spacy"), baseline["env"].get("tokenizer")) != (current["env"].get("spacy"), current["env"].get("tokenizer")):
+        print("⚠️ Tokenizer mode or spaCy availability differs between runs; tokenizer numbers aren't comparable.")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,75 @@
+# bench_token_ids.py
+# Memory per document and overlap throughput of interned int32 token arrays (token_ids.py)
+# against the set-of-str path, plus a parity check against score_token_sets.
+# Usage: python benchmarks/bench_token_ids.py [n_docs]
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+from corpus import make_jd, make_resume
+from career_data import CAREER_CLUSTERS
+from ats_auditor import clean_text, score_token_sets
+from resume_export import reconstruct_resume_text
+from token_ids import TokenCorpus, compare
+
+def keywords(text):
+    # Stand-in for get_tokens that needs no NLP model: same cleaning, words of 3+ characters.
+    return {w for w in clean_text(text).split() if len(w) > 2}
+
+def build_corpus(token_sets):
+    corpus = TokenCorpus()
+    for tokens in token_sets: corpus.add(tokens)
+    corpus.nbytes()  # packs the pending chunks, so only the final buffers stay allocated
+    return corpus
+
+def measure(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(11)
+    clusters = list(CAREER_CLUSTERS)
+    t0 = time.perf_counter()
+    texts = [make_jd(rng, rng.choice(clusters), rng.randint(60, 400)) for _ in range(n)]
+    print(f"generated {n} JDs in {time.perf_counter() - t0:.1f}s")
+
+    sets, set_bytes = measure(lambda: [keywords(t) for t in texts])
+    corpus, id_bytes = measure(lambda: build_corpus(sets))
+    avg_terms = sum(map(len, sets)) / n
+    print(f"avg keywords per doc: {avg_terms:.1f}  vocabulary: {len(corpus.vocab)} terms")
+    print(f"set[str]:   {set_bytes / n:8.0f} bytes/doc  ({set_bytes / 2 ** 20:7.1f} MB total)")
+    print(f"int32 ids:  {id_bytes / n:8.0f} bytes/doc  ({id_bytes / 2 ** 20:7.1f} MB total, vocabulary included)")
+
+    resume = keywords(reconstruct_resume_text(make_resume(rng, clusters[0], 800)))
+    r_ids = corpus.vocab.encode(resume, add=False)
+
+    t0 = time.perf_counter(); set_counts = [len(resume & s) for s in sets]; t_set = time.perf_counter() - t0
+    t0 = time.perf_counter(); id_counts = corpus.overlap_counts(r_ids); t_ids = time.perf_counter() - t0
+    assert list(id_counts) == set_counts
+    print(f"one resume vs all docs (overlap counts):")
+    print(f"  set intersection:  {n / t_set:12.0f} docs/s")
+    print(f"  int32 vectorized:  {n / t_ids:12.0f} docs/s  ({t_set / t_ids:.0f}x)")
+
+    sample = range(0, n, max(1, n // 500))
+    t0 = time.perf_counter(); slow = [score_token_sets(resume, sets[i]) for i in sample]; t_slow = time.perf_counter() - t0
+    t0 = time.perf_counter(); scores = corpus.match_scores(r_ids, len(resume)); t_fast = time.perf_counter() - t0
+    # Exact .x5 ties can round either way (float cosine vs. exact ratio), so allow one rounding step
+    mismatches = sum(1 for i, s in zip(sample, slow) if abs(s["match_score"] - scores[i]) > 0.1 + 1e-9)
+    full_ids = corpus.vocab.encode(resume)  # interns unseen resume terms so compare() sees the whole set
+    fast_lists = [compare(full_ids, corpus.doc(i), corpus.vocab) for i in sample]
+    list_mismatches = sum(1 for s, f in zip(slow, fast_lists)
+                          if s["common_keywords"] != f["common_keywords"] or s["missing_keywords"] != f["missing_keywords"])
+    print(f"full scoring: score_token_sets {len(slow) / t_slow:10.0f} docs/s   match_scores {n / t_fast:12.0f} docs/s")
+    print(f"parity on {len(slow)} docs: {mismatches} score mismatches, {list_mismatches} keyword-list mismatches")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench_tokenizer.py
+# Throughput of each available get_tokens mode, and how closely the fast regex mode agrees with
+# spaCy noun extraction (or with NLTK when no spaCy model is installed).
+# Usage: python benchmarks/bench_tokenizer.py [n_docs] [--size small|medium|large]
+import os
+import sys
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import SIZES, make_corpus
+import ats_auditor
+from ats_auditor import clean_text, get_tokens
+
+def available_modes():
+    modes = ["fast"]
+    if ats_auditor._nltk_resources(): modes.insert(0, "nltk")
+    if ats_auditor.get_nlp(): modes.insert(0, "spacy")
+    return modes
+
+def agreement(reference, candidate):
+    """Mean per-document precision / recall / Jaccard of candidate token sets against reference ones."""
+    p = r = j = 0.0
+    for ref, cand in zip(reference, candidate):
+        inter = len(ref & cand)
+        p += inter / len(cand) if cand else 1.0
+        r += inter / len(ref) if ref else 1.0
+        j += inter / len(ref | cand) if ref | cand else 1.0
+    n = len(reference)
+    return p / n, r / n, j / n
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("n", nargs="?", type=int, default=300)
+    parser.add_argument("--size", choices=SIZES, default="medium")
+    args = parser.parse_args()
+
+    records = make_corpus(args.n, args.size)
+    texts = [clean_text(r["resume"]) for r in records] + [clean_text(r["jd"]) for r in records]
+    words = sum(len(t.split()) for t in texts)
+
+    outputs = {}
+    for mode in available_modes():
+        get_tokens(texts[0], mode=mode)  # warm-up / model load
+        t0 = time.perf_counter()
+        outputs[mode] = [get_tokens(t, mode=mode) for t in texts]
+        elapsed = time.perf_counter() - t0
+        print(f"{mode:6} {len(texts) / elapsed:10.0f} docs/s  {words / elapsed / 1e6:6.2f} M words/s  "
+              f"avg {sum(map(len, outputs[mode])) / len(texts):6.1f} tokens/doc")
+
+    reference = next((m for m in ("spacy", "nltk") if m in outputs), None)
+    if reference is None:
+        print("No spaCy model or NLTK data installed; agreement needs one of them as the reference.")
+        return
+    precision, recall, jaccard = agreement(outputs[reference], outputs["fast"])
+    print(f"fast vs {reference}: precision {precision:.3f}  recall {recall:.3f}  jaccard {jaccard:.3f}")
+    disagreements = {}
+    for ref, cand in zip(outputs[reference], outputs["fast"]):
+        for t in cand - ref: disagreements[f"+{t}"] = disagreements.get(f"+{t}", 0) + 1
+        for t in ref - cand: disagreements[f"-{t}"] = disagreements.get(f"-{t}", 0) + 1
+    top = sorted(disagreements.items(), key=lambda kv: -kv[1])[:15]
+    print("most frequent disagreements (+ only fast, - only reference): " + ", ".join(f"{k} ({v})" for k, v in top))
+
+if __name__ == "__main__":
+    main()
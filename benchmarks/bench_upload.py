@@ -0,0 +1,54 @@
+# bench_upload.py
+# Rerun latency of the dashboard with a multi-page PDF uploaded, driven headlessly with AppTest.
+# Usage: python benchmarks/bench_upload.py [--pages 8] [--reruns 20] [--app path/to/dashboard.py]
+import os
+import sys
+import time
+import argparse
+import statistics
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool")
+sys.path.append(SRC)
+
+def make_pdf(pages):
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.set_font("Helvetica", "", 10)
+    for p in range(pages):
+        pdf.add_page()
+        if p == 0:
+            pdf.multi_cell(0, 5, "Jane Candidate\njane@mail.com | (555) 123-4567\nlinkedin.com/in/jane\n\nSummary\n"
+                                 "Operations lead with a decade of delivery experience.\n\nExperience", new_x="LMARGIN", new_y="NEXT")
+        for i in range(45):
+            pdf.multi_cell(0, 5, f"- Led initiative {p}.{i}: cut cycle time 18% across 4 regions, managing a $2M budget and 12 staff.", new_x="LMARGIN", new_y="NEXT")
+    pdf.multi_cell(0, 5, "Skills\nPython, SQL, Tableau, Stakeholder management\n\nEducation\nBS Industrial Engineering", new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--app", default=os.path.join(SRC, "dashboard.py"))
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+    from resume_parser import extract_pdf, parse_contact_info, parse_resume_sections
+
+    pdf_bytes = make_pdf(args.pages)
+    t0 = time.perf_counter()
+    text = extract_pdf(pdf_bytes); parse_contact_info(text); parse_resume_sections(text)
+    t_parse = time.perf_counter() - t0
+
+    at = AppTest.from_file(os.path.abspath(args.app), default_timeout=120)
+    at.run()
+    at.text_input[0].input("admin123"); at.button[0].click(); at.run()
+    at.sidebar.get("file_uploader")[0].upload("resume.pdf", pdf_bytes, "application/pdf")
+    at.run()
+    times = []
+    for _ in range(args.reruns):
+        t0 = time.perf_counter(); at.run(); times.append(time.perf_counter() - t0)
+    print(f"pdf: {args.pages} pages, {len(pdf_bytes) // 1024} KB; extract+parse alone {t_parse * 1000:.1f} ms")
+    print(f"rerun ms: median {statistics.median(times) * 1000:.1f}  min {min(times) * 1000:.1f}  max {max(times) * 1000:.1f}")
+
+if __name__ == "__main__":
+    main()
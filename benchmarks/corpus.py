@@ -0,0 +1,104 @@
+# corpus.py
+# Reproducible synthetic resumes and JDs for the benchmarks, drawn from the repo's own vocabulary
+# (CAREER_CLUSTERS keywords, INDUSTRY_TRANSLATORS source terms, POWER_VERBS / WEAK_WORDS).
+# Usage: python benchmarks/corpus.py export <out.jsonl> [--n 1000] [--size medium] [--seed 0]
+#   Each line: {"id", "cluster", "text" (the JD), "resume" (plain text), "resume_data" (editor dict)}
+#   The "text" field makes the file a valid corpus for keyword_weights / semantic_matcher builds.
+import os
+import sys
+import json
+import random
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool"))
+
+from career_data import CAREER_CLUSTERS
+from expert_tips import INDUSTRY_TRANSLATORS, POWER_VERBS, WEAK_WORDS
+from resume_export import reconstruct_resume_text
+
+# Approximate word counts for the resume body; JDs are a third of that.
+SIZES = {"small": 250, "medium": 800, "large": 2500}
+
+FILLER = ["team", "project", "customer", "quality", "process", "budget", "launch", "reporting", "results",
+          "operations", "data", "training", "growth", "support", "vendors", "schedule", "strategy", "metrics"]
+GENERIC_TERMS = sorted({term for mapping in INDUSTRY_TRANSLATORS.values() for term in mapping})
+FIRST_NAMES = ["Jane", "Omar", "Priya", "Luis", "Mei", "Sam", "Ava", "Kofi"]
+LAST_NAMES = ["Candidate", "Okafor", "Sharma", "Garcia", "Chen", "Novak", "Reyes", "Mensah"]
+
+def _sentence(rng, keywords, verbs, length):
+    words = [rng.choice(verbs)]
+    while len(words) < length:
+        pick = rng.random()
+        if pick < 0.25: words.append(rng.choice(keywords))
+        elif pick < 0.45: words.append(rng.choice(GENERIC_TERMS))
+        else: words.append(rng.choice(FILLER))
+    if rng.random() < 0.6: words.append(f"by {rng.randint(5, 60)}%")
+    return " ".join(words)
+
+def _bullets(rng, keywords, n_words, weak_ratio=0.2):
+    lines, count = [], 0
+    while count < n_words:
+        verbs = WEAK_WORDS if rng.random() < weak_ratio else POWER_VERBS
+        line = _sentence(rng, keywords, verbs, rng.randint(8, 18))
+        lines.append(f"• {line[0].upper()}{line[1:]}.")
+        count += len(line.split())
+    return "\n".join(lines)
+
+def make_resume(rng, cluster, words):
+    """Editor-shaped dict (the dashboard's resume_data) for one synthetic candidate."""
+    keywords = CAREER_CLUSTERS[cluster]["keywords"]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}@mail.com",
+        "phone": f"({rng.randint(200, 989)}) {rng.randint(200, 989)}-{rng.randint(1000, 9999)}",
+        "linkedin": f"linkedin.com/in/{first.lower()}{last.lower()}",
+        "summary": _sentence(rng, keywords, POWER_VERBS, 25).capitalize() + ".",
+        "skills": ", ".join(rng.sample(keywords, min(8, len(keywords)))),
+        "experience": _bullets(rng, keywords, int(words * 0.85)),
+        "education": f"BS {rng.choice(['Business', 'Computer Science', 'Nursing', 'Finance', 'Marketing'])}, State University",
+    }
+
+def make_jd(rng, cluster, words):
+    keywords = CAREER_CLUSTERS[cluster]["keywords"]
+    lines = [f"{cluster} Specialist", "", "Responsibilities:"]
+    lines += [f"- {_sentence(rng, keywords, POWER_VERBS, rng.randint(8, 14))}" for _ in range(max(1, words // 24))]
+    lines += ["", "Requirements:"]
+    lines += [f"- Experience with {k}" for k in rng.sample(keywords, min(6, len(keywords)))]
+    return "\n".join(lines)
+
+def make_corpus(n, size="medium", seed=0):
+    """n {"id", "cluster", "resume_data", "resume", "jd"} records; the same arguments give the same corpus."""
+    rng = random.Random(f"{seed}:{size}")
+    words = SIZES[size]
+    clusters = list(CAREER_CLUSTERS)
+    records = []
+    for i in range(n):
+        cluster = rng.choice(clusters)
+        data = make_resume(rng, cluster, words)
+        # Half the JDs target a different cluster, so scores spread across the whole range
+        jd_cluster = cluster if rng.random() < 0.5 else rng.choice(clusters)
+        records.append({"id": f"{size}-{i}", "cluster": cluster, "resume_data": data,
+                        "resume": reconstruct_resume_text(data), "jd": make_jd(rng, jd_cluster, words // 3)})
+    return records
+
+def export_jsonl(path, n, size="medium", seed=0):
+    with open(path, "w", encoding="utf-8") as f:
+        for r in make_corpus(n, size, seed):
+            f.write(json.dumps({"id": r["id"], "cluster": r["cluster"], "text": r["jd"],
+                                "resume": r["resume"], "resume_data": r["resume_data"]}) + "\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic resume/JD corpus")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_exp = sub.add_parser("export")
+    p_exp.add_argument("out")
+    p_exp.add_argument("--n", type=int, default=1000)
+    p_exp.add_argument("--size", choices=SIZES, default="medium")
+    p_exp.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    export_jsonl(args.out, args.n, args.size, args.seed)
+    print(f"✅ Wrote {args.n} {args.size} records to {args.out}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,207 @@
+# load_dashboard.py
+# Multi-session load test for dashboard.py, driven headlessly with Streamlit's AppTest.
+# Each simulated user gets its own AppTest (its own session state) on its own thread, sharing the
+# process-wide st.cache_* caches the way real sessions in one server process do. A user:
+#   logs in -> uploads a PDF -> pastes a JD -> runs a scan -> translates -> downloads the PDF and DOCX
+# A download is timed like a rerun: the dashboard defers the PDF/DOCX builds until a button is clicked, so
+# the step reruns the script and then runs each button's deferred export, the way the server does on a click.
+# Concurrency ramps up (1, 2, 4, ...) until p95 rerun latency passes --slo-ms or errors appear.
+# Usage: python benchmarks/load_dashboard.py [--max-sessions 32] [--rounds 3] [--pages 4] [--slo-ms 2000]
+#                                            [--steps login upload jd scan translate download]
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "resume_tool")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SRC)
+
+from bench_upload import make_pdf
+
+STEPS = ["login", "upload", "jd", "scan", "translate", "download"]
+JDS = [
+    "Hiring a backend engineer: python, sql, docker, kubernetes, aws and ci/cd pipelines.",
+    "Clinical nurse role: patient care, triage, emr documentation, hipaa and medication administration.",
+    "Sports marketing manager to grow fan engagement, sponsorship activation and ticket sales.",
+]
+
+def rss_mb():
+    """Resident set size of this process in MB (Linux /proc, else peak RSS from getrusage)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def share_runtime():
+    """
+    AppTest installs a mock Runtime before each run and clears it afterwards, so overlapping runs on
+    other threads lose theirs mid-script. Pin the first one for the whole process instead, and compile
+    the script once through a single ScriptCache (concurrent ast.parse calls can crash CPython 3.11).
+    A real server also has exactly one of each, shared by all sessions. AppTest also gives every session
+    the same id, so one user's rerun would revoke everyone's deferred downloads; each simulated user
+    runs on its own thread, so sessions get their thread's id instead.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+    pinned = []
+    original = Runtime.instance.__func__
+
+    def instance(cls):
+        if not pinned and cls._instance is not None: pinned.append(cls._instance)
+        return pinned[0] if pinned else original(cls)
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: bool(pinned) or cls._instance is not None)
+
+    runner_init = local_script_runner.LocalScriptRunner.__init__
+
+    def own_session(self, *args, **kwargs):
+        runner_init(self, *args, **kwargs)
+        self._session_id = f"load-session-{threading.get_ident()}"
+
+    local_script_runner.LocalScriptRunner.__init__ = own_session
+
+def _button(at, label):
+    for b in at.button:
+        if label in b.label: return b
+    raise LookupError(f"button {label!r} not rendered")
+
+class Session:
+    """One simulated user. Every AppTest.run() is timed as one rerun."""
+
+    def __init__(self, app_path, pdf_bytes, rng):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(app_path, default_timeout=300)
+        self.pdf_bytes = pdf_bytes
+        self.rng = rng
+        self.latencies = []  # (step, seconds)
+        self.errors = []
+
+    def _export(self):
+        from streamlit.runtime import Runtime
+        files = Runtime.instance().media_file_mgr
+        for button in self.at.get("download_button"):
+            if not button.proto.deferred_file_id: continue
+            t0 = time.perf_counter()
+            try:
+                files.execute_deferred(button.proto.deferred_file_id)
+            except Exception as e:
+                self.errors.append(f"export {button.proto.label}: {e}")
+            self.latencies.append((f"export {button.proto.label.split()[-1]}", time.perf_counter() - t0))
+
+    def _run(self, step):
+        t0 = time.perf_counter()
+        self.at.run()
+        self.latencies.append((step, time.perf_counter() - t0))
+        if self.at.exception:
+            self.errors.append(f"{step}: {self.at.exception[0].value}")
+
+    def do(self, step):
+        at = self.at
+        if step == "login":
+            self._run("open")
+            at.text_input[0].input("admin123"); _button(at, "Sign In").click()
+        elif step == "upload":
+            at.sidebar.get("file_uploader")[0].upload("resume.pdf", self.pdf_bytes, "application/pdf")
+        elif step == "jd":
+            at.sidebar.text_area[0].input(self.rng.choice(JDS))
+        elif step == "scan":
+            _button(at, "Run Scan").click()
+        elif step == "translate":
+            at.selectbox[0].select("Sports Marketing")
+            self._run("translate-select")
+            _button(at, "Translate").click()
+        self._run(step)
+        if step == "download": self._export()
+
+    def script(self, steps):
+        for step in steps:
+            try:
+                self.do(step)
+            except Exception as e:
+                self.errors.append(f"{step}: {type(e).__name__}: {e}")
+                break
+
+def run_level(n, app_path, pdf_bytes, steps, rounds):
+    """n sessions at once, each running the script `rounds` times (after the first round the
+    script repeats only the interactive steps, like a user iterating on one draft)."""
+    rng = random.Random(n)
+    sessions = [Session(app_path, pdf_bytes, random.Random(rng.random())) for _ in range(n)]
+    repeat_steps = [s for s in steps if s not in ("login", "upload")]
+    rss_before = rss_mb()
+    start = threading.Barrier(n)
+
+    def drive(session):
+        start.wait()
+        session.script(steps)
+        for _ in range(rounds - 1): session.script(repeat_steps)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        list(pool.map(drive, sessions))
+    wall = time.perf_counter() - t0
+    rss_after = rss_mb()  # sessions are still referenced here, so their state counts
+
+    latencies = sorted(t for s in sessions for _, t in s.latencies)
+    by_step = {}
+    for s in sessions:
+        for step, t in s.latencies: by_step.setdefault(step, []).append(t)
+    pct = lambda xs, q: xs[min(len(xs) - 1, int(q * len(xs)))] * 1000 if xs else 0.0
+    return {
+        "sessions": n,
+        "reruns": len(latencies),
+        "wall_s": wall,
+        "reruns_per_s": len(latencies) / wall if wall else 0.0,
+        "p50_ms": pct(latencies, 0.50), "p95_ms": pct(latencies, 0.95), "max_ms": pct(latencies, 1.0),
+        "step_p50_ms": {k: statistics.median(v) * 1000 for k, v in by_step.items()},
+        "rss_growth_mb_per_session": max(0.0, rss_after - rss_before) / n,
+        "errors": [e for s in sessions for e in s.errors],
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default=os.path.join(SRC, "dashboard.py"))
+    parser.add_argument("--max-sessions", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--slo-ms", type=float, default=2000, help="p95 rerun latency that counts as broken")
+    parser.add_argument("--steps", nargs="+", choices=STEPS, default=STEPS)
+    args = parser.parse_args()
+    if "login" not in args.steps: args.steps.insert(0, "login")
+
+    share_runtime()
+    app_path, pdf_bytes = os.path.abspath(args.app), make_pdf(args.pages)
+    # One untimed session first, so module imports and cache_resource loads aren't billed to level 1
+    run_level(1, app_path, pdf_bytes, args.steps, 1)
+
+    print(f"{'sessions':>8} {'reruns':>7} {'rerun/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'MB/sess':>8} {'errors':>7}")
+    breaking, n = None, 1
+    while n <= args.max_sessions:
+        r = run_level(n, app_path, pdf_bytes, args.steps, args.rounds)
+        print(f"{n:8d} {r['reruns']:7d} {r['reruns_per_s']:8.1f} {r['p50_ms']:9.1f} {r['p95_ms']:9.1f} "
+              f"{r['max_ms']:9.1f} {r['rss_growth_mb_per_session']:8.2f} {len(r['errors']):7d}")
+        if r["errors"] or r["p95_ms"] > args.slo_ms:
+            breaking = r
+            break
+        n *= 2
+
+    if breaking is None:
+        print(f"✅ No breaking point up to {args.max_sessions} concurrent sessions (p95 SLO {args.slo_ms:.0f} ms)")
+        return
+    why = f"{len(breaking['errors'])} error(s)" if breaking["errors"] else f"p95 {breaking['p95_ms']:.0f} ms > {args.slo_ms:.0f} ms"
+    print(f"❌ Breaks at {breaking['sessions']} concurrent sessions ({why})")
+    print("   per-step p50 ms: " + ", ".join(f"{k} {v:.0f}" for k, v in sorted(breaking["step_p50_ms"].items())))
+    for e in breaking["errors"][:5]: print(f"   {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# load_scoring_api.py
+# Load test for scoring_server.py: N keep-alive clients hammer /analyze (or /audit) for a fixed time.
+# Usage: python benchmarks/load_scoring_api.py [--url http://127.0.0.1:8765] [--route /analyze]
+#                                              [--clients 16] [--seconds 10] [--distinct 50]
+# --distinct controls how many different payloads rotate through, i.e. the cache-hit ratio.
+import json
+import time
+import random
+import asyncio
+import argparse
+from urllib.parse import urlparse
+
+WORDS = ["python", "sql", "patient", "care", "budget", "forecasting", "campaign", "sponsorship",
+         "inventory", "logistics", "kubernetes", "docker", "roadmap", "stakeholder", "audit", "compliance"]
+
+def make_payloads(n, route):
+    rng = random.Random(3)
+    payloads = []
+    for _ in range(n):
+        resume = "Jane Doe jane@mail.com 555-123-4567\nExperience\n" + " ".join(rng.choices(WORDS, k=300))
+        body = {"resume": resume}
+        if route == "/analyze": body["jd"] = " ".join(rng.choices(WORDS, k=200))
+        payloads.append(json.dumps(body).encode())
+    return payloads
+
+async def client(host, port, route, payloads, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = random.randrange(len(payloads))
+    while time.perf_counter() < deadline:
+        body = payloads[i % len(payloads)]; i += 1
+        t0 = time.perf_counter()
+        writer.write(f"POST {route} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        status = await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""): break
+            if line.lower().startswith(b"content-length:"): length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - t0)
+        if b" 200 " not in status: errors.append(status)
+    writer.close()
+
+async def run(args):
+    url = urlparse(args.url)
+    payloads = make_payloads(args.distinct, args.route)
+    latencies, errors = [], []
+    t0 = time.perf_counter()
+    deadline = t0 + args.seconds
+    await asyncio.gather(*(client(url.hostname, url.port, args.route, payloads, deadline, latencies, errors)
+                           for _ in range(args.clients)))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0
+    print(f"{args.route}: {args.clients} clients, {args.distinct} distinct payloads, {elapsed:.1f}s")
+    print(f"requests: {len(latencies)}  errors: {len(errors)}  rps: {len(latencies) / elapsed:.0f}")
+    print(f"latency ms  p50 {pct(0.50):.2f}  p95 {pct(0.95):.2f}  p99 {pct(0.99):.2f}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--route", default="/analyze", choices=["/analyze", "/audit"])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--distinct", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
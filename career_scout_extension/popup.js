@@ -1,3 +1,6 @@
+// Local scoring API (src/resume_tool/scoring_server.py). Optional: if it isn't running we fall back to Gemini only.
+const LOCAL_API = 'http://127.0.0.1:8765';
+
 document.addEventListener('DOMContentLoaded', () => {
     const views = {
         settings: document.getElementById('settings-view'),
@@ -55,6 +58,21 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
+    async function scoreLocally(resumeText, jobText) {
+        try {
+            const response = await fetch(`${LOCAL_API}/analyze`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ resume: resumeText, jd: jobText })
+            });
+            if (!response.ok) return null;
+            const local = await response.json();
+            return { score: Math.round(local.match_score), missing_keywords: local.missing_keywords.slice(0, 5) };
+        } catch (error) {
+            return null; // Server not running
+        }
+    }
+
     async function analyzeWithGemini(jobText) {
         chrome.storage.local.get(['apiKey', 'resumeText'], async (data) => {
             if (!data.apiKey || !data.resumeText) {
@@ -62,7 +80,23 @@ document.addEventListener('DOMContentLoaded', () => {
                 return;
             }
 
-            const prompt = `
+            // Instant local score first; the model is then only needed for the narrative
+            const local = await scoreLocally(data.resumeText, jobText);
+            if (local) displayResults({ ...local, verdict: "Local match score. AI summary loading..." });
+
+            const prompt = local ? `
+        A candidate's resume matches this job at ${local.score}/100 on keywords.
+        Missing keywords: ${local.missing_keywords.join(', ')}.
+        
+        RESUME: ${data.resumeText.substring(0, 3000)}
+        
+        JOB: ${jobText}
+        
+        Output strictly in JSON format:
+        {
+          "verdict": "Short sentence summary"
+        }
+      ` : `
         Compare this Resume to the Job Description.
         
         RESUME: ${data.resumeText.substring(0, 3000)}
@@ -94,9 +128,13 @@ document.addEventListener('DOMContentLoaded', () => {
                 const cleanJson = rawText.replace(/```json/g, '').replace(/```/g, '').trim();
                 const result = JSON.parse(cleanJson);
 
-                displayResults(result);
+                displayResults(local ? { ...local, verdict: result.verdict } : result);
 
             } catch (error) {
+                if (local) {
+                    displayResults({ ...local, verdict: "Local match score (AI summary unavailable)." });
+                    return;
+                }
                 alert("AI Error: " + error.message);
                 document.getElementById('loading').classList.add('hidden');
             }
@@ -1,8 +1,22 @@
 import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join("src", "resume_tool")))
 
 db_path = os.path.abspath(os.path.join("src", "resume_tool", "portfolio.db"))
 print(f"Targeting DB at: {db_path}")
 
+# Schema drift is handled by migrations now; wiping the file is an explicit last resort.
+if "--reset" not in sys.argv:
+    import migrations
+    try:
+        migrations.main(["upgrade"])
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        print("ℹ️ Stop the Streamlit app and retry, or run with --reset to delete the database.")
+        sys.exit(1)
+    sys.exit(0)
+
 if os.path.exists(db_path):
     try:
         os.remove(db_path)
@@ -0,0 +1,122 @@
+# advice_registry.py
+# Job title -> expert advice pack. Packs are the built-in EXPERT_INSIGHTS plus every data/advice/*.json
+# file (same name = merge: lists extended, other fields replaced), loaded on first use and compiled into:
+#   exact     normalized full title -> pack ("registered nurse")
+#   phrases   known multi-word titles, matched against the title's word n-grams
+#   words     inverted index: title word -> {pack: weight}
+# so resolving a title costs a few dict lookups per word, however many titles and packs are loaded.
+#   python advice_registry.py "Senior Clinical Nurse Specialist" ["Backend Engineer II" ...]
+import os
+import re
+import sys
+import glob
+import json
+import threading
+
+from expert_tips import EXPERT_INSIGHTS, EXPERT_TITLE_WORDS
+
+ADVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "advice")
+PHRASE_WEIGHT = 3.0   # a known title inside a longer one ("senior registered nurse ii")
+WORD_WEIGHT = 1.0
+MAX_NGRAM = 4
+GENERIC_SPREAD = 3    # a title word used by this many packs ("manager", "senior") says nothing about the field
+CACHE_SIZE = 8192
+_WORD = re.compile(r"[a-z0-9&+#]+")
+
+def normalize(title):
+    return " ".join(_WORD.findall(title.lower()))
+
+def _variants(word):
+    """The word plus simple plural/gerund stems, so "engineering" and "nurses" still hit."""
+    out = [word]
+    if len(word) > 4 and word.endswith("ing"): out.append(word[:-3])
+    if len(word) > 3 and word.endswith("s"): out.append(word[:-1])
+    return out
+
+def load_packs(advice_dir=ADVICE_DIR):
+    """Built-in packs first, then data files in name order; returns the merged list."""
+    packs = {name: {"name": name, **pack, "titles": [], "keywords": list(EXPERT_TITLE_WORDS.get(name, []))}
+             for name, pack in EXPERT_INSIGHTS.items()}
+    for path in sorted(glob.glob(os.path.join(advice_dir, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            for pack in json.load(f).get("packs", []):
+                merged = packs.setdefault(pack["name"], {"name": pack["name"], "tips": [], "metrics": [], "titles": [], "keywords": []})
+                for key, value in pack.items():
+                    if isinstance(value, list): merged[key] = merged.get(key, []) + [v for v in value if v not in merged.get(key, [])]
+                    else: merged[key] = value
+    return list(packs.values())
+
+class AdviceRegistry:
+    def __init__(self, packs):
+        self.packs = packs
+        self.exact, self.phrases, self.words, self._cache = {}, {}, {}, {}
+        title_words = {}
+        for i, pack in enumerate(packs):
+            for title in pack.get("titles", []):
+                key = normalize(title)
+                self.exact.setdefault(key, i)
+                if " " in key: self.phrases.setdefault(key, i)
+                for word in key.split(): title_words.setdefault(word, set()).add(i)
+            for word in pack.get("keywords", []):
+                self._index(normalize(word), i, WORD_WEIGHT)
+        for word, owners in title_words.items():
+            if len(owners) < GENERIC_SPREAD:
+                for i in owners: self._index(word, i, WORD_WEIGHT / 2)
+
+    def _index(self, word, pack, weight):
+        postings = self.words.setdefault(word, {})
+        postings[pack] = max(postings.get(pack, 0), weight)
+
+    def scores(self, title):
+        """pack index -> score for one title."""
+        key = normalize(title)
+        if key in self.exact: return {self.exact[key]: float("inf")}
+        words = key.split()
+        scores = {}
+        for n in range(min(MAX_NGRAM, len(words)), 1, -1):
+            for j in range(len(words) - n + 1):
+                pack = self.phrases.get(" ".join(words[j:j + n]))
+                if pack is not None: scores[pack] = scores.get(pack, 0) + PHRASE_WEIGHT * n
+        for word in words:
+            for variant in _variants(word):
+                postings = self.words.get(variant)
+                if postings:
+                    for pack, weight in postings.items(): scores[pack] = scores.get(pack, 0) + weight
+                    break
+        return scores
+
+    def resolve(self, title):
+        """The best pack for a title, or None. Ties go to the pack loaded first."""
+        if not title: return None
+        key = normalize(title)
+        if key not in self._cache:
+            if len(self._cache) >= CACHE_SIZE: self._cache.clear()
+            scores = self.scores(key)
+            self._cache[key] = max(scores, key=lambda i: (scores[i], -i)) if scores else None
+        best = self._cache[key]
+        return None if best is None else self.packs[best]
+
+    def resolve_many(self, titles):
+        """Packs for a list of titles (bulk reports); repeated titles are resolved once."""
+        return [self.resolve(t) for t in titles]
+
+    @property
+    def size(self):
+        return {"packs": len(self.packs), "titles": len(self.exact), "words": len(self.words)}
+
+_REGISTRY = None
+_LOCK = threading.Lock()
+
+def get_registry():
+    """Loaded and compiled once per process, on first use."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _LOCK:
+            if _REGISTRY is None: _REGISTRY = AdviceRegistry(load_packs())
+    return _REGISTRY
+
+if __name__ == "__main__":
+    registry = get_registry()
+    for title in sys.argv[1:] or ["Registered Nurse"]:
+        pack = registry.resolve(title)
+        print(f"{title!r:45} -> {pack['name'] if pack else None}")
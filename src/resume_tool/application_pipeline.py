@@ -0,0 +1,189 @@
+# application_pipeline.py
+# Application packs for a batch of postings: keyword score, cover letter and interview questions.
+# Stage 1 scores every JD locally (cheap, on the NLP executor thread). Stage 2 sends only the top N
+# postings to the model; both calls for a posting go out together, at most `concurrency` postings are
+# in flight at once, and each pack is written to the database the moment it completes.
+# Interview questions come from the offline question bank, which only asks the model when it has too few
+# on-topic questions for the JD.
+# With min_score and no top_n, a posting moves to stage 2 as soon as it clears the bar, so model
+# calls overlap with the scoring of the rest of the batch.
+#   python application_pipeline.py <resume.txt> <jd_dir_or_jsonl> [--top 5] [--concurrency 4] [--user-id 1]
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import update
+
+from ats_auditor import score_token_sets
+from ingest_queue import utcnow
+from match_engine import IncrementalMatcher
+from models import ApplicationPack
+from question_bank import QuestionBank
+
+DEFAULT_TOP_N = 5
+DEFAULT_CONCURRENCY = 4
+ERROR_PREFIXES = ("Error:", "⚠️")  # how AIService reports failures in its return values
+
+def _failed(value):
+    if isinstance(value, list): return not value or any(_failed(v) for v in value)
+    return not value or str(value).startswith(ERROR_PREFIXES)
+
+class ApplicationPipeline:
+    def __init__(self, ai, db_factory=None, top_n=DEFAULT_TOP_N, concurrency=DEFAULT_CONCURRENCY,
+                 min_score=None, matcher=None, questions=None):
+        if db_factory is None:
+            from database import SessionLocal
+            db_factory = SessionLocal
+        self.ai = ai
+        self.db_factory = db_factory
+        self.top_n = top_n
+        self.concurrency = concurrency
+        self.min_score = min_score
+        self.matcher = matcher or IncrementalMatcher()
+        self.questions = questions or QuestionBank(db_factory, ai)
+        self.timings = {}
+
+    # --- 1. LOCAL SCORING ---
+    def _score(self, r_tokens, jd_text):
+        return score_token_sets(r_tokens, self.matcher.tokens(jd_text))
+
+    def _insert_scored(self, rows):
+        """Writes every scored posting in one transaction; returns their pack ids in the same order."""
+        with self.db_factory() as db:
+            packs = [ApplicationPack(**row) for row in rows]
+            db.add_all(packs)
+            db.commit()
+            return [p.id for p in packs]
+
+    # --- 2. MODEL CALLS ---
+    async def _build(self, pack_id, resume_text, jd_text, gate, calls):
+        """
+        Both model calls for one posting, run side by side under the concurrency gate, then saved.
+        Never raises: anything that goes wrong (a call, the bank, the save) ends this pack as "error"
+        with the reason in last_error, and the rest of the batch carries on.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            async with gate:
+                letter, served = await asyncio.gather(
+                    loop.run_in_executor(calls, self.ai.generate_cover_letter, resume_text, jd_text),
+                    loop.run_in_executor(calls, self.questions.get_questions, jd_text))
+            questions = served["questions"]
+            errors = {name: v for name, v in (("cover letter", letter), ("questions", questions)) if _failed(v)}
+            values = {"cover_letter": None if "cover letter" in errors else letter,
+                      "interview_questions": None if "questions" in errors else json.dumps(questions),
+                      "status": "error" if errors else "ready", "finished_at": utcnow(),
+                      "last_error": "; ".join(f"{name}: {v}" for name, v in errors.items()) or None}
+            await asyncio.to_thread(self._save, pack_id, values)
+        except Exception as e:
+            values = {"cover_letter": None, "interview_questions": None, "status": "error", "finished_at": utcnow(),
+                      "last_error": f"{type(e).__name__}: {e}"}
+            try:
+                await asyncio.to_thread(self._save, pack_id, values)
+            except Exception:
+                pass  # the database itself is failing; the returned pack still reports the error
+        return {"id": pack_id, **values}
+
+    def _save(self, pack_id, values):
+        with self.db_factory() as db:
+            db.execute(update(ApplicationPack).where(ApplicationPack.id == pack_id).values(**values))
+            db.commit()
+
+    def _set_ranks(self, ranks):
+        with self.db_factory() as db:
+            for pack_id, rank in ranks.items():
+                db.execute(update(ApplicationPack).where(ApplicationPack.id == pack_id).values(rank=rank))
+            db.commit()
+
+    # --- 3. ORCHESTRATION ---
+    async def run(self, resume_text, jds, user_id=None, resume_id=None, job_ids=None, on_pack=None):
+        """
+        Scores every JD, builds packs for the selected ones and returns every posting best-first as a dict
+        (id, index into jds, rank, match_score, status, and the pack fields once built).
+        on_pack(pack) is called as each pack lands.
+        """
+        t0 = time.perf_counter()
+        r_tokens = await asyncio.to_thread(self.matcher.tokens, resume_text)
+        gate = asyncio.Semaphore(self.concurrency)
+        # AIService calls block; asyncio's default pool has only cpu_count + 4 threads, fewer than the calls in flight
+        calls = ThreadPoolExecutor(max_workers=2 * self.concurrency, thread_name_prefix="ai")
+        now = utcnow()
+        streaming = self.top_n is None and self.min_score is not None
+
+        def row(i, rank=None):
+            return {"user_id": user_id, "resume_id": resume_id, "job_id": job_ids[i] if job_ids else None,
+                    "jd_hash": hashlib.sha256(jds[i].encode("utf-8")).hexdigest(), "jd_text": jds[i],
+                    "match_score": float(results[i]["match_score"]), "rank": rank,
+                    "common_keywords": json.dumps(results[i]["common_keywords"]),
+                    "missing_keywords": json.dumps(results[i]["missing_keywords"]), "status": "scored", "created_at": now}
+
+        async def build(i):
+            pack = await self._build(ids[i], resume_text, jds[i], gate, calls)
+            if on_pack: on_pack({"index": i, **pack})
+            return i, pack
+
+        results, ids, building = [None] * len(jds), {}, []
+        for i, jd in enumerate(jds):
+            results[i] = await asyncio.to_thread(self._score, r_tokens, jd)
+            if streaming and results[i]["match_score"] >= self.min_score:
+                ids[i] = (await asyncio.to_thread(self._insert_scored, [row(i)]))[0]
+                building.append(asyncio.create_task(build(i)))
+        self.timings["score"] = time.perf_counter() - t0
+
+        order = sorted(range(len(jds)), key=lambda i: results[i]["match_score"], reverse=True)
+        ranks = {i: rank for rank, i in enumerate(order, 1)}
+        pending = [i for i in order if i not in ids]
+        ids.update(zip(pending, await asyncio.to_thread(self._insert_scored, [row(i, ranks[i]) for i in pending])))
+        if streaming:
+            await asyncio.to_thread(self._set_ranks, {ids[i]: ranks[i] for i in ids if i not in pending})
+        else:
+            chosen = [i for i in order[:self.top_n] if self.min_score is None or results[i]["match_score"] >= self.min_score]
+            building = [asyncio.create_task(build(i)) for i in chosen]
+
+        try:
+            built = dict(await asyncio.gather(*building))
+        finally:
+            calls.shutdown(wait=False)
+        self.timings["total"] = time.perf_counter() - t0
+        return [{"id": ids[i], "index": i, "rank": ranks[i], "match_score": float(results[i]["match_score"]), "status": "scored",
+                 **built.get(i, {})} for i in order]
+
+def run_pipeline(ai, resume_text, jds, **kwargs):
+    """Blocking wrapper for scripts and the CLI."""
+    init = {k: kwargs.pop(k) for k in ("db_factory", "top_n", "concurrency", "min_score", "matcher", "questions") if k in kwargs}
+    return asyncio.run(ApplicationPipeline(ai, **init).run(resume_text, jds, **kwargs))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build application packs for a batch of postings")
+    parser.add_argument("resume", help="plain-text resume")
+    parser.add_argument("jds", help="folder of .txt JDs or a .jsonl file with a \"text\" field")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_N)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--min-score", type=float, default=None)
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    from database import init_db
+    from keyword_weights import iter_corpus
+    from services.ai_service import AIService
+    ai = AIService(os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY"))
+    if not ai.is_configured():
+        print("❌ Set GEMINI_API_KEY to build packs.")
+        sys.exit(1)
+    init_db()
+    with open(args.resume, encoding="utf-8") as f:
+        resume_text = f.read()
+    jds = [t for t in iter_corpus(args.jds) if t.strip()]
+    packs = run_pipeline(ai, resume_text, jds, top_n=args.top, concurrency=args.concurrency,
+                         min_score=args.min_score, user_id=args.user_id,
+                         on_pack=lambda p: print(f"  {'✅' if p['status'] == 'ready' else '❌'} pack {p['id']} ({p['status']})"))
+    for p in packs[:args.top]:
+        print(f"#{p['rank']:<3d} {p['match_score']:5.1f}%  pack {p['id']}  {p['status']}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
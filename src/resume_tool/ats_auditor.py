@@ -1,113 +1,168 @@
+import os
 import re
-try:
-    import spacy
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        import spacy.cli
-        spacy.cli.download("en_core_web_sm")
-        nlp = spacy.load("en_core_web_sm")
-except (ImportError, OSError, Exception):
-    nlp = None
-    import nltk
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        nltk.download('stopwords')
+import threading
+from functools import lru_cache
 
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, ENGLISH_STOP_WORDS
 from sklearn.metrics.pairwise import cosine_similarity
 
+from audit_rules import DEFAULT_ENGINE
+from expert_tips import POWER_VERBS, WEAK_WORDS
+from instrumentation import timed, timer
+from keyword_weights import rank_keywords
+from semantic_matcher import get_semantic_model
+
 RESUME_NOISE = {"experience", "skills", "education", "summary", "responsible", "duties", "include", "worked", "helped", "team", "role", "company", "work", "job", "candidate", "requirements", "year", "excellent", "strong", "proficient", "various", "ability", "remote", "hybrid"}
 
+@timed("nlp.clean_text")
 def clean_text(text):
     if not text: return ""
     text = re.sub(r'[^a-z0-9\s]', ' ', text.lower())
     return re.sub(r'\s+', ' ', text).strip()
 
-def get_tokens(text):
-    if nlp:
-        doc = nlp(text)
-        tokens = []
-        for token in doc:
-            if token.pos_ not in ["NOUN", "PROPN"]: continue
-            if len(token.text) < 3 or token.is_stop or token.text in RESUME_NOISE: continue
-            tokens.append(token.text)
-        return set(tokens)
-    else:
-        # Fallback to NLTK
-        tokens = nltk.word_tokenize(text)
-        stopwords = set(nltk.corpus.stopwords.words('english'))
-        return {t for t in tokens if t.isalpha() and t not in stopwords and t not in RESUME_NOISE and len(t) > 2}
+# --- TOKENIZERS ---
+# "spacy": noun/proper-noun tokens from en_core_web_sm (the most accurate, and the slowest).
+# "nltk":  word_tokenize + NLTK stopwords, for installs without a spaCy model.
+# "fast":  precompiled regex + frozen stopwords + a suffix heuristic for "noun-ish" words; no models,
+#          no data files, no network. Meant for bulk jobs where throughput matters more than POS accuracy.
+# "auto":  the first of spacy / nltk / fast that is available.
+# Nothing is loaded or downloaded at import; models load on first use.
+TOKENIZER_MODES = ("auto", "spacy", "nltk", "fast")
+_tokenizer_mode = os.environ.get("RESUME_TOOL_TOKENIZER", "auto")
+
+nlp = None
+_load_lock = threading.Lock()
+_spacy_checked = False
+
+def set_tokenizer_mode(mode):
+    global _tokenizer_mode
+    if mode not in TOKENIZER_MODES: raise ValueError(f"Unknown tokenizer mode {mode!r}; expected one of {TOKENIZER_MODES}")
+    _tokenizer_mode = mode
+
+def get_tokenizer_mode():
+    return _tokenizer_mode
+
+def get_nlp():
+    """The shared spaCy pipeline, loaded on first call; None if spaCy or its model isn't installed."""
+    global nlp, _spacy_checked
+    if not _spacy_checked:
+        with _load_lock:
+            if not _spacy_checked:
+                try:
+                    import spacy
+                    nlp = spacy.load("en_core_web_sm")
+                except Exception:  # not installed, model missing, or incompatible build
+                    nlp = None
+                _spacy_checked = True
+    return nlp
+
+@lru_cache(maxsize=1)
+def _nltk_resources():
+    """(word_tokenize, frozen stopword set) if NLTK and its data are already on disk, else None."""
+    try:
+        import nltk
+        stopwords = frozenset(nltk.corpus.stopwords.words('english'))
+        nltk.word_tokenize("probe")  # raises LookupError if the punkt data isn't there
+        return nltk.word_tokenize, stopwords
+    except Exception:
+        return None
+
+_FAST_WORD_RE = re.compile(r"\b[a-z][a-z0-9]{2,}\b")
+FAST_STOPWORDS = frozenset(ENGLISH_STOP_WORDS) | RESUME_NOISE | {w.lower() for w in POWER_VERBS + WEAK_WORDS} | {
+    "using", "use", "used", "including", "ensure", "provide", "support", "make", "need", "new", "key", "high",
+    "based", "etc", "within", "across", "plus", "per", "via", "preferred", "required",
+    "working", "looking", "join", "help", "build", "drive", "create", "lead", "manage", "develop", "deliver",
+}
+# Verb/adjective/adverb endings; nouns that happen to share them are kept explicitly.
+_NON_NOUN_SUFFIXES = ("ly", "ed", "ize", "ise", "izing", "ous", "ful", "ible", "able", "ive")
+_NOUN_EXCEPTIONS = frozenset({
+    "supply", "assembly", "family", "anomaly", "monopoly", "speed", "feed", "seed", "embed",
+    "executive", "initiative", "objective", "representative", "incentive", "detective", "directive",
+    "franchise", "expertise", "enterprise", "merchandise", "exercise", "premise", "devise",
+    "cable", "table", "variable", "deliverable", "receivable", "payable",
+})
+
+def fast_tokens(text):
+    """Regex tokenizer with a noun-ish filter; expects clean_text output (lowercase, [a-z0-9 ])."""
+    return {
+        w for w in _FAST_WORD_RE.findall(text)
+        if w not in FAST_STOPWORDS and (w in _NOUN_EXCEPTIONS or not w.endswith(_NON_NOUN_SUFFIXES))
+    }
+
+@timed("nlp.get_tokens")
+def tokenize(text, mode=None):
+    """(token set, spaCy Doc or None): the Doc lets callers reuse the parse instead of running the pipeline again."""
+    mode = mode or _tokenizer_mode
+    if mode == "fast": return fast_tokens(text), None
+    if mode in ("auto", "spacy"):
+        model = get_nlp()
+        if model:
+            doc = model(text)
+            tokens = []
+            for token in doc:
+                if token.pos_ not in ["NOUN", "PROPN"]: continue
+                if len(token.text) < 3 or token.is_stop or token.text in RESUME_NOISE: continue
+                tokens.append(token.text)
+            return set(tokens), doc
+        if mode == "spacy": raise RuntimeError("spaCy mode requested but en_core_web_sm isn't installed")
+    nltk_tools = _nltk_resources()
+    if nltk_tools:
+        word_tokenize, stopwords = nltk_tools
+        return {t for t in word_tokenize(text) if t.isalpha() and t not in stopwords and t not in RESUME_NOISE and len(t) > 2}, None
+    if mode == "nltk": raise RuntimeError("NLTK mode requested but its punkt/stopwords data isn't downloaded")
+    return fast_tokens(text), None
+
+def get_tokens(text, mode=None):
+    return tokenize(text, mode)[0]
+
+# Multi-word keywords ("machine learning") join the single-word tokens unless RESUME_TOOL_PHRASES=0.
+USE_PHRASES = os.environ.get("RESUME_TOOL_PHRASES", "1") not in ("", "0")
+
+@timed("nlp.extract_keywords")
+def extract_keywords(text, mode=None):
+    """Keyword set used for matching: get_tokens words plus known phrases / noun chunks."""
+    cleaned = clean_text(text)
+    keywords, doc = tokenize(cleaned, mode=mode)
+    if USE_PHRASES:
+        from phrase_extractor import get_phrase_extractor
+        keywords |= get_phrase_extractor().extract(text, cleaned, doc=doc, parse=False)  # chunks from the same parse
+    return keywords
 
 # --- EXISTING JD MATCH AUDIT ---
 def get_analysis_data(resume_text, jd_text):
     if not resume_text or not jd_text: return {"match_score": 0, "common_keywords": [], "missing_keywords": []}
     
-    r_tokens = get_tokens(clean_text(resume_text))
-    j_tokens = get_tokens(clean_text(jd_text))
+    r_tokens = extract_keywords(resume_text)
+    j_tokens = extract_keywords(jd_text)
+    result = score_token_sets(r_tokens, j_tokens)
     
+    # Optional: LSA score alongside the keyword score, once a model has been built offline
+    semantic = get_semantic_model()
+    if semantic:
+        with timer("score.semantic"): result["semantic_score"] = semantic.similarity(resume_text, jd_text)
+    return result
+
+def score_token_sets(r_tokens, j_tokens):
+    """Match score + keyword lists from already-tokenized resume and JD sets. Gaps come rarest-first."""
     try:
-        cv = CountVectorizer()
-        matrix = cv.fit_transform([" ".join(r_tokens), " ".join(j_tokens)])
-        score = round(cosine_similarity(matrix)[0][1] * 100, 1)
+        with timer("score.vectorize"):
+            # Each keyword (phrases included) is one feature; joining and re-splitting would break phrases apart
+            cv = CountVectorizer(analyzer=list)
+            matrix = cv.fit_transform([r_tokens, j_tokens])
+        with timer("score.cosine"):
+            score = round(cosine_similarity(matrix)[0][1] * 100, 1)
     except: score = 0
     
-    return {"match_score": score, "common_keywords": sorted(list(r_tokens & j_tokens)), "missing_keywords": sorted(list(j_tokens - r_tokens))}
+    return {"match_score": score, "common_keywords": sorted(list(r_tokens & j_tokens)), "missing_keywords": rank_keywords(j_tokens - r_tokens)}
 
 # --- NEW: GENERAL HEALTH CHECK (No JD) ---
 def perform_general_audit(resume_text):
     """Checks for best practices without a JD."""
-    score = 100
-    issues = []
-    strengths = []
-    
-    text_lower = resume_text.lower()
-    
-    # 1. Contact Info Check
-    if "@" not in text_lower:
-        score -= 20
-        issues.append("❌ Missing Email Address")
-    else:
-        strengths.append("✅ Email Detected")
-        
-    if not any(char.isdigit() for char in resume_text):
-        score -= 20
-        issues.append("❌ No Phone Number or Metrics found")
-    
-    # 2. Weak Word Check
-    weak_words = ["responsible for", "duties included", "helped", "worked on", "attempted"]
-    found_weak = [w for w in weak_words if w in text_lower]
-    if found_weak:
-        score -= 15
-        issues.append(f"⚠️ Weak words detected: {', '.join(found_weak)}")
-    else:
-        strengths.append("✅ Strong Action Verbs used")
-        
-    # 3. Length Check
-    word_count = len(resume_text.split())
-    if word_count < 200:
-        score -= 10
-        issues.append("⚠️ Resume is too short (under 200 words)")
-    elif word_count > 2000:
-        score -= 10
-        issues.append("⚠️ Resume is too long (over 2 pages)")
-    else:
-        strengths.append("✅ Optimal Word Count")
-        
-    # 4. Section Check
-    required_sections = ["experience", "education", "skills"]
-    missing_sections = [s for s in required_sections if s not in text_lower]
-    if missing_sections:
-        score -= 15
-        issues.append(f"❌ Missing Sections: {', '.join(missing_sections).title()}")
-    
-    return {
-        "score": max(0, score),
-        "issues": issues,
-        "strengths": strengths
-    }
+    return DEFAULT_ENGINE.audit(resume_text)
+
+def perform_general_audit_batch(resume_texts):
+    """Health-checks many resumes in one vectorized pass."""
+    return DEFAULT_ENGINE.audit_batch(resume_texts)
 
 def main():
     try:
@@ -0,0 +1,150 @@
+# audit_rules.py
+import re
+import numpy as np
+
+from expert_tips import LEGACY_WEAK_PHRASES, POWER_VERBS
+
+# Every character str.isdigit accepts, like the original per-character check: \d covers the decimal digits
+# of every script, the ranges add the rest (superscripts, subscripts, circled and dingbat digits, ...).
+# Listing all 788 characters one by one makes re test them in turn and is ~20x slower.
+DIGIT_CLASS = (r"[\d\u00b2\u00b3\u00b9\u1369-\u1371\u19da\u2070\u2074-\u2079\u2080-\u2089\u2460-\u2468"
+               r"\u2474-\u247c\u2488-\u2490\u24ea\u24f5-\u24fd\u24ff\u2776-\u277e\u2780-\u2788\u278a-\u2792"
+               r"\U00010a40-\U00010a43\U00010e60-\U00010e68\U00011052-\U0001105a\U0001f100-\U0001f10a]")
+
+# --- 1. RULE DATA ---
+# Every health check is plain data. A rule looks at the terms found in the resume
+# (or at the word count) and either takes its penalty + issue or earns its strength.
+#   any   -> passes if at least one term is present     ({found} = terms present)
+#   none  -> passes if no term is present               ({found} = terms present)
+#   all   -> passes if every term is present            ({missing} = terms absent)
+#   range -> passes if min <= word count <= max
+# Literal terms are matched case-insensitively as substrings; optional "patterns" are raw regex,
+# each searched over the whole lowered text (one extra pass per pattern).
+HEALTH_RULES = [
+    {"name": "email", "check": "any", "terms": ["@"], "penalty": 20,
+     "issue": "❌ Missing Email Address", "strength": "✅ Email Detected"},
+    {"name": "numbers", "check": "any", "patterns": [DIGIT_CLASS], "penalty": 20,
+     "issue": "❌ No Phone Number or Metrics found"},
+    {"name": "weak_words", "check": "none", "terms": LEGACY_WEAK_PHRASES, "penalty": 15,
+     "issue": "⚠️ Weak words detected: {found}", "strength": "✅ Strong Action Verbs used"},
+    {"name": "length", "check": "range", "min": 200, "max": 2000, "penalty": 10,
+     "issue_low": "⚠️ Resume is too short (under 200 words)",
+     "issue_high": "⚠️ Resume is too long (over 2 pages)",
+     "strength": "✅ Optimal Word Count"},
+    {"name": "sections", "check": "all", "terms": ["experience", "education", "skills"], "penalty": 15,
+     "issue": "❌ Missing Sections: {missing}"},
+    # Strength only: no penalty and no issue, so the score is the same with or without it
+    {"name": "power_verbs", "check": "any", "terms": POWER_VERBS, "penalty": 0,
+     "strength": "✅ Power Verbs: {found}"},
+]
+
+# --- 2. COMPILER ---
+def _trie_alternatives(words):
+    """Folds words into a character trie, e.g. ["helped", "handled"] -> ["h(?:andled|elped)"]."""
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w: node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts: return ""
+        body = alts[0] if len(alts) == 1 and "" not in node else "(?:" + "|".join(alts) + ")"
+        return body + ("?" if "" in node else "")
+
+    return [re.escape(ch) + build(child) for ch, child in sorted(trie.items()) if ch]
+
+class RuleEngine:
+    """Compiles a rule list into a single regex pass over the resume text."""
+
+    def __init__(self, rules=None):
+        self.rules = list(HEALTH_RULES if rules is None else rules)
+        self.terms = []  # column order of the hit matrix
+        index = {}
+        for rule in self.rules:
+            for t in rule.get("terms", []):
+                index.setdefault(("lit", t.lower()), len(index))
+            for p in rule.get("patterns", []):
+                index.setdefault(("re", p), len(index))
+        self.terms = list(index)
+        self._rule_cols = [
+            [index[("lit", t.lower())] for t in r.get("terms", [])] + [index[("re", p)] for p in r.get("patterns", [])]
+            for r in self.rules
+        ]
+
+        # One flat alternation over every literal, folded into a character trie so each offset costs one
+        # branch per distinct first char. Matching is greedy (longest literal wins); shorter literals that
+        # are prefixes of a hit are credited too, and each search restarts one char after the last hit so
+        # overlapping terms are still seen. Patterns are searched in their own pass: inside the
+        # alternation they would stop re from skipping offsets that can't start a literal.
+        lits = sorted((i for i, t in enumerate(self.terms) if t[0] == "lit"), key=lambda i: -len(self.terms[i][1]))
+        pats = [i for i, t in enumerate(self.terms) if t[0] == "re"]
+        self._literal_cols = {self.terms[i][1]: [i] + [j for j in lits if j != i and self.terms[i][1].startswith(self.terms[j][1])]
+                              for i in lits}
+        self._pattern_cols = [(i, re.compile(self.terms[i][1])) for i in pats]
+        self._n_literals = len(lits)
+        self._scanner = re.compile("|".join(_trie_alternatives([self.terms[i][1] for i in lits]))) if lits else None
+
+    # --- SCAN ---
+    def scan(self, text):
+        """Returns (hit vector over self.terms, word count) for one resume."""
+        hits = np.zeros(len(self.terms), dtype=bool)
+        lowered, found = text.lower(), set()
+        if self._scanner is not None:
+            search, pos = self._scanner.search, 0
+            while len(found) < self._n_literals:
+                m = search(lowered, pos)
+                if m is None: break
+                found.update(self._literal_cols[m.group()])
+                pos = m.start() + 1
+        found.update(i for i, rx in self._pattern_cols if rx.search(lowered))
+        hits[list(found)] = True
+        return hits, len(text.split())
+
+    # --- EVALUATE ---
+    def _verdicts(self, hits, word_counts):
+        """Vectorized pass/fail per rule: returns (passed[n_docs, n_rules], too_long[n_docs, n_rules])."""
+        passed = np.ones((hits.shape[0], len(self.rules)), dtype=bool)
+        too_long = np.zeros_like(passed)
+        for r, (rule, cols) in enumerate(zip(self.rules, self._rule_cols)):
+            check = rule["check"]
+            if check == "any": passed[:, r] = hits[:, cols].any(axis=1)
+            elif check == "none": passed[:, r] = ~hits[:, cols].any(axis=1)
+            elif check == "all": passed[:, r] = hits[:, cols].all(axis=1)
+            elif check == "range":
+                too_long[:, r] = word_counts > rule["max"]
+                passed[:, r] = (word_counts >= rule["min"]) & ~too_long[:, r]
+            else:
+                raise ValueError(f"Unknown rule check: {check}")
+        return passed, too_long
+
+    def _report(self, hits, passed, too_long, score):
+        issues, strengths = [], []
+        for r, (rule, cols) in enumerate(zip(self.rules, self._rule_cols)):
+            found = ", ".join(self.terms[c][1] for c in cols if hits[c])
+            missing = ", ".join(self.terms[c][1] for c in cols if not hits[c]).title()
+            if passed[r]:
+                if rule.get("strength"): strengths.append(rule["strength"].format(found=found, missing=missing))
+            elif rule["check"] == "range":
+                issues.append(rule["issue_high"] if too_long[r] else rule["issue_low"])
+            elif rule.get("issue"):
+                issues.append(rule["issue"].format(found=found, missing=missing))
+        return {"score": int(score), "issues": issues, "strengths": strengths}
+
+    def audit(self, text):
+        return self.audit_batch([text])[0]
+
+    def audit_batch(self, texts):
+        """Audits many resumes: one scan each, then rule scoring as matrix ops over the whole batch."""
+        texts = list(texts)
+        hits = np.zeros((len(texts), len(self.terms)), dtype=bool)
+        word_counts = np.zeros(len(texts), dtype=np.int64)
+        for i, text in enumerate(texts):
+            hits[i], word_counts[i] = self.scan(text or "")
+        passed, too_long = self._verdicts(hits, word_counts)
+        penalties = np.array([rule.get("penalty", 0) for rule in self.rules])
+        scores = np.maximum(0, 100 - (~passed).astype(np.int64) @ penalties)
+        return [self._report(hits[i], passed[i], too_long[i], scores[i]) for i in range(len(texts))]
+
+DEFAULT_ENGINE = RuleEngine()
@@ -0,0 +1,194 @@
+# backup.py
+# Online backups of portfolio.db through SQLite's backup API, safe while Streamlit and queue workers write.
+# Pages are copied in batches; between batches the copier sleeps so writers never wait behind more than
+# one batch. Batches first run in their own read transactions, so WAL checkpoints carry on between them;
+# if other connections keep writing (each write restarts such a copy), the copy pins one read snapshot
+# instead, and stops pausing once the WAL has grown by MAX_WAL_GROWTH so the snapshot is let go sooner.
+#   python backup.py snapshot [--dir backups] [--keep-last 24] [--keep-daily 14]
+#   python backup.py schedule --every 3600 [...]        snapshot + prune forever
+#   python backup.py list
+#   python backup.py restore <snapshot.db | YYYY-MM-DDTHH:MM>
+import os
+import sys
+import time
+import sqlite3
+import argparse
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "portfolio.db")
+BACKUP_DIR = os.path.join(BASE_DIR, "backups")
+PAGES_PER_STEP = 1024  # 4 MB at the default page size
+STEP_PAUSE = 0.005     # seconds given back to writers between steps
+MAX_RESTARTS = 3       # restarts by concurrent writes before a copy pins its read snapshot
+MAX_WAL_GROWTH = 64 * 1024 * 1024  # bytes the WAL may grow behind a pinned copy before pauses stop
+STAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+class BackupError(Exception):
+    pass
+
+class _Restarted(Exception):
+    pass
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+def copy_database(src_path, dst_path, pages=PAGES_PER_STEP, pause=STEP_PAUSE, progress=None, max_restarts=MAX_RESTARTS):
+    """
+    Copies src into dst (created or overwritten) and returns {"pages", "bytes", "seconds", "restarts", "pinned"}.
+    Each batch takes its own short read lock, so checkpoints aren't held back and the WAL stays small, but
+    a commit from another connection restarts the copy from the first page. After max_restarts the source
+    read transaction is held for the rest of the copy instead, and the copy is the database as of then.
+    """
+    src, dst = _connect(src_path), _connect(dst_path)
+    dst_fd = os.open(dst_path, os.O_RDONLY)
+    wal_path = src_path + "-wal"
+    wal_size = lambda: os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+    t0 = time.perf_counter()
+    restarts, pinned = 0, False
+    try:
+        while True:
+            state = {"done": 0, "pause": pause, "wal_start": wal_size()}
+            def step(status, remaining, total):
+                done = total - remaining
+                if not pinned and done <= state["done"]: raise _Restarted()
+                state["done"] = done
+                if progress: progress(done, total)
+                if pinned and state["pause"] and wal_size() - state["wal_start"] > MAX_WAL_GROWTH: state["pause"] = 0
+                if remaining and state["pause"]:
+                    # Flushing each batch as it lands keeps the final commit from dumping the whole copy
+                    # on the disk at once, which would stall every writer's fsync behind it.
+                    os.fsync(dst_fd)
+                    time.sleep(state["pause"])
+            if pinned:
+                src.execute("BEGIN")
+                src.execute("SELECT count(*) FROM sqlite_master").fetchone()  # pins the read snapshot
+            try:
+                src.backup(dst, pages=pages, progress=step)
+                break
+            except _Restarted:
+                restarts += 1
+                pinned = restarts >= max_restarts
+            finally:
+                if src.in_transaction: src.execute("COMMIT")
+        n_pages = dst.execute("PRAGMA page_count").fetchone()[0]
+        page_size = dst.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        os.close(dst_fd)
+        src.close()
+        dst.close()
+    return {"pages": n_pages, "bytes": n_pages * page_size, "seconds": time.perf_counter() - t0,
+            "restarts": restarts, "pinned": pinned}
+
+def verify(path):
+    conn = sqlite3.connect(path)
+    try:
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+    finally:
+        conn.close()
+    if result != "ok": raise BackupError(f"{path} failed quick_check: {result}")
+
+# --- 1. SNAPSHOTS ---
+def snapshot(db_path=DB_PATH, backup_dir=BACKUP_DIR, keep_last=24, keep_daily=14, **copy_kwargs):
+    """Writes a verified, timestamped copy, then applies retention. Returns the snapshot path and copy stats."""
+    os.makedirs(backup_dir, exist_ok=True)
+    name = f"{os.path.splitext(os.path.basename(db_path))[0]}-{datetime.now().strftime(STAMP_FORMAT)}.db"
+    path = os.path.join(backup_dir, name)
+    partial = path + ".partial"  # never leave a half-written file that looks like a snapshot
+    try:
+        stats = copy_database(db_path, partial, **copy_kwargs)
+        verify(partial)
+    except Exception:
+        if os.path.exists(partial): os.remove(partial)
+        raise
+    os.replace(partial, path)
+    prune(backup_dir, keep_last, keep_daily)
+    return path, stats
+
+def list_snapshots(backup_dir=BACKUP_DIR):
+    """(taken_at, path) pairs, oldest first."""
+    if not os.path.isdir(backup_dir): return []
+    found = []
+    for name in os.listdir(backup_dir):
+        if not name.endswith(".db"): continue
+        try:
+            found.append((datetime.strptime(name[-18:-3], STAMP_FORMAT), os.path.join(backup_dir, name)))
+        except ValueError:
+            continue
+    return sorted(found)
+
+def prune(backup_dir=BACKUP_DIR, keep_last=24, keep_daily=14):
+    """Keeps the newest keep_last snapshots plus the newest one of each of the last keep_daily days."""
+    snaps = list_snapshots(backup_dir)
+    keep = {path for _, path in snaps[-keep_last:]} if keep_last else set()
+    days = {}
+    for taken, path in snaps: days[taken.date()] = path
+    keep |= {days[d] for d in sorted(days)[-keep_daily:]} if keep_daily else set()
+    removed = [path for _, path in snaps if path not in keep]
+    for path in removed: os.remove(path)
+    return removed
+
+def run_schedule(every, **snapshot_kwargs):
+    while True:
+        started = time.monotonic()
+        try:
+            path, stats = snapshot(**snapshot_kwargs)
+            print(f"✅ {path} ({stats['bytes'] / 1e6:.1f} MB in {stats['seconds']:.1f}s)")
+        except Exception as e:
+            print(f"❌ Snapshot failed: {e}")
+        time.sleep(max(0.0, every - (time.monotonic() - started)))
+
+# --- 2. RESTORE ---
+def snapshot_at(when, backup_dir=BACKUP_DIR):
+    """The newest snapshot taken at or before `when`."""
+    candidates = [path for taken, path in list_snapshots(backup_dir) if taken <= when]
+    if not candidates: raise BackupError(f"No snapshot at or before {when:%Y-%m-%d %H:%M:%S}")
+    return candidates[-1]
+
+def restore(snapshot_path, db_path=DB_PATH, safety_copy=True, **copy_kwargs):
+    """
+    Copies a snapshot back over the live database through the backup API, so open connections
+    see the restored data on their next transaction instead of a file swapped under them.
+    The current state is snapshotted first unless safety_copy is False.
+    """
+    verify(snapshot_path)
+    safety = None
+    if safety_copy and os.path.exists(db_path):
+        safety, _ = snapshot(db_path, os.path.join(os.path.dirname(snapshot_path), "pre-restore"), keep_last=5, keep_daily=0)
+    stats = copy_database(snapshot_path, db_path, pages=-1, pause=0, **copy_kwargs)
+    return safety, stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Online backups for portfolio.db")
+    parser.add_argument("command", choices=["snapshot", "schedule", "list", "restore"])
+    parser.add_argument("target", nargs="?", help="restore: snapshot file or a YYYY-MM-DDTHH:MM point in time")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--dir", default=BACKUP_DIR)
+    parser.add_argument("--keep-last", type=int, default=24)
+    parser.add_argument("--keep-daily", type=int, default=14)
+    parser.add_argument("--every", type=float, default=3600, help="schedule: seconds between snapshots")
+    args = parser.parse_args(argv)
+    retention = {"keep_last": args.keep_last, "keep_daily": args.keep_daily}
+
+    if args.command == "snapshot":
+        path, stats = snapshot(args.db, args.dir, **retention)
+        print(f"✅ {path} ({stats['bytes'] / 1e6:.1f} MB in {stats['seconds']:.1f}s)")
+    elif args.command == "schedule":
+        run_schedule(args.every, db_path=args.db, backup_dir=args.dir, **retention)
+    elif args.command == "list":
+        for taken, path in list_snapshots(args.dir):
+            print(f"{taken:%Y-%m-%d %H:%M:%S}  {os.path.getsize(path) / 1e6:8.1f} MB  {path}")
+    else:
+        if not args.target: parser.error("restore needs a snapshot file or a point in time")
+        try:
+            source = args.target if os.path.exists(args.target) else snapshot_at(datetime.fromisoformat(args.target), args.dir)
+            safety, stats = restore(source, args.db)
+        except BackupError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ Restored {source} in {stats['seconds']:.1f}s" + (f" (previous state saved to {safety})" if safety else ""))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -42,3 +42,10 @@ CAREER_CLUSTERS = {
                      "process improvement", "cross-functional leadership"]
     }
 }
+
+def rank_career_clusters(text):
+    """(cluster, points) for every cluster, best fit first: one point per keyword found in the text."""
+    text = text.lower()
+    scores = [(role, sum(1 for k in d['keywords'] if k in text)) for role, d in CAREER_CLUSTERS.items()]
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores
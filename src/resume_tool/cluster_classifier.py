@@ -0,0 +1,168 @@
+# cluster_classifier.py
+# Career-cluster classifier: hashing vectorizer + multinomial logistic regression, trained offline on
+# resumes labelled with CAREER_CLUSTERS names, then temperature-scaled on a held-out split so the
+# probabilities can be shown as-is.
+# Build offline:  python cluster_classifier.py build <corpus.jsonl> [out_dir]   lines: {"cluster", "resume" | "text"}
+# The weights are saved as .npy and memory-mapped at serving time: loading is instant in every worker,
+# and a batch only reads the weight rows of the hashed terms it contains.
+import os
+import re
+import sys
+import json
+import time
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from sklearn.utils.murmurhash import murmurhash3_32
+
+from career_data import CAREER_CLUSTERS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CLASSIFIER_DIR = os.path.join(BASE_DIR, "data", "clusters")
+
+N_FEATURES = 2 ** 18  # the weight matrix is N_FEATURES x n_clusters float32 (8 MB for 8 clusters)
+HOLDOUT = 0.2
+# Only ever softened: on separable training data held-out loss keeps falling as T -> 0, which would turn
+# the near-zero logits of an unusual resume into a confident answer
+TEMPERATURES = np.exp(np.linspace(0, np.log(10), 100))
+CACHE_TERMS = 200_000  # memoized word -> hash entries (a few tens of MB at most)
+BIGRAM_MIX = 1_000_003
+_TOKEN = re.compile(r"\w\w+")
+
+def words(text):
+    """Lowercased words of 2+ characters, English stop words removed (sklearn's word analyzer)."""
+    return [w for w in _TOKEN.findall(text.lower()) if w not in ENGLISH_STOP_WORDS]
+
+class HashedFeatures:
+    """
+    Stateless hashing vectorizer over unigrams and bigrams: l2-normalized term presence, so a bullet
+    repeated 40 times counts once, like a keyword hit. Word hashes are memoized and a bigram's column is
+    mixed from its two word hashes in numpy, because building and hashing bigram strings one by one was
+    most of sklearn's HashingVectorizer time.
+    """
+    def __init__(self, n_features=N_FEATURES):
+        self.n_features = n_features
+        self._hashes = {}
+
+    def _hash(self, word):
+        if len(self._hashes) >= CACHE_TERMS: self._hashes.clear()
+        h = self._hashes[word] = abs(murmurhash3_32(word, seed=0))
+        return h
+
+    def columns(self, text):
+        """Sorted unique feature columns of one text."""
+        ws = words(text)
+        hashes = list(map(self._hashes.get, ws))
+        if None in hashes: hashes = [self._hash(w) if h is None else h for w, h in zip(ws, hashes)]
+        uni = np.array(hashes, dtype=np.int64)
+        return np.unique(np.concatenate([uni, (uni[:-1] * BIGRAM_MIX) ^ uni[1:]]) % self.n_features).astype(np.int32)
+
+    def transform(self, texts):
+        indices = [self.columns(t) for t in texts]
+        indptr = np.concatenate([[0], np.cumsum([len(c) for c in indices])])
+        data = np.concatenate([np.full(len(c), 1 / np.sqrt(max(len(c), 1)), dtype=np.float32) for c in indices] or [np.zeros(0, np.float32)])
+        return csr_matrix((data, np.concatenate(indices or [np.zeros(0, np.int32)]), indptr),
+                          shape=(len(indices), self.n_features))
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    e = np.exp(logits)
+    return e / e.sum(axis=1, keepdims=True)
+
+def iter_labelled(path, field="resume"):
+    """(text, cluster) from a .jsonl corpus (benchmarks/corpus.py export); unknown clusters are skipped."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip(): continue
+            item = json.loads(line)
+            if item.get("cluster") in CAREER_CLUSTERS:
+                yield item.get(field) or item.get("text", ""), item["cluster"]
+
+# --- 1. OFFLINE BUILDER ---
+def build_model(texts, labels, out_dir=CLASSIFIER_DIR, n_features=N_FEATURES, seed=42):
+    """Fits the model, calibrates its temperature on a held-out split and saves it. Returns the meta dict."""
+    from sklearn.linear_model import LogisticRegression
+
+    texts, labels = list(texts), list(labels)
+    classes = [c for c in CAREER_CLUSTERS if c in set(labels)]
+    if len(classes) < 2:
+        raise ValueError(f"need documents from at least 2 career clusters to train, got {classes or 'none'}")
+    y = np.array([classes.index(l) for l in labels])
+    X = HashedFeatures(n_features).transform(texts)
+    order = np.random.default_rng(seed).permutation(len(texts))
+    n_hold = int(len(texts) * HOLDOUT) if len(texts) >= 50 else 0
+    hold, train = order[:n_hold], order[n_hold:]
+
+    t0 = time.perf_counter()
+    model = LogisticRegression(C=10.0, max_iter=1000).fit(X[train], y[train])
+    fit_s = time.perf_counter() - t0
+    # With two classes sklearn keeps one weight vector for the second class; serving expects a column
+    # per class, and softmax over [-z/2, z/2] equals the binary model's sigmoid(z)
+    coef, intercept = model.coef_, model.intercept_
+    if len(classes) == 2: coef, intercept = np.vstack([-coef, coef]) / 2, np.concatenate([-intercept, intercept]) / 2
+
+    # Temperature scaling: one scalar that minimizes held-out log loss, so 0.7 means right ~70% of the time
+    temperature, holdout = 1.0, {}
+    if n_hold:
+        logits = X[hold] @ coef.T + intercept
+        nll = [-np.log(_softmax(logits / t)[np.arange(n_hold), y[hold]] + 1e-12).mean() for t in TEMPERATURES]
+        temperature = float(TEMPERATURES[int(np.argmin(nll))])
+        probs = _softmax(logits / temperature)
+        holdout = {"n": n_hold, "accuracy": round(float((probs.argmax(axis=1) == y[hold]).mean()), 4),
+                   "log_loss": round(float(min(nll)), 4)}
+
+    os.makedirs(out_dir, exist_ok=True)
+    # Transposed so a document's hashed term ids index contiguous rows
+    np.save(os.path.join(out_dir, "coef.npy"), np.ascontiguousarray(coef.T, dtype=np.float32))
+    np.save(os.path.join(out_dir, "intercept.npy"), intercept.astype(np.float32))
+    meta = {"classes": classes, "n_features": n_features, "temperature": temperature, "n_docs": len(texts),
+            "holdout": holdout, "fit_s": round(fit_s, 2), "built_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+    with open(os.path.join(out_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+# --- 2. SERVING ---
+class ClusterClassifier:
+    def __init__(self, model_dir=CLASSIFIER_DIR):
+        self.coef = np.load(os.path.join(model_dir, "coef.npy"), mmap_mode="r")
+        self.intercept = np.load(os.path.join(model_dir, "intercept.npy"))
+        with open(os.path.join(model_dir, "meta.json")) as f:
+            meta = json.load(f)
+        self.classes = meta["classes"]
+        self.temperature = meta["temperature"]
+        self.vectorizer = HashedFeatures(meta["n_features"])
+
+    def predict_proba(self, texts):
+        """(n_texts, n_clusters) calibrated probabilities, columns in self.classes order."""
+        X = self.vectorizer.transform(texts)
+        return _softmax((X @ self.coef + self.intercept) / self.temperature)
+
+    def top_k(self, texts, k=3):
+        """Per text, the k most likely clusters as (cluster, probability)."""
+        probs = self.predict_proba(texts)
+        k = min(k, len(self.classes))
+        best = np.argpartition(-probs, k - 1, axis=1)[:, :k]
+        best = np.take_along_axis(best, np.argsort(-np.take_along_axis(probs, best, axis=1), axis=1), axis=1)
+        return [[(self.classes[j], float(probs[i, j])) for j in row] for i, row in enumerate(best)]
+
+    def rank(self, text):
+        """Same shape as career_data.rank_career_clusters, scored by probability instead of hits."""
+        return self.top_k([text], len(self.classes))[0]
+
+_MODEL = None
+
+def get_cluster_classifier():
+    """Lazily maps the default model; returns None if it hasn't been built."""
+    global _MODEL
+    if _MODEL is None and os.path.exists(os.path.join(CLASSIFIER_DIR, "meta.json")):
+        _MODEL = ClusterClassifier()
+    return _MODEL
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("Usage: python cluster_classifier.py build <corpus.jsonl> [out_dir]")
+        sys.exit(1)
+    pairs = list(iter_labelled(sys.argv[2]))
+    meta = build_model([t for t, _ in pairs], [c for _, c in pairs], sys.argv[3] if len(sys.argv) > 3 else CLASSIFIER_DIR)
+    print(f"✅ Built cluster classifier: {meta['n_docs']} docs, {len(meta['classes'])} clusters, "
+          f"held-out accuracy {meta['holdout'].get('accuracy', 'n/a')}, temperature {meta['temperature']:.2f}")
@@ -0,0 +1,346 @@
+# corpus_store.py
+# Append-only on-disk store for job descriptions, for corpus-scale scoring.
+#   docs-<gen>.bin   normalized JD text (UTF-8) followed by its metadata (compact JSON), record after record
+#   index-<gen>.bin  16-byte header (magic, version, row size, lowest unused id) + one INDEX_DTYPE row per document
+#   CURRENT          the live generation; compaction writes the next one and swaps this file atomically
+# Readers memory-map both files, so opening costs the same at 1M documents as at 10, and doc bytes are
+# zero-copy slices of the page cache shared by every worker. Documents keep their id across compactions.
+#   python corpus_store.py add <file.txt|corpus.jsonl> [...]    jsonl lines: {"text", ...metadata}
+#   python corpus_store.py get <doc_id>
+#   python corpus_store.py delete <doc_id> [...]
+#   python corpus_store.py compact
+#   python corpus_store.py stats
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import argparse
+import unicodedata
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BASE_DIR, "data", "corpus")
+
+MAGIC = b"JDIX"
+VERSION = 1
+HEADER_SIZE = 16
+INDEX_DTYPE = np.dtype([("id", "<u8"), ("offset", "<u8"), ("length", "<u4"), ("meta_length", "<u4"),
+                        ("flags", "<u4"), ("added", "<u4")])  # 32 bytes
+DELETED = 1
+COPY_CHUNK = 1 << 20  # records copied per write during compaction, at most this many bytes at a time
+
+class CorpusStoreError(Exception):
+    pass
+
+def normalize_jd(text):
+    """NFKC, LF line endings, no trailing spaces, at most one blank line in a row."""
+    text = unicodedata.normalize("NFKC", text or "").replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+def _header(next_id=0):
+    # next_id survives compaction, so ids of documents compacted away are never handed out again
+    return MAGIC + np.array([VERSION, INDEX_DTYPE.itemsize], dtype="<u2").tobytes() + np.array([next_id], dtype="<u8").tobytes()
+
+def _files(path, gen):
+    return os.path.join(path, f"docs-{gen:06d}.bin"), os.path.join(path, f"index-{gen:06d}.bin")
+
+def _fsync_dir(path):
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try: os.fsync(fd)
+        finally: os.close(fd)
+
+class CorpusStore:
+    """
+    Any number of readers, one writer (writable=True; guarded by a lock file where fcntl exists).
+    Readers see appends and compactions made elsewhere after refresh().
+    """
+    def __init__(self, path=CORPUS_DIR, writable=False, durable=True):
+        self.path = path
+        self.writable = writable
+        self.durable = durable  # fsync after each append batch
+        self._lock = self._docs_f = self._index_f = None
+        self._data = self._index_map = None
+        if writable:
+            os.makedirs(path, exist_ok=True)
+            self._acquire_lock()
+            if not os.path.exists(os.path.join(path, "CURRENT")): self._create(1)
+        elif not os.path.exists(os.path.join(path, "CURRENT")):
+            raise CorpusStoreError(f"no corpus store at {path}")
+        self._open()
+
+    # --- 1. FILES ---
+    def _acquire_lock(self):
+        try:
+            import fcntl
+        except ImportError:
+            return
+        self._lock = open(os.path.join(self.path, "LOCK"), "a")
+        try:
+            fcntl.flock(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock.close()
+            raise CorpusStoreError(f"{self.path} is open for writing elsewhere")
+
+    def _create(self, gen):
+        docs, index = _files(self.path, gen)
+        open(docs, "wb").close()
+        with open(index, "wb") as f: f.write(_header())
+        self._set_current(gen)
+
+    def _set_current(self, gen):
+        tmp = os.path.join(self.path, "CURRENT.tmp")
+        with open(tmp, "w") as f:
+            f.write(str(gen))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.path, "CURRENT"))
+        _fsync_dir(self.path)
+
+    def _open(self):
+        with open(os.path.join(self.path, "CURRENT")) as f:
+            self.gen = int(f.read())
+        self.docs_path, self.index_path = _files(self.path, self.gen)
+        with open(self.index_path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+        if head[:4] != MAGIC or int.from_bytes(head[6:8], "little") != INDEX_DTYPE.itemsize:
+            raise CorpusStoreError(f"{self.index_path} is not a version {VERSION} index")
+        self._id_floor = int.from_bytes(head[8:16], "little")
+        if self.writable:
+            self._recover()
+            self._docs_f = open(self.docs_path, "ab")
+            self._index_f = open(self.index_path, "r+b")
+        self._map()
+
+    def _recover(self):
+        """Drops a torn tail left by a crash mid-append: a partial index row, then text no row points to."""
+        rows = (os.path.getsize(self.index_path) - HEADER_SIZE) // INDEX_DTYPE.itemsize
+        with open(self.index_path, "r+b") as f:
+            f.truncate(HEADER_SIZE + rows * INDEX_DTYPE.itemsize)
+            end = 0
+            if rows:
+                f.seek(HEADER_SIZE + (rows - 1) * INDEX_DTYPE.itemsize)
+                last = np.frombuffer(f.read(INDEX_DTYPE.itemsize), dtype=INDEX_DTYPE)[0]
+                end = int(last["offset"]) + int(last["length"]) + int(last["meta_length"])
+        with open(self.docs_path, "r+b") as f:
+            f.truncate(end)
+
+    def _map(self):
+        """(Re)maps both files at their current size. Old maps stay valid for views already handed out."""
+        self._index_size = os.path.getsize(self.index_path)
+        self._docs_size = os.path.getsize(self.docs_path)
+        self._index_map = self._mmap(self.index_path, self._index_size)
+        self._data = self._mmap(self.docs_path, self._docs_size)
+        # Lookups land anywhere in the file: without this hint every fault also reads ahead ~128 KB of
+        # neighbouring documents, which at 1M docs costs I/O and page cache for text nobody asked for
+        self._advise(mmap.MADV_RANDOM if hasattr(mmap, "MADV_RANDOM") else None)
+        n = (self._index_size - HEADER_SIZE) // INDEX_DTYPE.itemsize
+        self.index = np.frombuffer(self._index_map, dtype=INDEX_DTYPE, count=n, offset=HEADER_SIZE) if n else np.zeros(0, INDEX_DTYPE)
+
+    def _advise(self, advice):
+        if advice is not None and isinstance(self._data, mmap.mmap): self._data.madvise(advice)
+
+    @staticmethod
+    def _mmap(path, size):
+        if not size: return b""
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+    def refresh(self):
+        """Picks up appends, deletes and compactions made by the writer. Returns True if anything moved."""
+        with open(os.path.join(self.path, "CURRENT")) as f:
+            gen = int(f.read())
+        if gen != self.gen:
+            self._open()
+            return True
+        if os.path.getsize(self.index_path) != self._index_size:
+            self._map()
+            return True
+        return False
+
+    def close(self):
+        for f in (self._docs_f, self._index_f, self._lock):
+            if f: f.close()
+        self._docs_f = self._index_f = self._lock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 2. WRITING ---
+    def _require_writer(self):
+        if not self.writable: raise CorpusStoreError("store was opened read-only")
+
+    def extend(self, items, normalize=True):
+        """
+        Appends (text, metadata dict or None) pairs; returns their ids. Text goes to disk before the
+        index rows that point to it, so a reader (or a crash) never sees a row without its bytes.
+        """
+        self._require_writer()
+        next_id = max(self._id_floor, int(self.index["id"][-1]) + 1 if len(self.index) else 0)
+        offset, now = self._docs_size, int(time.time())
+        chunks, rows = [], []
+        for text, meta in items:
+            body = (normalize_jd(text) if normalize else text).encode("utf-8")
+            extra = json.dumps(meta, separators=(",", ":")).encode("utf-8") if meta else b""
+            chunks += [body, extra]
+            rows.append((next_id + len(rows), offset, len(body), len(extra), 0, now))
+            offset += len(body) + len(extra)
+        if not rows: return []
+        self._docs_f.write(b"".join(chunks))
+        self._docs_f.flush()
+        if self.durable: os.fsync(self._docs_f.fileno())
+        self._index_f.seek(0, os.SEEK_END)
+        self._index_f.write(np.array(rows, dtype=INDEX_DTYPE).tobytes())
+        self._index_f.flush()
+        if self.durable: os.fsync(self._index_f.fileno())
+        self._map()
+        return list(range(next_id, next_id + len(rows)))
+
+    def append(self, text, meta=None, normalize=True):
+        return self.extend([(text, meta)], normalize)[0]
+
+    def delete(self, doc_ids):
+        """Flags documents as deleted in place; their bytes stay until compact(). Returns how many were live."""
+        self._require_writer()
+        flagged = 0
+        for pos in self.positions(doc_ids):
+            flags = int(self.index["flags"][pos])
+            if flags & DELETED: continue
+            self._index_f.seek(HEADER_SIZE + pos * INDEX_DTYPE.itemsize + INDEX_DTYPE.fields["flags"][1])
+            self._index_f.write(np.array(flags | DELETED, dtype="<u4").tobytes())
+            flagged += 1
+        self._index_f.flush()
+        if self.durable: os.fsync(self._index_f.fileno())
+        return flagged
+
+    def compact(self):
+        """
+        Rewrites live documents into the next generation and switches CURRENT to it. Ids are kept;
+        readers keep their old mapping until they refresh(). Returns (kept, removed, bytes_freed).
+        """
+        self._require_writer()
+        live = self.index[(self.index["flags"] & DELETED) == 0]
+        docs, index = _files(self.path, self.gen + 1)
+        sizes = live["length"].astype(np.int64) + live["meta_length"]
+        rows = live.copy()
+        rows["offset"] = np.cumsum(sizes) - sizes
+        self._advise(getattr(mmap, "MADV_SEQUENTIAL", None))
+        with open(docs, "wb") as out:
+            batch, pending = [], 0
+            for off, size in zip(live["offset"].tolist(), sizes.tolist()):
+                batch.append(self._data[off:off + size])
+                pending += size
+                if pending >= COPY_CHUNK:
+                    out.write(b"".join(batch))
+                    batch, pending = [], 0
+            out.write(b"".join(batch))
+            out.flush()
+            os.fsync(out.fileno())
+        with open(index, "wb") as out:
+            next_id = max(self._id_floor, int(self.index["id"][-1]) + 1 if len(self.index) else 0)
+            out.write(_header(next_id) + rows.tobytes())
+            out.flush()
+            os.fsync(out.fileno())
+        total, old = len(self.index), (self.docs_path, self.index_path)
+        freed = self._docs_size - int(sizes.sum())
+        self._docs_f.close()
+        self._index_f.close()
+        self._set_current(self.gen + 1)
+        for p in old: os.remove(p)
+        self._open()
+        return len(live), total - len(live), freed
+
+    # --- 3. READING ---
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def live(self):
+        return int(np.count_nonzero((self.index["flags"] & DELETED) == 0))
+
+    def positions(self, doc_ids):
+        """Row positions of ids (ids increase with position, so this is a binary search)."""
+        doc_ids = np.atleast_1d(np.asarray(doc_ids, dtype=np.uint64))
+        pos = np.searchsorted(self.index["id"], doc_ids)
+        if len(doc_ids) and (pos.max() >= len(self.index) or (self.index["id"][pos] != doc_ids).any()):
+            raise KeyError(f"unknown doc id in {doc_ids.tolist()[:5]}")
+        return pos
+
+    def view(self, pos):
+        """Zero-copy bytes of the document text at row pos."""
+        row = self.index[pos]
+        off = int(row["offset"])
+        return memoryview(self._data)[off:off + int(row["length"])]
+
+    def text(self, doc_id):
+        pos = int(self.positions(doc_id)[0])
+        if self.index["flags"][pos] & DELETED: raise KeyError(f"doc {doc_id} was deleted")
+        return str(self.view(pos), "utf-8")
+
+    def meta(self, doc_id):
+        pos = int(self.positions(doc_id)[0])
+        row = self.index[pos]
+        start = int(row["offset"]) + int(row["length"])
+        raw = self._data[start:start + int(row["meta_length"])]
+        return {**(json.loads(raw) if raw else {}), "id": int(row["id"]), "added": int(row["added"])}
+
+    def texts(self, doc_ids):
+        """Texts of many ids; deleted ones come back as None."""
+        pos = self.positions(doc_ids)
+        return [None if self.index["flags"][p] & DELETED else str(self.view(p), "utf-8") for p in pos.tolist()]
+
+    def iter_live(self, batch=1024):
+        """(ids, texts) in storage order, batch by batch, deleted documents skipped."""
+        ids = self.index["id"][(self.index["flags"] & DELETED) == 0]
+        for i in range(0, len(ids), batch):
+            chunk = ids[i:i + batch]
+            yield chunk.tolist(), self.texts(chunk)
+
+    def stats(self):
+        return {"generation": self.gen, "documents": len(self.index), "live": self.live,
+                "deleted": len(self.index) - self.live, "data_bytes": self._docs_size, "index_bytes": self._index_size}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append-only JD corpus store")
+    parser.add_argument("command", choices=["add", "get", "delete", "compact", "stats"])
+    parser.add_argument("args", nargs="*")
+    parser.add_argument("--path", default=CORPUS_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command in ("get", "stats"):
+        store = CorpusStore(args.path)
+        if args.command == "get":
+            doc_id = int(args.args[0])
+            print(json.dumps(store.meta(doc_id)))
+            print(store.text(doc_id))
+        else:
+            print(json.dumps(store.stats(), indent=2))
+        return
+    with CorpusStore(args.path, writable=True) as store:
+        if args.command == "add":
+            items = []
+            for path in args.args:
+                with open(path, encoding="utf-8") as f:
+                    if path.endswith(".jsonl"):
+                        for line in f:
+                            if not line.strip(): continue
+                            item = json.loads(line)
+                            items.append((item.pop("text", ""), item))
+                    else:
+                        items.append((f.read(), {"source": os.path.basename(path)}))
+            ids = store.extend(items)
+            print(f"✅ Added {len(ids)} documents" + (f" (ids {ids[0]}-{ids[-1]})" if ids else ""))
+        elif args.command == "delete":
+            print(f"🗑️ Flagged {store.delete([int(a) for a in args.args])} documents; run compact to reclaim space")
+        else:
+            kept, removed, freed = store.compact()
+            print(f"✅ Compacted: kept {kept}, removed {removed}, freed {freed / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
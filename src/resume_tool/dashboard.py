@@ -1,18 +1,9 @@
 import streamlit as st
 import os
 import sys
-import io
-import re
+import hashlib
 import random # Added for "Smart" variation
-import fitz  # PyMuPDF
-from docx import Document 
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from fpdf import FPDF 
-import nltk
-try:
-    import spacy
-except (ImportError, OSError, Exception):
-    spacy = None
+from functools import partial
 
 # --- 1. CONFIG & STYLE ENGINE ---
 st.set_page_config(
@@ -70,99 +61,49 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
 # --- 2. LOAD LIBRARIES ---
+try:
+    from ats_auditor import get_nlp
+    from match_engine import IncrementalMatcher
+    from nlp_executor import get_executor
+    from resume_parser import extract_pdf, parse_contact_info, parse_resume_sections
+    from resume_export import reconstruct_resume_text, create_pdf, create_docx
+    import instrumentation
+    from career_data import CAREER_CLUSTERS, rank_career_clusters
+    from cluster_classifier import get_cluster_classifier
+    from expert_tips import get_expert_advice, INDUSTRY_TRANSLATORS, translate_text
+except ImportError:
+    st.error("⚠️ CRITICAL ERROR: Modules missing.")
+    st.stop()
+
 @st.cache_resource
 def load_nlp():
-    try: nltk.data.find('tokenizers/punkt')
-    except: nltk.download('punkt'); nltk.download('punkt_tab'); nltk.download('stopwords')
-    if spacy:
-        try: return spacy.load("en_core_web_sm")
-        except: return None
-    return None
+    # Loads the shared spaCy model once per process (no downloads; get_tokens falls back without it).
+    return get_nlp()
 
 nlp = load_nlp()
 
-try:
-    from ats_auditor import get_analysis_data
-    from career_data import CAREER_CLUSTERS
-    from expert_tips import get_expert_advice, INDUSTRY_TRANSLATORS
-except ImportError:
-    st.error("⚠️ CRITICAL ERROR: Modules missing.")
-    st.stop()
+@st.cache_resource
+def load_matcher():
+    # Shared across sessions: entries are keyed by section content, not by user.
+    return IncrementalMatcher()
 
-# --- 3. INTELLIGENT PARSER ---
-def parse_contact_info(text):
-    data = {"name": "", "email": "", "phone": "", "linkedin": ""}
-    lines = text.split('\n')
-    for line in lines[:5]:
-        if line.strip() and len(line) < 50: data['name'] = line.strip(); break
-    email = re.search(r'[\w\.-]+@[\w\.-]+', text)
-    if email: data['email'] = email.group(0)
-    phone = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-    if phone: data['phone'] = phone.group(0)
-    if "linkedin" in text.lower(): data['linkedin'] = "LinkedIn Profile"
-    return data
-
-def parse_resume_sections(text):
-    sections = {"summary": "", "skills": "", "experience": "", "education": ""}
-    lines = text.split('\n')
-    current_section = None
-    buffer = []
-    markers = {
-        "summary": ["professional summary", "profile", "summary", "objective"],
-        "skills": ["skills", "competencies", "technologies", "core competencies"],
-        "experience": ["experience", "work history", "employment", "professional experience"],
-        "education": ["education", "academic", "university", "college"]
-    }
-    for line in lines:
-        clean_line = line.strip().lower()
-        is_header = False
-        for section, keywords in markers.items():
-            if clean_line in keywords or (clean_line.endswith(":") and clean_line.strip(":") in keywords):
-                if current_section: sections[current_section] = "\n".join(buffer).strip()
-                current_section = section
-                buffer = []
-                is_header = True
-                break
-        if not is_header and current_section: buffer.append(line)
-    if current_section: sections[current_section] = "\n".join(buffer).strip()
-    return sections
-
-# --- 4. EXPORT ENGINE ---
-def reconstruct_resume_text(data):
-    full_text = f"{data['name']}\n{data['email']} | {data['phone']}\n"
-    if data['summary']: full_text += f"\nSummary:\n{data['summary']}\n"
-    if data['skills']: full_text += f"\nSkills:\n{data['skills']}\n"
-    if data['experience']: full_text += f"\nExperience:\n{data['experience']}\n"
-    if data['education']: full_text += f"\nEducation:\n{data['education']}\n"
-    return full_text
-
-def create_docx(data):
-    doc = Document()
-    doc.add_heading(data['name'], 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    doc.add_paragraph(f"{data['email']} | {data['phone']} | {data['linkedin']}").alignment = WD_ALIGN_PARAGRAPH.CENTER
-    if data['summary']: doc.add_heading('SUMMARY', 1); doc.add_paragraph(data['summary'])
-    if data['skills']: doc.add_heading('SKILLS', 1); doc.add_paragraph(data['skills'])
-    if data['experience']: doc.add_heading('EXPERIENCE', 1); doc.add_paragraph(data['experience'])
-    if data['education']: doc.add_heading('EDUCATION', 1); doc.add_paragraph(data['education'])
-    buffer = io.BytesIO(); doc.save(buffer); buffer.seek(0); return buffer
-
-def create_pdf(data):
-    pdf = FPDF(); pdf.add_page(); pdf.set_font("Arial", "B", 16)
-    pdf.cell(0, 10, data['name'], ln=True, align='C')
-    pdf.set_font("Arial", "", 10)
-    pdf.cell(0, 5, f"{data['email']} | {data['phone']} | {data['linkedin']}", ln=True, align='C'); pdf.ln(5)
-    def sect(t, b): 
-        if b: 
-            pdf.set_font("Arial","B",12); pdf.cell(0,8,t,ln=True,border='B'); pdf.ln(2)
-            pdf.set_font("Arial","",10); pdf.multi_cell(0,5,b.encode('latin-1','replace').decode('latin-1')); pdf.ln(3)
-    sect("SUMMARY", data['summary']); sect("SKILLS", data['skills']); sect("EXPERIENCE", data['experience']); sect("EDUCATION", data['education'])
-    return bytes(pdf.output())
-
-def extract_pdf(f): 
-    try: return "".join([p.get_text() for p in fitz.open(stream=f.read(), filetype="pdf")])
-    except: return None
-
-# --- 5. ROBUST AUTH SYSTEM ---
+@st.cache_resource
+def load_cluster_classifier():
+    # Memory-mapped weights, so every worker maps the same pages; None until the model is built.
+    return get_cluster_classifier()
+
+# --- 3. UPLOAD CACHE ---
+UPLOAD_CACHE_ENTRIES = 64  # distinct files kept across all sessions
+
+@st.cache_data(max_entries=UPLOAD_CACHE_ENTRIES, show_spinner=False)
+def process_upload(digest, _pdf_bytes):
+    # Keyed by `digest` only (the leading underscore keeps Streamlit from hashing the bytes again),
+    # so PyMuPDF and the parsers run once per distinct file instead of on every rerun.
+    text = extract_pdf(_pdf_bytes)
+    if not text: return None
+    return {"text": text, "contact": parse_contact_info(text), "sections": parse_resume_sections(text)}
+
+# --- 4. ROBUST AUTH SYSTEM ---
 def check_authentication():
     # If already authenticated, return True
     if st.session_state.get("authenticated", False):
@@ -184,13 +125,162 @@ def check_authentication():
                     st.error("Incorrect password.")
     return False
 
-# --- 6. SESSION STATE ---
+# --- 5. SESSION STATE ---
 if 'resume_data' not in st.session_state:
     st.session_state['resume_data'] = {"name":"", "email":"", "phone":"", "linkedin":"", "summary":"", "skills":"", "experience":"", "education":""}
 if 'resume_text' not in st.session_state: st.session_state['resume_text'] = ""
 if 'jd_text' not in st.session_state: st.session_state['jd_text'] = ""
 if 'missing_keywords' not in st.session_state: st.session_state['missing_keywords'] = []
 
+# --- 6. PANELS ---
+# Each panel is a keyed fragment: a widget inside one reruns only that fragment, and callbacks name the
+# panels their state change affects with st.rerun(keys). An edit in the Smart Editor repaints the preview
+# and the live score, not the sidebar upload handling, the other tabs or the export renders.
+EDITOR_FIELDS = {"name_input": "name", "summary_input": "summary", "exp_input": "experience", "skills_input": "skills"}
+
+def on_field_edit(key):
+    field = EDITOR_FIELDS[key]
+    st.session_state['resume_data'][field] = st.session_state[key]
+    st.rerun(["header", "preview", "audit"] if field == "name" else ["preview", "audit"])
+
+def set_experience(text):
+    # Programmatic edits also rerun the editor, so its text area shows them
+    st.session_state['resume_data']['experience'] = st.session_state['exp_input'] = text
+    st.rerun(["editor", "preview", "audit"])
+
+def on_add_bullet(kw):
+    # Mad Libs Generator
+    templates = [
+        f"• Leveraged {kw} to optimize operational workflows, increasing efficiency by 20%.",
+        f"• Spearheaded the integration of {kw}, resulting in improved data accuracy.",
+        f"• Collaborated with cross-functional teams to implement {kw} best practices."
+    ]
+    set_experience(st.session_state['resume_data']['experience'] + f"\n{random.choice(templates)}")
+
+def on_translate(target_industry):
+    st.session_state['translated_to'] = target_industry
+    set_experience(translate_text(st.session_state['resume_data']['experience'], target_industry))
+
+def on_scan():
+    data = load_matcher().score(st.session_state['resume_data'], st.session_state['jd_text'])
+    st.session_state['audit_score'] = data['match_score']
+    st.session_state['audit_feedback'] = data.get('feedback', [])
+    st.session_state['missing_keywords'] = data.get('missing_keywords', [])
+    st.session_state['common_keywords'] = data.get('common_keywords', [])
+    st.session_state['semantic_score'] = data.get('semantic_score')
+    # The editor's content generator offers the missing keywords
+    st.rerun(["audit", "editor"])
+
+@st.fragment(key="header")
+def header_panel():
+    st.markdown(f"## Welcome back, {st.session_state['resume_data']['name'] or 'Candidate'}")
+
+@st.fragment(key="pathfinder")
+def pathfinder_panel():
+    with st.container(border=True):
+        st.subheader("Industry Compatibility")
+        if st.button("🔍 Analyze My Fit"):
+            current_text = reconstruct_resume_text(st.session_state['resume_data'])
+            classifier = load_cluster_classifier()
+            
+            # Display as Cards
+            cols = st.columns(3)
+            if classifier:
+                for i, (role, prob) in enumerate(classifier.top_k([current_text], 3)[0]):
+                    with cols[i]:
+                        st.metric(label=role, value=f"{prob:.0%}")
+                        st.progress(prob)
+            else:
+                scores = rank_career_clusters(current_text)
+                for i, (role, score) in enumerate(scores[:3]):
+                    with cols[i]:
+                        st.metric(label=role, value=f"{score} pts")
+                        st.progress(min(score*10, 100)/100)
+
+@st.fragment(key="audit")
+def audit_panel():
+    with st.container(border=True):
+        st.subheader("ATS Intelligence")
+        
+        col_metric, col_advice = st.columns([1, 2])
+        
+        with col_metric:
+            st.button("🚀 Run Scan", use_container_width=True, on_click=on_scan)
+
+            # Circular Style Metric
+            score = st.session_state.get('audit_score', 0)
+            st.markdown(f"<h1 style='text-align: center; font-size: 80px; color: #0a66c2;'>{score}%</h1>", unsafe_allow_html=True)
+            st.markdown("<p style='text-align: center;'>Match Score</p>", unsafe_allow_html=True)
+            if st.session_state.get('semantic_score') is not None:
+                st.caption(f"🧠 Semantic similarity: {st.session_state['semantic_score']}%")
+            
+            # Live score: only sections edited since the last rerun get re-tokenized
+            if st.session_state['jd_text']:
+                live = load_matcher().score(st.session_state['resume_data'], st.session_state['jd_text'])
+                st.caption(f"⚡ Live score for current draft: {live['match_score']}%")
+
+        with col_advice:
+            if st.session_state.get('audit_feedback'):
+                st.write("### 🏥 Health Check")
+                for item in st.session_state['audit_feedback']: st.info(item)
+            elif st.session_state.get('missing_keywords'):
+                st.write("### ⚠️ Missing Keywords")
+                st.markdown("We found gaps in your profile. Go to the **Smart Editor** to add these:")
+                # Chip style display
+                st.markdown(" ".join([f"`{k}`" for k in st.session_state['missing_keywords'][:10]]))
+            else:
+                st.info("Run the scan to see insights.")
+
+@st.fragment(key="editor")
+def editor_panel():
+    st.subheader("✏️ Workspace")
+    
+    # SMART SUGGESTION ENGINE (THE "SMARTER" PART)
+    if st.session_state['missing_keywords']:
+        with st.expander("✨ AI Content Generator", expanded=True):
+            st.write("Click a missing keyword to generate a bullet point:")
+            kw_cols = st.columns(3)
+            for i, kw in enumerate(st.session_state['missing_keywords'][:6]):
+                kw_cols[i%3].button(f"+ {kw}", on_click=on_add_bullet, args=(kw,))
+
+    # PIVOT ENGINE
+    with st.expander("⚡ Industry Translator", expanded=False):
+        target_industry = st.selectbox("Pivot to:", ["Select...", "Sports Marketing", "Healthcare", "Tech", "Finance"])
+        if target_industry != "Select...":
+            st.button(f"Translate", on_click=on_translate, args=(target_industry,))
+        if st.session_state.pop('translated_to', None): st.success("Translation Complete")
+
+    # EDIT FIELDS (widget state is seeded from resume_data; a new upload clears it)
+    for key, field in EDITOR_FIELDS.items():
+        if key not in st.session_state: st.session_state[key] = st.session_state['resume_data'][field]
+    st.text_input("Full Name", key="name_input", on_change=on_field_edit, args=("name_input",))
+    st.text_area("Professional Summary", key="summary_input", on_change=on_field_edit, args=("summary_input",))
+    st.text_area("Experience (Bullets)", key="exp_input", height=300, on_change=on_field_edit, args=("exp_input",))
+    st.text_area("Skills", key="skills_input", on_change=on_field_edit, args=("skills_input",))
+
+@st.fragment(key="preview")
+def preview_panel():
+    st.subheader("📄 Live Preview")
+    # Visual Paper Container
+    st.markdown("""
+    <div style="background-color: white; color: black; padding: 40px; border: 1px solid #ddd; box-shadow: 2px 2px 10px rgba(0,0,0,0.1); min-height: 600px;">
+    """, unsafe_allow_html=True)
+    
+    d = st.session_state['resume_data']
+    st.markdown(f"<h2 style='text-align:center; color:black;'>{d['name']}</h2>", unsafe_allow_html=True)
+    st.markdown(f"<p style='text-align:center; color:#555;'>{d['email']} | {d['phone']} | {d['linkedin']}</p><hr>", unsafe_allow_html=True)
+    
+    if d['summary']: st.markdown(f"**SUMMARY**<br>{d['summary']}", unsafe_allow_html=True)
+    if d['skills']: st.markdown(f"<br>**SKILLS**<br>{d['skills']}", unsafe_allow_html=True)
+    if d['experience']: st.markdown(f"<br>**EXPERIENCE**<br>{d['experience'].replace(chr(10), '<br>')}", unsafe_allow_html=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Exports are built when a button is clicked, from the draft as it was when the preview last rendered
+    c1, c2 = st.columns(2)
+    with c1: st.download_button("⬇️ PDF", partial(create_pdf, dict(d)), "Resume.pdf", mime="application/pdf", use_container_width=True)
+    with c2: st.download_button("⬇️ DOCX", partial(create_docx, dict(d)), "Resume.docx", use_container_width=True)
+
 # --- 7. MAIN APP FLOW ---
 if check_authentication():
     
@@ -200,15 +290,21 @@ if check_authentication():
         st.markdown("---")
         uploaded = st.file_uploader("Upload Resume (PDF)", type="pdf")
         if uploaded:
-            text = extract_pdf(uploaded)
-            if text:
-                st.session_state['resume_text'] = text
-                # Smart Populate (Preserve edits)
-                if not st.session_state['resume_data']['name']:
-                    st.session_state['resume_data'].update(parse_contact_info(text))
-                    st.session_state['resume_data'].update(parse_resume_sections(text))
-                    if not st.session_state['resume_data']['experience']: 
-                        st.session_state['resume_data']['experience'] = text[300:] 
+            pdf_bytes = uploaded.getvalue()
+            digest = hashlib.sha256(pdf_bytes).hexdigest()
+            parsed = process_upload(digest, pdf_bytes)
+            if parsed:
+                if st.session_state.get('upload_digest') != digest:
+                    st.session_state['upload_digest'] = digest
+                    text = parsed['text']
+                    st.session_state['resume_text'] = text
+                    # Smart Populate (Preserve edits)
+                    if not st.session_state['resume_data']['name']:
+                        st.session_state['resume_data'].update(parsed['contact'])
+                        st.session_state['resume_data'].update(parsed['sections'])
+                        if not st.session_state['resume_data']['experience']: 
+                            st.session_state['resume_data']['experience'] = text[300:] 
+                        for key in EDITOR_FIELDS: st.session_state.pop(key, None)
                 st.success("✅ Profile Loaded")
         
         st.session_state['jd_text'] = st.text_area("Target Job Description", height=150, placeholder="Paste JD here to activate AI audit...")
@@ -217,10 +313,23 @@ if check_authentication():
             st.session_state["authenticated"] = False
             st.rerun()
 
+        # Admin: per-stage timings, only shown when profiling is on (RESUME_TOOL_PROFILE=1)
+        if instrumentation.is_enabled():
+            with st.expander("⏱️ Profiling"):
+                stats = instrumentation.snapshot()
+                if stats: st.dataframe([{"stage": k, **v} for k, v in stats.items()], hide_index=True)
+                else: st.caption("No timings recorded yet.")
+                c1, c2 = st.columns(2)
+                c1.download_button("JSON", instrumentation.to_json(), "timings.json")
+                c2.download_button("Prometheus", instrumentation.to_prometheus(), "timings.prom")
+                st.caption("NLP executor")
+                st.json(get_executor().stats(), expanded=False)
+                if st.button("Reset Timings"): instrumentation.reset()
+
     # --- MAIN CONTENT ---
     
     # Header
-    st.markdown(f"## Welcome back, {st.session_state['resume_data']['name'] or 'Candidate'}")
+    header_panel()
     
     if not st.session_state['resume_text']:
         st.info("👋 To begin, upload your PDF resume in the sidebar.")
@@ -229,127 +338,16 @@ if check_authentication():
         t1, t2, t3, t4 = st.tabs(["🔮 Career Pathfinder", "📊 Profile Audit", "🏗️ Smart Editor", "👨‍💻 Portfolio"])
 
         # TAB 1: PATHFINDER
-        with t1:
-            with st.container(border=True):
-                st.subheader("Industry Compatibility")
-                if st.button("🔍 Analyze My Fit"):
-                    current_text = reconstruct_resume_text(st.session_state['resume_data'])
-                    from career_data import CAREER_CLUSTERS
-                    scores = []
-                    for role, d in CAREER_CLUSTERS.items():
-                        s = sum(1 for k in d['keywords'] if k in current_text.lower())
-                        scores.append((role, s))
-                    scores.sort(key=lambda x: x[1], reverse=True)
-                    
-                    # Display as Cards
-                    cols = st.columns(3)
-                    for i, (role, score) in enumerate(scores[:3]):
-                        with cols[i]:
-                            st.metric(label=role, value=f"{score} pts")
-                            st.progress(min(score*10, 100)/100)
+        with t1: pathfinder_panel()
 
         # TAB 2: AUDITOR
-        with t2:
-            with st.container(border=True):
-                st.subheader("ATS Intelligence")
-                
-                col_metric, col_advice = st.columns([1, 2])
-                
-                with col_metric:
-                    if st.button("🚀 Run Scan", use_container_width=True):
-                        current_draft_text = reconstruct_resume_text(st.session_state['resume_data'])
-                        data = get_analysis_data(current_draft_text, st.session_state['jd_text'])
-                        st.session_state['audit_score'] = data['match_score']
-                        st.session_state['audit_feedback'] = data.get('feedback', [])
-                        st.session_state['missing_keywords'] = data.get('missing_keywords', [])
-                        st.session_state['common_keywords'] = data.get('common_keywords', [])
-
-                    # Circular Style Metric
-                    score = st.session_state.get('audit_score', 0)
-                    st.markdown(f"<h1 style='text-align: center; font-size: 80px; color: #0a66c2;'>{score}%</h1>", unsafe_allow_html=True)
-                    st.markdown("<p style='text-align: center;'>Match Score</p>", unsafe_allow_html=True)
-
-                with col_advice:
-                    if st.session_state.get('audit_feedback'):
-                        st.write("### 🏥 Health Check")
-                        for item in st.session_state['audit_feedback']: st.info(item)
-                    elif st.session_state.get('missing_keywords'):
-                        st.write("### ⚠️ Missing Keywords")
-                        st.markdown("We found gaps in your profile. Go to the **Smart Editor** to add these:")
-                        # Chip style display
-                        st.markdown(" ".join([f"`{k}`" for k in st.session_state['missing_keywords'][:10]]))
-                    else:
-                        st.info("Run the scan to see insights.")
+        with t2: audit_panel()
 
         # TAB 3: SMART EDITOR
         with t3:
             col_edit, col_prev = st.columns([1.2, 1])
-            
-            with col_edit:
-                st.subheader("✏️ Workspace")
-                
-                # SMART SUGGESTION ENGINE (THE "SMARTER" PART)
-                if st.session_state['missing_keywords']:
-                    with st.expander("✨ AI Content Generator", expanded=True):
-                        st.write("Click a missing keyword to generate a bullet point:")
-                        kw_cols = st.columns(3)
-                        for i, kw in enumerate(st.session_state['missing_keywords'][:6]):
-                            if kw_cols[i%3].button(f"+ {kw}"):
-                                # Mad Libs Generator
-                                templates = [
-                                    f"• Leveraged {kw} to optimize operational workflows, increasing efficiency by 20%.",
-                                    f"• Spearheaded the integration of {kw}, resulting in improved data accuracy.",
-                                    f"• Collaborated with cross-functional teams to implement {kw} best practices."
-                                ]
-                                st.session_state['resume_data']['experience'] += f"\n{random.choice(templates)}"
-                                st.rerun()
-
-                # PIVOT ENGINE
-                with st.expander("⚡ Industry Translator", expanded=False):
-                    target_industry = st.selectbox("Pivot to:", ["Select...", "Sports Marketing", "Healthcare", "Tech", "Finance"])
-                    if target_industry != "Select..." and st.button(f"Translate"):
-                        from expert_tips import INDUSTRY_TRANSLATORS
-                        dictionary = INDUSTRY_TRANSLATORS.get(target_industry, {})
-                        exp_text = st.session_state['resume_data']['experience']
-                        for old, new in dictionary.items():
-                            pattern = re.compile(r'\b' + re.escape(old) + r'\b', re.IGNORECASE)
-                            exp_text = pattern.sub(new.upper(), exp_text)
-                        st.session_state['resume_data']['experience'] = exp_text
-                        st.success("Translation Complete")
-
-                # EDIT FIELDS
-                st.text_input("Full Name", key="name_input", value=st.session_state['resume_data']['name'], 
-                              on_change=lambda: st.session_state['resume_data'].update({'name': st.session_state.name_input}))
-                
-                st.text_area("Professional Summary", key="summary_input", value=st.session_state['resume_data']['summary'],
-                             on_change=lambda: st.session_state['resume_data'].update({'summary': st.session_state.summary_input}))
-                
-                st.text_area("Experience (Bullets)", key="exp_input", value=st.session_state['resume_data']['experience'], height=300,
-                             on_change=lambda: st.session_state['resume_data'].update({'experience': st.session_state.exp_input}))
-                
-                st.text_area("Skills", key="skills_input", value=st.session_state['resume_data']['skills'],
-                             on_change=lambda: st.session_state['resume_data'].update({'skills': st.session_state.skills_input}))
-
-            with col_prev:
-                st.subheader("📄 Live Preview")
-                # Visual Paper Container
-                st.markdown("""
-                <div style="background-color: white; color: black; padding: 40px; border: 1px solid #ddd; box-shadow: 2px 2px 10px rgba(0,0,0,0.1); min-height: 600px;">
-                """, unsafe_allow_html=True)
-                
-                d = st.session_state['resume_data']
-                st.markdown(f"<h2 style='text-align:center; color:black;'>{d['name']}</h2>", unsafe_allow_html=True)
-                st.markdown(f"<p style='text-align:center; color:#555;'>{d['email']} | {d['phone']} | {d['linkedin']}</p><hr>", unsafe_allow_html=True)
-                
-                if d['summary']: st.markdown(f"**SUMMARY**<br>{d['summary']}", unsafe_allow_html=True)
-                if d['skills']: st.markdown(f"<br>**SKILLS**<br>{d['skills']}", unsafe_allow_html=True)
-                if d['experience']: st.markdown(f"<br>**EXPERIENCE**<br>{d['experience'].replace(chr(10), '<br>')}", unsafe_allow_html=True)
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-                
-                c1, c2 = st.columns(2)
-                with c1: st.download_button("⬇️ PDF", create_pdf(st.session_state['resume_data']), "Resume.pdf", use_container_width=True)
-                with c2: st.download_button("⬇️ DOCX", create_docx(st.session_state['resume_data']), "Resume.docx", use_container_width=True)
+            with col_edit: editor_panel()
+            with col_prev: preview_panel()
 
         # TAB 4: PORTFOLIO
         with t4:
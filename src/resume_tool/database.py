@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Force database to live in the same folder as this script
@@ -12,4 +12,22 @@ engine = create_engine(
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
\ No newline at end of file
+# WAL lets the dashboard keep reading while queue workers write; busy_timeout makes
+# competing writers wait for the lock instead of failing straight away.
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+Base = declarative_base()
+
+def init_db():
+    """Creates any missing tables, migrates existing ones in place, then installs the full-text search index."""
+    import models  # registers the mapped classes on Base
+    import migrations
+    import search_index
+    Base.metadata.create_all(bind=engine)
+    migrations.upgrade(engine)
+    search_index.install(engine)
\ No newline at end of file
@@ -1,4 +1,5 @@
 # expert_tips.py
+import re
 
 # 1. THE UNIVERSAL TRANSLATOR DICTIONARY
 # This maps "Generic/Tech" terms to "Industry Specific" terms.
@@ -84,6 +85,9 @@ WEAK_WORDS = [
     "handled", "participated in", "various", "hired to", "trying to"
 ]
 
+# The phrases the general health check has always penalized; its scores are calibrated on these
+LEGACY_WEAK_PHRASES = ["responsible for", "duties included", "helped", "worked on", "attempted"]
+
 POWER_VERBS = [
     "spearheaded", "orchestrated", "executed", "optimized", "accelerated", 
     "generated", "revitalized", "championed", "pioneered", "engineered"
@@ -120,17 +124,22 @@ EXPERT_INSIGHTS = {
     }
 }
 
+# Title words that point at each built-in pack; data/advice/*.json adds many more titles per pack
+EXPERT_TITLE_WORDS = {
+    "Sports Marketing": ["sport", "marketing", "brand"],
+    "Healthcare": ["nurse", "medical", "health", "clinical"],
+    "Software Engineer": ["developer", "engineer", "data", "tech"],
+}
+
+def translate_text(text, industry):
+    """Rewrites generic terms with the industry's vocabulary (whole words, case-insensitive)."""
+    for old, new in INDUSTRY_TRANSLATORS.get(industry, {}).items():
+        pattern = re.compile(r'\b' + re.escape(old) + r'\b', re.IGNORECASE)
+        text = pattern.sub(new.upper(), text)
+    return text
+
 def get_expert_advice(job_title_guess):
-    """Returns advice based on the detected industry."""
+    """Returns advice based on the detected industry (see advice_registry for how titles resolve)."""
     if not job_title_guess: return None
-    job_title_guess = job_title_guess.lower()
-    
-    # Simple mapping logic
-    if any(x in job_title_guess for x in ["sport", "marketing", "brand"]):
-        return EXPERT_INSIGHTS.get("Sports Marketing")
-    elif any(x in job_title_guess for x in ["nurse", "medical", "health", "clinical"]):
-        return EXPERT_INSIGHTS.get("Healthcare")
-    elif any(x in job_title_guess for x in ["developer", "engineer", "data", "tech"]):
-        return EXPERT_INSIGHTS.get("Software Engineer")
-    
-    return None
+    from advice_registry import get_registry
+    return get_registry().resolve(job_title_guess)
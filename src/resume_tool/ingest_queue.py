@@ -0,0 +1,217 @@
+# ingest_queue.py
+# Background JD ingestion: enqueue scraped/pasted postings on a durable SQLite-backed queue,
+# and let worker processes drain it in batches (clean -> tokenize -> score vs saved resumes).
+#   python ingest_queue.py enqueue <user_id> <file.txt> [...]
+#   python ingest_queue.py worker [--procs 2] [--batch 16]
+#   python ingest_queue.py stats
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import multiprocessing
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, delete, func
+
+from database import SessionLocal, engine, init_db
+from models import IngestJob, JobMatch, SavedResume, User
+
+MAX_PENDING = 1000       # backpressure: queued + processing jobs allowed before enqueue pushes back
+MAX_ATTEMPTS = 3         # after this many failures a job is parked as "dead"
+BATCH_SIZE = 16
+VISIBILITY_TIMEOUT = 300 # seconds a claimed job may stay "processing" before it's handed out again
+POLL_INTERVAL = 1.0
+DEDUP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "jd_signatures")
+
+class QueueFull(Exception):
+    pass
+
+def utcnow():
+    """Naive UTC, the form the DateTime columns store and are compared in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def dedup_path(user_id):
+    """Signatures are kept per user: another user's posting is never a reason to skip scoring this one."""
+    return os.path.join(DEDUP_DIR, f"user-{user_id}.npz")
+
+def content_hash(text):
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+# --- 1. PRODUCER SIDE ---
+def pending_count(db):
+    return db.scalar(select(func.count()).select_from(IngestJob).where(IngestJob.status.in_(["queued", "processing"])))
+
+def enqueue(db, user_id, jd_text, source="paste", block=False, timeout=30.0, dedup=None):
+    """
+    Adds a JD to the queue and returns the IngestJob. Raises QueueFull when the backlog is at
+    MAX_PENDING (or, with block=True, waits up to `timeout` seconds for workers to catch up).
+    An optional jd_dedup.JDDeduplicator holding this user's postings (see dedup_path) marks near-duplicates
+    so workers skip re-scoring them; a hit on another user's job is never treated as canonical.
+    """
+    deadline = time.monotonic() + timeout
+    while pending_count(db) >= MAX_PENDING:
+        if not block or time.monotonic() >= deadline:
+            raise QueueFull(f"Ingestion queue is full ({MAX_PENDING} pending)")
+        time.sleep(POLL_INTERVAL)
+
+    now = utcnow()
+    job = IngestJob(user_id=user_id, source=source, content_hash=content_hash(jd_text), jd_text=jd_text,
+                    status="queued", attempts=0, enqueued_at=now, available_at=now)
+    db.add(job)
+    db.flush()
+    if dedup is not None:
+        canonical = dedup.add(job.id, jd_text)
+        if canonical != job.id and db.scalar(select(IngestJob.user_id).where(IngestJob.id == canonical)) == user_id:
+            job.canonical_job_id = canonical
+            job.status = "duplicate"
+            job.finished_at = now
+    db.commit()
+    return job
+
+# --- 2. CONSUMER SIDE ---
+def claim_batch(db, batch_size=BATCH_SIZE):
+    """Atomically moves up to batch_size due jobs to "processing" and returns them."""
+    now = utcnow()
+    # Jobs whose worker died mid-batch go back on the queue
+    db.execute(update(IngestJob)
+               .where(IngestJob.status == "processing", IngestJob.started_at < now - timedelta(seconds=VISIBILITY_TIMEOUT))
+               .values(status="queued", available_at=now))
+    due = (select(IngestJob.id).where(IngestJob.status == "queued", IngestJob.available_at <= now)
+           .order_by(IngestJob.available_at, IngestJob.id).limit(batch_size))
+    ids = db.scalars(update(IngestJob).where(IngestJob.id.in_(due))
+                     .values(status="processing", started_at=now, attempts=IngestJob.attempts + 1)
+                     .returning(IngestJob.id)).all()
+    db.commit()
+    if not ids: return []
+    return db.scalars(select(IngestJob).where(IngestJob.id.in_(ids)).order_by(IngestJob.id)).all()
+
+def _resumes_for(db, user_id):
+    """(resume_id, resume_data) for every saved version, or the current draft if there are none."""
+    saved = db.scalars(select(SavedResume).where(SavedResume.user_id == user_id)).all()
+    out = []
+    for r in saved:
+        try: out.append((r.id, json.loads(r.data_dump or "{}")))
+        except ValueError: continue
+    if out: return out
+    user = db.get(User, user_id)
+    if not user: return []
+    return [(None, {"name": user.saved_name or "", "email": user.saved_email or "", "phone": user.saved_phone or "",
+                    "summary": user.saved_summary or "", "skills": user.saved_skills or "",
+                    "experience": user.saved_experience or "", "education": ""})]
+
+def process_batch(db, jobs, matcher):
+    """Scores each claimed JD against its owner's resumes; failures are retried with backoff."""
+    from ats_auditor import score_token_sets
+    resumes_by_user = {}
+    done = failed = 0
+    for job in jobs:
+        try:
+            if job.user_id not in resumes_by_user:
+                resumes_by_user[job.user_id] = _resumes_for(db, job.user_id)
+            j_tokens = set(matcher.tokens(job.jd_text or ""))
+            now = utcnow()
+            # A job re-claimed after the visibility timeout replaces its earlier matches instead of repeating them
+            db.execute(delete(JobMatch).where(JobMatch.job_id == job.id))
+            for resume_id, data in resumes_by_user[job.user_id]:
+                result = score_token_sets(matcher.resume_tokens(data), j_tokens)
+                db.add(JobMatch(job_id=job.id, user_id=job.user_id, resume_id=resume_id,
+                                match_score=float(result["match_score"]),
+                                common_keywords=json.dumps(result["common_keywords"]),
+                                missing_keywords=json.dumps(result["missing_keywords"]), created_at=now))
+            job.status, job.finished_at, job.last_error = "done", now, None
+            db.commit()
+            done += 1
+        except Exception as e:
+            db.rollback()
+            job = db.get(IngestJob, job.id)
+            job.last_error = str(e)
+            if job.attempts >= MAX_ATTEMPTS:
+                job.status, job.finished_at = "dead", utcnow()
+            else:
+                job.status = "queued"
+                job.available_at = utcnow() + timedelta(seconds=2 ** job.attempts)
+            db.commit()
+            failed += 1
+    return done, failed
+
+def run_worker(worker_id=0, batch_size=BATCH_SIZE, stop_event=None, max_idle=None):
+    """Drains the queue until stop_event is set (or after max_idle seconds without work)."""
+    from match_engine import IncrementalMatcher
+    engine.dispose(close=False)  # never reuse connections inherited from the parent process
+    matcher = IncrementalMatcher()  # resume sections stay cached across batches
+    idle_since = time.monotonic()
+    while not (stop_event and stop_event.is_set()):
+        with SessionLocal() as db:
+            jobs = claim_batch(db, batch_size)
+            if jobs:
+                done, failed = process_batch(db, jobs, matcher)
+                print(f"[worker {worker_id}] batch of {len(jobs)}: {done} done, {failed} failed")
+                idle_since = time.monotonic()
+                continue
+        if max_idle is not None and time.monotonic() - idle_since > max_idle: break
+        time.sleep(POLL_INTERVAL)
+
+def start_workers(n=2, batch_size=BATCH_SIZE):
+    stop = multiprocessing.Event()
+    procs = [multiprocessing.Process(target=run_worker, args=(i, batch_size, stop), daemon=True) for i in range(n)]
+    for p in procs: p.start()
+    return stop, procs
+
+# --- 3. METRICS ---
+def queue_stats(db):
+    """Depth per status, queue lag (age of the oldest due job) and recent throughput/latency."""
+    now = utcnow()
+    counts = dict(db.execute(select(IngestJob.status, func.count()).group_by(IngestJob.status)).all())
+    oldest = db.scalar(select(func.min(IngestJob.enqueued_at)).where(IngestJob.status == "queued", IngestJob.available_at <= now))
+    recent = db.execute(select(IngestJob.enqueued_at, IngestJob.started_at, IngestJob.finished_at)
+                        .where(IngestJob.status == "done", IngestJob.finished_at >= now - timedelta(seconds=60))).all()
+    latencies = sorted((f - e).total_seconds() for e, s, f in recent if e and f)
+    return {
+        "depth": counts,
+        "pending": counts.get("queued", 0) + counts.get("processing", 0),
+        "lag_seconds": (now - oldest).total_seconds() if oldest else 0.0,
+        "done_last_minute": len(recent),
+        "p50_end_to_end_seconds": latencies[len(latencies) // 2] if latencies else None,
+        "retries_pending": db.scalar(select(func.count()).select_from(IngestJob)
+                                     .where(IngestJob.status == "queued", IngestJob.attempts > 0)),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JD ingestion queue")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_enq = sub.add_parser("enqueue")
+    p_enq.add_argument("user_id", type=int)
+    p_enq.add_argument("files", nargs="+")
+    p_work = sub.add_parser("worker")
+    p_work.add_argument("--procs", type=int, default=2)
+    p_work.add_argument("--batch", type=int, default=BATCH_SIZE)
+    sub.add_parser("stats")
+    args = parser.parse_args(argv)
+
+    init_db()
+    if args.cmd == "enqueue":
+        from jd_dedup import JDDeduplicator
+        signatures = dedup_path(args.user_id)
+        dedup = JDDeduplicator.load(signatures) if os.path.exists(signatures) else JDDeduplicator()
+        with SessionLocal() as db:
+            for path in args.files:
+                with open(path, encoding="utf-8", errors="ignore") as f:
+                    job = enqueue(db, args.user_id, f.read(), source=os.path.basename(path), block=True, dedup=dedup)
+                print(f"{path}: job {job.id} ({job.status})")
+        os.makedirs(DEDUP_DIR, exist_ok=True)
+        dedup.save(signatures)
+    elif args.cmd == "worker":
+        stop, procs = start_workers(args.procs, args.batch)
+        try:
+            for p in procs: p.join()
+        except KeyboardInterrupt:
+            stop.set()
+            for p in procs: p.join()
+    else:
+        with SessionLocal() as db:
+            print(json.dumps(queue_stats(db), indent=2))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
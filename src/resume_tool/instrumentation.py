@@ -0,0 +1,114 @@
+# instrumentation.py
+# Lightweight per-stage timers: `with timer("stage"):` or `@timed("stage")`.
+# Off by default; set RESUME_TOOL_PROFILE=1 (or call enable()) to start collecting.
+# When off, a timed call costs one flag check and `timer()` hands back a shared no-op object.
+import os
+import json
+import time
+import threading
+import functools
+from collections import deque
+
+SAMPLE_WINDOW = 2048  # most recent samples kept per stage for the percentiles
+
+_enabled = os.environ.get("RESUME_TOOL_PROFILE", "") not in ("", "0")
+_lock = threading.Lock()
+_stages = {}
+
+class _Stage:
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+def is_enabled():
+    return _enabled
+
+def record(stage, seconds):
+    with _lock:
+        s = _stages.get(stage)
+        if s is None: s = _stages[stage] = _Stage()
+        s.count += 1
+        s.total += seconds
+        s.samples.append(seconds)
+
+def reset():
+    with _lock: _stages.clear()
+
+# --- TIMERS ---
+class _Timer:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.stage, time.perf_counter() - self.start)
+        return False
+
+class _NoopTimer:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+_NOOP = _NoopTimer()
+
+def timer(stage):
+    return _Timer(stage) if _enabled else _NOOP
+
+def timed(stage):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled: return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+# --- EXPORT ---
+def _percentile(sorted_samples, q):
+    if not sorted_samples: return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+def _collect():
+    """name -> (count, total, p50, p95, p99), all in seconds."""
+    with _lock:
+        stages = {name: (s.count, s.total, sorted(s.samples)) for name, s in _stages.items()}
+    return {name: (count, total, _percentile(samples, 0.50), _percentile(samples, 0.95), _percentile(samples, 0.99))
+            for name, (count, total, samples) in sorted(stages.items())}
+
+def snapshot():
+    """Per-stage count, total and p50/p95/p99 latency (ms, over the last SAMPLE_WINDOW calls)."""
+    ms = lambda seconds: round(seconds * 1000, 4)
+    return {
+        name: {"count": count, "total_ms": ms(total), "mean_ms": ms(total / count) if count else 0.0,
+               "p50_ms": ms(p50), "p95_ms": ms(p95), "p99_ms": ms(p99)}
+        for name, (count, total, p50, p95, p99) in _collect().items()
+    }
+
+def to_json():
+    return json.dumps(snapshot(), indent=2)
+
+def to_prometheus(metric="resume_tool_stage_seconds"):
+    """Prometheus text exposition format (summary type)."""
+    lines = [f"# HELP {metric} Time spent per pipeline stage.", f"# TYPE {metric} summary"]
+    for name, (count, total, p50, p95, p99) in _collect().items():
+        for q, value in (("0.5", p50), ("0.95", p95), ("0.99", p99)):
+            lines.append(f'{metric}{{stage="{name}",quantile="{q}"}} {value:.9f}')
+        lines.append(f'{metric}_sum{{stage="{name}"}} {total:.9f}')
+        lines.append(f'{metric}_count{{stage="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,116 @@
+# jd_dedup.py
+# Near-duplicate detection for ingested job descriptions (reposts, aggregators, Career Scout scrapes).
+# MinHash signatures over word shingles of clean_text output, bucketed with LSH so a lookup only
+# compares against postings that share at least one band instead of the whole collection.
+import zlib
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from ats_auditor import clean_text
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5  # words per shingle
+DEFAULT_THRESHOLD = 0.8  # estimated Jaccard at or above this collapses to one record
+_PRIME = np.uint64(4294967291)  # largest 32-bit prime; a * x + b stays below 2**64
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Word shingles; none for a text without a single content word (empty, boilerplate like "to be")."""
+    words = clean_text(text).split()
+    if all(w in ENGLISH_STOP_WORDS for w in words): return set()
+    if len(words) <= size: return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def lsh_params(threshold, num_perm):
+    """Picks (bands, rows) so the LSH S-curve crosses near the threshold, weighing false hits and misses equally."""
+    xs = np.linspace(0, 1, 201)
+    dx = xs[1] - xs[0]
+    best, best_err = (1, num_perm), float("inf")
+    for b in range(1, num_perm + 1):
+        r = num_perm // b
+        prob = 1 - (1 - xs ** r) ** b
+        err = (prob[xs < threshold].sum() + (1 - prob[xs >= threshold]).sum()) * dx
+        if err < best_err: best, best_err = (b, r), err
+    return best
+
+class JDDeduplicator:
+    """Postings are keyed by integer ids (IngestJob.id)."""
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+
+        # Compact storage: one uint32 row per posting (num_perm * 4 bytes), grown by doubling
+        self._signatures = np.zeros((64, num_perm), dtype=np.uint32)
+        self.ids = []
+        self.canonical = []  # canonical id per stored row
+        self._buckets = [{} for _ in range(self.bands)]
+
+    # --- SIGNATURES ---
+    def signature(self, text):
+        """MinHash signature, or None for a text with no shingles: all of those would share one
+        signature and collapse into a single "duplicate"."""
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles(text, self.shingle_size)), dtype=np.uint64)
+        if not len(hashes): return None
+        return ((np.outer(self._a, hashes) + self._b[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, sig):
+        return [sig[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    # --- LOOKUP ---
+    def find(self, text=None, sig=None):
+        """Returns (canonical_id, estimated_jaccard) of the closest stored near-duplicate, or None."""
+        sig = self.signature(text) if sig is None else sig
+        if sig is None: return None
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(sig)):
+            candidates.update(bucket.get(key, ()))
+        if not candidates: return None
+        rows = np.fromiter(candidates, dtype=np.int64)
+        sims = (self._signatures[rows] == sig).mean(axis=1)
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold: return None
+        return self.canonical[rows[best]], float(sims[best])
+
+    def add(self, jd_id, text):
+        """Indexes a posting and returns its canonical id (an earlier near-duplicate's, or its own)."""
+        sig = self.signature(text)
+        if sig is None: return jd_id  # nothing to compare; never indexed
+        match = self.find(sig=sig)
+        canonical = match[0] if match else jd_id
+        self._store(jd_id, canonical, sig)
+        return canonical
+
+    def _store(self, jd_id, canonical, sig):
+        row = len(self.ids)
+        if row == len(self._signatures):
+            self._signatures = np.resize(self._signatures, (row * 2, self.num_perm))
+        self._signatures[row] = sig
+        self.ids.append(jd_id)
+        self.canonical.append(canonical)
+        for bucket, key in zip(self._buckets, self._band_keys(sig)):
+            bucket.setdefault(key, []).append(row)
+
+    def dedupe(self, records):
+        """Batch helper: records are (jd_id, text). Returns {jd_id: canonical_id}."""
+        return {jd_id: self.add(jd_id, text) for jd_id, text in records}
+
+    # --- PERSISTENCE ---
+    # Plain numeric arrays only, so loading never unpickles anything; band buckets are rebuilt from the signatures
+    def save(self, path):
+        np.savez_compressed(path, signatures=self._signatures[:len(self.ids)],
+                            ids=np.array(self.ids, dtype=np.int64), canonical=np.array(self.canonical, dtype=np.int64),
+                            config=np.array([self.threshold, self.num_perm, self.shingle_size, self.seed]))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, allow_pickle=False)
+        threshold, num_perm, shingle_size, seed = data["config"]
+        dedup = cls(float(threshold), int(num_perm), int(shingle_size), int(seed))
+        for sig, jd_id, canonical in zip(data["signatures"], data["ids"].tolist(), data["canonical"].tolist()):
+            dedup._store(jd_id, canonical, sig)
+        return dedup
@@ -0,0 +1,101 @@
+# keyword_weights.py
+# Corpus-derived IDF weights for ranking keyword gaps.
+# Build offline:  python keyword_weights.py build <corpus_dir_or_jsonl> [out_dir]
+# At runtime the arrays are memory-mapped, so loading is instant and lookups touch only the pages they need.
+import os
+import sys
+import json
+import time
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WEIGHTS_DIR = os.path.join(BASE_DIR, "data", "idf")
+
+# --- 1. OFFLINE BUILDER ---
+def iter_corpus(path):
+    """Yields JD texts from a folder of .txt files or a .jsonl file with a "text" field."""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".txt"):
+                with open(os.path.join(path, name), encoding="utf-8", errors="ignore") as f:
+                    yield f.read()
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip(): yield json.loads(line).get("text", "")
+
+def build_from_token_sets(token_sets, out_dir=WEIGHTS_DIR):
+    """Writes idf.npy (float32), vocab.npy (sorted fixed-width bytes) and meta.json."""
+    df, n_docs = {}, 0
+    for tokens in token_sets:
+        n_docs += 1
+        for t in tokens: df[t] = df.get(t, 0) + 1
+
+    terms = sorted(df)
+    width = max((len(t) for t in terms), default=1)
+    vocab = np.array([t.encode("ascii", "ignore") for t in terms], dtype=f"S{width}")
+    counts = np.array([df[t] for t in terms], dtype=np.float64)
+    idf = (np.log((1 + n_docs) / (1 + counts)) + 1).astype(np.float32)  # same smoothing as sklearn
+
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, "vocab.npy"), vocab)
+    np.save(os.path.join(out_dir, "idf.npy"), idf)
+    with open(os.path.join(out_dir, "meta.json"), "w") as f:
+        json.dump({"n_docs": n_docs, "n_terms": len(terms), "built_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+    return n_docs, len(terms)
+
+def build_idf(corpus_path, out_dir=WEIGHTS_DIR):
+    from ats_auditor import extract_keywords
+    return build_from_token_sets((extract_keywords(t) for t in iter_corpus(corpus_path)), out_dir)
+
+# --- 2. RUNTIME LOOKUP ---
+class KeywordWeights:
+    def __init__(self, weights_dir=WEIGHTS_DIR):
+        self.vocab = np.load(os.path.join(weights_dir, "vocab.npy"), mmap_mode="r")
+        self.idf = np.load(os.path.join(weights_dir, "idf.npy"), mmap_mode="r")
+        with open(os.path.join(weights_dir, "meta.json")) as f:
+            self.n_docs = json.load(f)["n_docs"]
+        # Terms the corpus never saw get the weight of a df=0 term: the rarest possible.
+        self.unseen_idf = float(np.log(1 + self.n_docs) + 1)
+
+    def weights(self, terms):
+        """Vectorized IDF lookup for a list of terms (binary search over the mapped vocab)."""
+        if not len(terms): return np.zeros(0, dtype=np.float32)
+        if not len(self.vocab): return np.full(len(terms), self.unseen_idf, dtype=np.float32)
+        keys = np.array([t.encode("ascii", "ignore") for t in terms], dtype=self.vocab.dtype)
+        pos = np.searchsorted(self.vocab, keys)
+        pos_clipped = np.minimum(pos, len(self.vocab) - 1)
+        found = (pos < len(self.vocab)) & (self.vocab[pos_clipped] == keys)
+        # Terms longer than the vocab width get truncated by the cast, so they can't match by accident.
+        found &= np.array([len(t) <= self.vocab.dtype.itemsize for t in terms])
+        return np.where(found, self.idf[pos_clipped], self.unseen_idf).astype(np.float32)
+
+    def weight(self, term):
+        return float(self.weights([term])[0])
+
+    def rank(self, terms):
+        """Rarest (highest IDF) first; ties alphabetical."""
+        terms = sorted(terms)
+        w = self.weights(terms)
+        return [terms[i] for i in np.argsort(-w, kind="stable")]
+
+_WEIGHTS = None
+
+def get_weights():
+    """Lazily maps the default weights; returns None if they haven't been built."""
+    global _WEIGHTS
+    if _WEIGHTS is None and os.path.exists(os.path.join(WEIGHTS_DIR, "idf.npy")):
+        _WEIGHTS = KeywordWeights()
+    return _WEIGHTS
+
+def rank_keywords(terms):
+    """Orders keyword gaps by IDF when weights exist, alphabetically otherwise."""
+    weights = get_weights()
+    return weights.rank(terms) if weights else sorted(terms)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("Usage: python keyword_weights.py build <corpus_dir_or_jsonl> [out_dir]")
+        sys.exit(1)
+    n_docs, n_terms = build_idf(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else WEIGHTS_DIR)
+    print(f"✅ Built IDF weights: {n_docs} docs, {n_terms} terms")
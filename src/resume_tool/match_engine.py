@@ -0,0 +1,76 @@
+# match_engine.py
+import hashlib
+import threading
+from collections import OrderedDict
+
+import ats_auditor
+from ats_auditor import score_token_sets, get_tokenizer_mode
+from nlp_executor import get_executor
+from semantic_matcher import get_semantic_model
+
+# Same section order reconstruct_resume_text uses for the full draft.
+SECTION_KEYS = ["summary", "skills", "experience", "education"]
+
+def split_sections(data):
+    """Breaks a resume_data dict into the independently cached pieces of the draft."""
+    sections = {"header": f"{data.get('name', '')}\n{data.get('email', '')} | {data.get('phone', '')}"}
+    for key in SECTION_KEYS:
+        sections[key] = data.get(key) or ""
+    return sections
+
+def content_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+class IncrementalMatcher:
+    """
+    Scores a draft against a JD from per-section token sets keyed by content hash.
+    Only sections whose text changed since the last scan go back through spaCy;
+    the rest come straight from the cache. Tokens are taken per section, so a
+    word's POS tag can't depend on the neighbouring section the way it can when
+    the whole draft is tokenized at once.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()  # (tokenizer mode, phrases on, content hash) -> frozenset of tokens
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def tokens(self, text):
+        # Tokens depend on the tokenizer mode and the phrase setting as well as the text; either can change at runtime
+        mode = get_tokenizer_mode()
+        key = (mode, ats_auditor.USE_PHRASES, content_hash(text))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+        # Tokenize outside the lock; threads racing on the same text share one run through the executor.
+        fresh = get_executor().tokens(text, mode) if text.strip() else frozenset()
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = fresh
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return fresh
+
+    def resume_tokens(self, data):
+        merged = set()
+        for text in split_sections(data).values():
+            merged |= self.tokens(text)
+        return merged
+
+    def score(self, data, jd_text):
+        """Same result shape as ats_auditor.get_analysis_data, built from merged cached sets."""
+        if not jd_text:
+            return {"match_score": 0, "common_keywords": [], "missing_keywords": []}
+        result = score_token_sets(self.resume_tokens(data), set(self.tokens(jd_text)))
+        semantic = get_semantic_model()
+        if semantic: result["semantic_score"] = semantic.similarity("\n".join(split_sections(data).values()), jd_text)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,141 @@
+# migrations.py
+# Versioned, in-place schema changes for portfolio.db, so schema drift no longer means deleting the file.
+# create_all only adds missing tables; anything that changes an existing table goes here as a numbered
+# step. Applied versions are recorded in schema_version and every step is written to be a no-op on a
+# database that create_all just built from the current models.
+#   python migrations.py status
+#   python migrations.py upgrade
+import sys
+import argparse
+from datetime import datetime, timezone
+
+from sqlalchemy import MetaData
+from sqlalchemy.schema import CreateTable
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy's DateTime stores values in SQLite
+LEGACY_FORMATS = ["%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M", "%d/%m/%Y", "%m/%d/%Y", "%b %d, %Y", "%d %b %Y", "%B %d, %Y"]
+
+def parse_timestamp(value):
+    """
+    Best-effort parse of a free-form created_at string, as naive UTC when it carries an offset. None when
+    nothing fits, and when the formats disagree: 03/04/2024 is 3 April or March 4 depending on who saved
+    it, so it isn't guessed.
+    """
+    if value is None: return None
+    value = str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    else:
+        return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+    readings = set()
+    for fmt in LEGACY_FORMATS:
+        try:
+            readings.add(datetime.strptime(value, fmt))
+        except ValueError:
+            continue
+    return readings.pop() if len(readings) == 1 else None
+
+def _columns(conn, table):
+    return {r[1]: (r[2] or "").upper() for r in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+
+# --- 1. STEPS ---
+def _typed_resume_timestamps(conn):
+    """
+    saved_resumes.created_at VARCHAR -> DATETIME, rebuilding the table (SQLite can't ALTER a column type).
+    Values that can't be read unambiguously keep their original text in created_at_raw.
+    """
+    if _columns(conn, "saved_resumes").get("created_at") == "DATETIME": return
+    from models import SavedResume, User
+
+    # The SQLite 12-step rebuild: build the new table beside the old one, copy, drop, rename. Renaming
+    # the *old* table instead would rewrite job_matches' foreign key to point at it.
+    table = SavedResume.__table__
+    scratch = MetaData()
+    User.__table__.to_metadata(scratch)  # lets the copied foreign key resolve
+    tmp = table.to_metadata(scratch, name="saved_resumes__new")
+    conn.execute(CreateTable(tmp))
+    rows = conn.exec_driver_sql("SELECT id, user_id, version_name, created_at, data_dump FROM saved_resumes").all()
+    conn.exec_driver_sql(
+        "INSERT INTO saved_resumes__new (id, user_id, version_name, created_at, created_at_raw, data_dump) VALUES (?, ?, ?, ?, ?, ?)",
+        [(r[0], r[1], r[2], _stored(ts), None if ts or not r[3] else str(r[3]), r[4])
+         for r, ts in ((r, parse_timestamp(r[3])) for r in rows)])
+    conn.exec_driver_sql("DROP TABLE saved_resumes")  # also drops its indexes and the search triggers (see upgrade)
+    conn.exec_driver_sql("ALTER TABLE saved_resumes__new RENAME TO saved_resumes")
+    for index in table.indexes: index.create(conn, checkfirst=True)
+
+def _stored(dt):
+    return dt.strftime(DATETIME_FORMAT) if dt else None
+
+def _history_indexes(conn):
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_saved_resumes_user_created ON saved_resumes (user_id, created_at)")
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_portfolio_projects_user_id ON portfolio_projects (user_id)")
+
+def _unique_job_matches(conn):
+    """Drops repeat rows written by a job that was claimed twice, then enforces one row per (job, resume)."""
+    conn.exec_driver_sql("DELETE FROM job_matches WHERE id NOT IN "
+                         "(SELECT max(id) FROM job_matches GROUP BY job_id, coalesce(resume_id, 0))")
+    conn.exec_driver_sql("CREATE UNIQUE INDEX IF NOT EXISTS ux_job_matches_job_resume ON job_matches (job_id, coalesce(resume_id, 0))")
+
+# (version, description, step). Append only; never renumber or edit a step that has shipped.
+MIGRATIONS = [
+    (1, "typed saved_resumes.created_at", _typed_resume_timestamps),
+    (2, "indexes for per-user history queries", _history_indexes),
+    (3, "one job_matches row per job and resume", _unique_job_matches),
+]
+HEAD = MIGRATIONS[-1][0]
+
+# --- 2. RUNNER ---
+def current_version(conn):
+    conn.exec_driver_sql("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY, description TEXT, applied_at TEXT)")
+    return conn.exec_driver_sql("SELECT coalesce(max(version), 0) FROM schema_version").scalar()
+
+def upgrade(engine, target=HEAD):
+    """
+    Applies every pending step up to target, each in its own transaction, and returns the versions applied.
+    BEGIN IMMEDIATE takes the write lock before the version is read, so two processes starting
+    at once apply each step exactly once. Table rebuilds drop the full-text search triggers, so
+    those are reinstalled afterwards.
+    """
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for version, description, step in MIGRATIONS:
+            if version > target: break
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                if current_version(conn) < version:
+                    step(conn)
+                    conn.exec_driver_sql("INSERT INTO schema_version VALUES (?, ?, ?)",
+                                         (version, description, datetime.now().strftime(DATETIME_FORMAT)))
+                    applied.append(version)
+                conn.exec_driver_sql("COMMIT")
+            except Exception:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+    if applied:
+        import search_index
+        search_index.install(engine)
+    return applied
+
+def status(engine):
+    with engine.begin() as conn:
+        version = current_version(conn)
+    return [(v, d, v <= version) for v, d, _ in MIGRATIONS]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schema migrations for portfolio.db")
+    parser.add_argument("command", choices=["status", "upgrade"])
+    args = parser.parse_args(argv)
+
+    from database import engine, init_db
+    if args.command == "upgrade":
+        before = {v for v, _, done in status(engine) if done}
+        init_db()
+        after = [v for v, _, done in status(engine) if done and v not in before]
+        print(f"✅ Schema at version {HEAD}" + (f" (applied {after})" if after else " (already up to date)"))
+    for version, description, done in status(engine):
+        print(f"  {'✔' if done else '·'} {version:3d}  {description}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 
@@ -28,7 +28,7 @@ class PortfolioProject(Base):
     __tablename__ = "portfolio_projects"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     
     title = Column(String, index=True)
     industry = Column(String)
@@ -42,14 +42,104 @@ class PortfolioProject(Base):
 
 class SavedResume(Base):
     __tablename__ = "saved_resumes"
+    # "Latest version for user" and version history are a single index range scan
+    __table_args__ = (Index("ix_saved_resumes_user_created", "user_id", "created_at"),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     
     version_name = Column(String) # e.g. "Software V1"
-    created_at = Column(String)
+    created_at = Column(DateTime)
+    created_at_raw = Column(String, nullable=True) # a pre-migration date that couldn't be read unambiguously
     
     # We store the full resume data as a JSON string for easy saving/loading
     data_dump = Column(Text) 
     
-    owner = relationship("User", back_populates="resumes")
\ No newline at end of file
+    owner = relationship("User", back_populates="resumes")
+
+class IngestJob(Base):
+    """One scraped or pasted JD waiting in (or done with) the ingestion queue."""
+    __tablename__ = "ingest_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    
+    source = Column(String, default="paste") # e.g. "paste", "scout"
+    content_hash = Column(String, index=True)
+    jd_text = Column(Text)
+    canonical_job_id = Column(Integer, nullable=True) # set when this JD is a near-duplicate
+    
+    # Queue state: queued -> processing -> done, or back to queued on retry, or dead after MAX_ATTEMPTS
+    status = Column(String, default="queued", index=True)
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text, nullable=True)
+    enqueued_at = Column(DateTime)
+    available_at = Column(DateTime, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    matches = relationship("JobMatch", back_populates="job")
+
+class JobMatch(Base):
+    """Score of one ingested JD against one of the user's saved resumes."""
+    __tablename__ = "job_matches"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("ingest_jobs.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    resume_id = Column(Integer, ForeignKey("saved_resumes.id"), nullable=True) # None = the current draft
+    
+    match_score = Column(Float)
+    common_keywords = Column(Text) # JSON list
+    missing_keywords = Column(Text) # JSON list
+    created_at = Column(DateTime)
+    
+    job = relationship("IngestJob", back_populates="matches")
+    # One row per (job, resume); the draft's NULL resume_id counts as a value here
+    __table_args__ = (Index("ux_job_matches_job_resume", "job_id", func.coalesce(resume_id, 0), unique=True),)
+
+class ApplicationPack(Base):
+    """Score, cover letter and interview questions for one posting, built by application_pipeline."""
+    __tablename__ = "application_packs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    resume_id = Column(Integer, ForeignKey("saved_resumes.id"), nullable=True)
+    job_id = Column(Integer, ForeignKey("ingest_jobs.id"), nullable=True) # when the JD came through the queue
+    
+    jd_hash = Column(String, index=True)
+    jd_text = Column(Text)
+    match_score = Column(Float)
+    rank = Column(Integer)
+    common_keywords = Column(Text) # JSON list
+    missing_keywords = Column(Text) # JSON list
+    cover_letter = Column(Text, nullable=True)
+    interview_questions = Column(Text, nullable=True) # JSON list
+    
+    # scored -> ready (or error); postings outside the top N stay "scored"
+    status = Column(String, default="scored", index=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime)
+    finished_at = Column(DateTime, nullable=True)
+
+class InterviewQuestion(Base):
+    """One interview question in the offline bank (question_bank.py), usually from a past model response."""
+    __tablename__ = "interview_questions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    question = Column(Text)
+    question_hash = Column(String, unique=True, index=True) # normalized text, so repeats aren't stored twice
+    cluster = Column(String, index=True) # best-fit CAREER_CLUSTERS entry of the JD it was asked for
+    source = Column(String, default="model") # e.g. "model", "import"
+    served = Column(Integer, default=0)
+    created_at = Column(DateTime)
+
+class QuestionKeyword(Base):
+    """Inverted index for the question bank: keyword -> question, weighted by where the keyword came from."""
+    __tablename__ = "question_keywords"
+    __table_args__ = (Index("ix_question_keywords_keyword", "keyword", "question_id"),)
+    
+    id = Column(Integer, primary_key=True)
+    question_id = Column(Integer, ForeignKey("interview_questions.id"), index=True)
+    keyword = Column(String)
+    weight = Column(Float, default=1.0)
\ No newline at end of file
@@ -0,0 +1,84 @@
+# nlp_executor.py
+# One shared gate in front of the NLP model for all Streamlit session threads.
+# Work runs on a small private pool (one thread by default, since a spaCy pipeline isn't meant
+# to be driven from several threads at once), and identical in-flight requests are coalesced by
+# content hash: when ten sessions scan the same popular JD, it is tokenized once and all ten wait
+# on the same future.
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import instrumentation
+import ats_auditor
+from ats_auditor import extract_keywords, get_tokenizer_mode
+
+class NLPExecutor:
+    def __init__(self, workers=1):
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nlp")
+        self._inflight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "computed": 0, "coalesced": 0, "errors": 0, "started": 0,
+                       "queue_wait_total": 0.0, "queue_wait_max": 0.0}
+
+    def submit(self, key, fn, *args):
+        """Runs fn(*args) on the pool, or joins the identical request already queued or running."""
+        with self._lock:
+            self._stats["submitted"] += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future
+            future = self._pool.submit(self._run, time.perf_counter(), fn, args)
+            self._inflight[key] = future
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    def _run(self, queued_at, fn, args):
+        wait = time.perf_counter() - queued_at
+        with self._lock:
+            self._stats["started"] += 1
+            self._stats["queue_wait_total"] += wait
+            self._stats["queue_wait_max"] = max(self._stats["queue_wait_max"], wait)
+        if instrumentation.is_enabled(): instrumentation.record("nlp.queue_wait", wait)
+        return fn(*args)
+
+    def _finish(self, key, future):
+        with self._lock:
+            if self._inflight.get(key) is future: del self._inflight[key]
+            self._stats["computed"] += 1
+            if future.exception() is not None: self._stats["errors"] += 1
+
+    # --- CALLS ---
+    def tokens(self, text, mode=None):
+        """extract_keywords(text) as a frozenset; blocks until the (possibly shared) result is ready."""
+        mode = mode or get_tokenizer_mode()
+        phrases = b"phrases" if ats_auditor.USE_PHRASES else b"words"
+        key = b"tokens\0" + mode.encode() + b"\0" + phrases + b"\0" + hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return self.submit(key, _tokenize, text, mode).result()
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats)
+            s["inflight"] = len(self._inflight)
+        s["queue_wait_mean_ms"] = round(s.pop("queue_wait_total") / max(1, s["started"]) * 1000, 3)
+        s["queue_wait_max_ms"] = round(s.pop("queue_wait_max") * 1000, 3)
+        return s
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+def _tokenize(text, mode):
+    return frozenset(extract_keywords(text, mode=mode))
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def get_executor():
+    """The process-wide executor every session shares."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None: _EXECUTOR = NLPExecutor()
+    return _EXECUTOR
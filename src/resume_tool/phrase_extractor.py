@@ -0,0 +1,130 @@
+# phrase_extractor.py
+# Multi-word keyword extraction ("machine learning", "patient care", "risk management") so matching
+# can treat a phrase as one keyword instead of a bag of fragments.
+# The phrase list (every CAREER_CLUSTERS keyword plus optional corpus-mined terms) is compiled once
+# per process into a word-level trie; one left-to-right pass per document finds the longest phrase
+# at each position, so the cost grows with document length, not with the number of phrases.
+# Noun chunks come from spaCy when a model is installed, taken from the Doc the tokenizer already
+# parsed. Without one, corpus terms are mined offline from runs of noun-ish words instead (too noisy
+# to apply per document):
+#   python phrase_extractor.py build <corpus_dir_or_jsonl> [min_count]   -> data/phrases.json
+import os
+import sys
+import json
+import threading
+from collections import Counter
+
+from ats_auditor import clean_text, fast_tokens, get_nlp
+from career_data import CAREER_CLUSTERS
+
+MAX_CHUNK_WORDS = 3
+_END = ""  # trie key marking the end of a phrase
+
+def cluster_phrases():
+    """Every multi-word keyword in CAREER_CLUSTERS, normalized like clean_text."""
+    return sorted({clean_text(k) for d in CAREER_CLUSTERS.values() for k in d["keywords"] if " " in clean_text(k)})
+
+def corpus_phrases(texts, min_count=5, max_phrases=50_000):
+    """Frequent 2-3 word runs of noun-ish words across a JD corpus."""
+    counts = Counter()
+    for text in texts:
+        counts.update(set(_noun_runs(clean_text(text).split())))
+    return [p for p, c in counts.most_common(max_phrases) if c >= min_count]
+
+def load_phrases(path):
+    """Extra phrases from a .json list or a one-phrase-per-line text file."""
+    with open(path, encoding="utf-8") as f:
+        items = json.load(f) if path.endswith(".json") else f.read().splitlines()
+    return [clean_text(p) for p in items if p.strip()]
+
+def _noun_runs(words):
+    """Maximal runs of noun-ish words (by the fast tokenizer's rules), cut into 2..MAX_CHUNK_WORDS grams."""
+    runs, current = [], []
+    for w in words + [""]:
+        if w and fast_tokens(w):
+            current.append(w)
+            continue
+        for n in range(2, min(len(current), MAX_CHUNK_WORDS) + 1):
+            runs.extend(" ".join(current[i:i + n]) for i in range(len(current) - n + 1))
+        current = []
+    return runs
+
+class PhraseExtractor:
+    def __init__(self, phrases=(), noun_chunks=True):
+        self.noun_chunks = noun_chunks
+        self._trie = {}
+        self.size = 0
+        for p in phrases: self.add(p)
+
+    def add(self, phrase):
+        words = clean_text(phrase).split()
+        if len(words) < 2: return
+        node = self._trie
+        for w in words: node = node.setdefault(w, {})
+        if _END not in node:
+            node[_END] = " ".join(words)
+            self.size += 1
+
+    def match(self, words):
+        """Longest known phrase at each position, scanning once; overlapping matches resume after the phrase."""
+        found, i, n = [], 0, len(words)
+        while i < n:
+            node, j, last = self._trie, i, None
+            while j < n and words[j] in node:
+                node = node[words[j]]
+                j += 1
+                if _END in node: last = (node[_END], j)
+            if last:
+                found.append(last[0])
+                i = last[1]
+            else:
+                i += 1
+        return found
+
+    def chunks(self, text=None, doc=None):
+        """spaCy noun chunks trimmed to their content words; empty without a model. Pass the Doc
+        ats_auditor.tokenize already built to skip parsing the text a second time."""
+        if doc is None:
+            model = get_nlp()
+            if not model: return set()
+            doc = model(clean_text(text))
+        chunks = set()
+        for chunk in doc.noun_chunks:
+            words = clean_text(" ".join(t.text for t in chunk if not t.is_stop and t.pos_ in ("NOUN", "PROPN", "ADJ"))).split()
+            if 2 <= len(words) <= MAX_CHUNK_WORDS: chunks.add(" ".join(words))
+        return chunks
+
+    def extract(self, text, cleaned=None, doc=None, parse=True):
+        """Set of multi-word keywords: known phrases, plus noun chunks when enabled (from doc, or from
+        a fresh parse if parse is set)."""
+        cleaned = clean_text(text) if cleaned is None else cleaned
+        phrases = set(self.match(cleaned.split()))
+        if self.noun_chunks and (doc is not None or parse): phrases |= self.chunks(cleaned, doc)
+        return phrases
+
+# --- SHARED INSTANCE ---
+PHRASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "phrases.json")
+_EXTRACTOR = None
+_LOCK = threading.Lock()
+
+def get_phrase_extractor():
+    """Built once per process from the cluster keywords and data/phrases.json (if present)."""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        with _LOCK:
+            if _EXTRACTOR is None:
+                phrases = cluster_phrases()
+                if os.path.exists(PHRASES_PATH): phrases += load_phrases(PHRASES_PATH)
+                _EXTRACTOR = PhraseExtractor(phrases)
+    return _EXTRACTOR
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("Usage: python phrase_extractor.py build <corpus_dir_or_jsonl> [min_count]")
+        sys.exit(1)
+    from keyword_weights import iter_corpus
+    mined = corpus_phrases(iter_corpus(sys.argv[2]), min_count=int(sys.argv[3]) if len(sys.argv) > 3 else 5)
+    os.makedirs(os.path.dirname(PHRASES_PATH), exist_ok=True)
+    with open(PHRASES_PATH, "w", encoding="utf-8") as f:
+        json.dump(mined, f, indent=0)
+    print(f"✅ Mined {len(mined)} phrases into {PHRASES_PATH}")
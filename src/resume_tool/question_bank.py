@@ -0,0 +1,166 @@
+# question_bank.py
+# Offline interview question bank: questions from past model responses, indexed in SQLite by the
+# keywords of the question and of the JD it was asked for, and by career cluster.
+# A new JD is tokenized once and matched against the index, each keyword weighted by how rare it is
+# in the bank, so questions are served locally in milliseconds; the model is only called when too few
+# relevant questions exist, and its answer goes straight back into the bank.
+#   python question_bank.py import <responses.jsonl>   lines: {"jd": "...", "questions": [...]} or {"jd", "response"}
+#   python question_bank.py ask <jd.txt> [--n 3]
+#   python question_bank.py stats
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from math import log
+from collections import defaultdict
+
+from sqlalchemy import select, func, update
+from sqlalchemy.exc import IntegrityError
+
+from ats_auditor import clean_text, extract_keywords
+from career_data import rank_career_clusters
+from ingest_queue import utcnow
+from models import InterviewQuestion, QuestionKeyword
+
+QUESTION_WEIGHT = 2.0  # a keyword in the question itself says more than one from its JD
+JD_WEIGHT = 1.0
+CLUSTER_BONUS = 2.0
+MIN_RELEVANCE = 8.0    # IDF-weighted score below which a question isn't considered on-topic for the JD
+MAX_DF = 0.2           # keywords indexed for more than this share of questions carry no signal
+
+def _hash(question):
+    return hashlib.sha256(clean_text(question).encode("utf-8")).hexdigest()
+
+def _cluster(jd_text):
+    ranked = rank_career_clusters(jd_text)
+    return ranked[0][0] if ranked and ranked[0][1] > 0 else None
+
+class QuestionBank:
+    def __init__(self, db_factory=None, ai=None, min_relevance=MIN_RELEVANCE):
+        if db_factory is None:
+            from database import SessionLocal
+            db_factory = SessionLocal
+        self.db_factory = db_factory
+        self.ai = ai
+        self.min_relevance = min_relevance
+        self.stats = {"requests": 0, "bank_hits": 0, "model_calls": 0, "bank_ms": 0.0, "model_ms": 0.0}
+
+    # --- 1. FILLING ---
+    def add(self, jd_text, questions, source="model", jd_keywords=None):
+        """Stores new questions under the JD's keywords and cluster. Returns how many were new."""
+        jd_keywords = extract_keywords(jd_text) if jd_keywords is None else jd_keywords
+        cluster, now, added = _cluster(jd_text), utcnow(), 0
+        with self.db_factory() as db:
+            for q in questions:
+                q = q.strip()
+                if not q or q.startswith(("Error:", "⚠️")): continue
+                key = _hash(q)
+                if db.scalar(select(InterviewQuestion.id).where(InterviewQuestion.question_hash == key)): continue
+                row = InterviewQuestion(question=q, question_hash=key, cluster=cluster, source=source, served=0, created_at=now)
+                try:
+                    # Pipeline threads can store the same fresh question at once; the loser just skips it
+                    with db.begin_nested():
+                        db.add(row)
+                        db.flush()
+                except IntegrityError:
+                    continue
+                weights = {k: JD_WEIGHT for k in jd_keywords}
+                weights.update({k: QUESTION_WEIGHT for k in extract_keywords(q)})
+                db.add_all(QuestionKeyword(question_id=row.id, keyword=k, weight=w) for k, w in weights.items())
+                added += 1
+            db.commit()
+        return added
+
+    def import_responses(self, path):
+        from services.ai_service import parse_questions
+        added = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip(): continue
+                item = json.loads(line)
+                questions = item.get("questions") or parse_questions(item.get("response", ""), limit=20)
+                added += self.add(item.get("jd", ""), questions, source="import")
+        return added
+
+    # --- 2. SERVING ---
+    def lookup(self, jd_text, n=3, jd_keywords=None):
+        """Up to n on-topic questions as (question, relevance), most relevant first."""
+        jd_keywords = extract_keywords(jd_text) if jd_keywords is None else jd_keywords
+        if not jd_keywords: return []
+        cluster = _cluster(jd_text)
+        with self.db_factory() as db:
+            # Keywords weighted by rarity across the bank: shared filler words must not make a question look on-topic
+            total = db.scalar(select(func.count()).select_from(InterviewQuestion)) or 0
+            df = db.execute(select(QuestionKeyword.keyword, func.count()).where(QuestionKeyword.keyword.in_(list(jd_keywords)))
+                            .group_by(QuestionKeyword.keyword)).all()
+            idf = {k: log(total / c) for k, c in df if c <= MAX_DF * total}
+            if not idf: return []
+            scores = defaultdict(float)
+            for qid, keyword, weight in db.execute(select(QuestionKeyword.question_id, QuestionKeyword.keyword, QuestionKeyword.weight)
+                                                   .where(QuestionKeyword.keyword.in_(list(idf)))):
+                scores[qid] += weight * idf[keyword]
+            best = sorted(scores, key=scores.get, reverse=True)[:max(n * 10, 20)]
+            rows = db.execute(select(InterviewQuestion.id, InterviewQuestion.question, InterviewQuestion.cluster)
+                              .where(InterviewQuestion.id.in_(best))).all()
+            scored = sorted(((scores[qid] + (CLUSTER_BONUS if cluster and c == cluster else 0), qid, q) for qid, q, c in rows), reverse=True)
+            picked = [(q, round(score, 2), qid) for score, qid, q in scored if score >= self.min_relevance][:n]
+            if picked:
+                db.execute(update(InterviewQuestion).where(InterviewQuestion.id.in_([p[2] for p in picked]))
+                           .values(served=InterviewQuestion.served + 1))
+                db.commit()
+        return [(q, score) for q, score, _ in picked]
+
+    def get_questions(self, jd_text, n=3):
+        """
+        {"questions", "source": "bank" | "model" | "mixed", "coverage"}: questions from the bank when it
+        has n relevant ones, otherwise topped up from the model (when one is configured) and remembered.
+        """
+        self.stats["requests"] += 1
+        t0 = time.perf_counter()
+        jd_keywords = extract_keywords(jd_text)
+        found = [q for q, _ in self.lookup(jd_text, n, jd_keywords)]
+        self.stats["bank_ms"] += (time.perf_counter() - t0) * 1000
+        coverage = len(found) / n if n else 1.0
+        if len(found) >= n: self.stats["bank_hits"] += 1
+        if len(found) >= n or not (self.ai and self.ai.is_configured()):
+            return {"questions": found, "source": "bank", "coverage": coverage}
+
+        t0 = time.perf_counter()
+        fresh = self.ai.simulate_interview(jd_text, n)
+        self.stats["model_calls"] += 1
+        self.stats["model_ms"] += (time.perf_counter() - t0) * 1000
+        self.add(jd_text, fresh, jd_keywords=jd_keywords)
+        merged = found + [q for q in fresh if q not in found and not q.startswith(("Error:", "⚠️"))]
+        return {"questions": merged[:n] or fresh, "source": "mixed" if found else "model", "coverage": coverage}
+
+    def summary(self):
+        with self.db_factory() as db:
+            by_cluster = dict(db.execute(select(InterviewQuestion.cluster, func.count()).group_by(InterviewQuestion.cluster)).all())
+        return {"questions": sum(by_cluster.values()), "by_cluster": by_cluster, **self.stats}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline interview question bank")
+    parser.add_argument("command", choices=["import", "ask", "stats"])
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--n", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    from database import init_db
+    from services.ai_service import AIService
+    init_db()
+    ai = AIService(os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY"))
+    bank = QuestionBank(ai=ai if ai.is_configured() else None)
+    if args.command == "import":
+        print(f"✅ Added {bank.import_responses(args.path)} new questions")
+    elif args.command == "ask":
+        with open(args.path, encoding="utf-8") as f:
+            result = bank.get_questions(f.read(), args.n)
+        for q in result["questions"]: print(f"- {q}")
+        print(f"(source: {result['source']}, coverage {result['coverage']:.0%})")
+    else:
+        print(json.dumps(bank.summary(), indent=2))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
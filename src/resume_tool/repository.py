@@ -0,0 +1,98 @@
+# repository.py
+# Read paths for list screens, so they fetch only the columns they show, in a fixed number of queries.
+# - Keyset pagination: each page starts after the last row of the previous one (a cursor), which
+#   stays an index range scan at any depth, unlike OFFSET.
+# - Large Text columns (draft sections, STAR fields, data_dump) are deferred on list queries and
+#   only loaded by the get_* calls that render one record.
+# - Relationships are loaded with explicit selectinload options, never lazily per row.
+from sqlalchemy import select, func, tuple_, or_
+from sqlalchemy.orm import load_only, selectinload
+
+from models import User, PortfolioProject, SavedResume
+
+USER_SUMMARY = (User.id, User.username, User.saved_name, User.saved_email, User.saved_role)
+VERSION_SUMMARY = (SavedResume.id, SavedResume.user_id, SavedResume.version_name, SavedResume.created_at)
+PROJECT_SUMMARY = (PortfolioProject.id, PortfolioProject.user_id, PortfolioProject.title,
+                   PortfolioProject.industry, PortfolioProject.evidence_url)
+MAX_PAGE = 200
+
+def _limit(limit):
+    return max(1, min(limit, MAX_PAGE))
+
+# --- 1. USERS ---
+def list_users(db, after=None, limit=50):
+    """One page of users by id, without the draft sections. Returns (users, cursor for the next page or None)."""
+    stmt = select(User).options(load_only(*USER_SUMMARY)).order_by(User.id).limit(_limit(limit))
+    if after is not None: stmt = stmt.where(User.id > after)
+    users = db.scalars(stmt).all()
+    return users, (users[-1].id if len(users) == _limit(limit) else None)
+
+def list_users_with_counts(db, after=None, limit=50):
+    """Admin overview: user summaries with project and version counts, in one query. Returns (rows, cursor)."""
+    # Correlated subqueries: each is an index lookup for the 50 users on the page, not a GROUP BY over every row
+    n_projects = select(func.count()).where(PortfolioProject.user_id == User.id).scalar_subquery()
+    n_versions = select(func.count()).where(SavedResume.user_id == User.id).scalar_subquery()
+    last_saved = select(func.max(SavedResume.created_at)).where(SavedResume.user_id == User.id).scalar_subquery()
+    stmt = (select(User.id, User.username, User.saved_role, n_projects, n_versions, last_saved)
+            .order_by(User.id).limit(_limit(limit)))
+    if after is not None: stmt = stmt.where(User.id > after)
+    rows = [{"id": r[0], "username": r[1], "role": r[2], "projects": r[3], "versions": r[4], "last_saved": r[5]}
+            for r in db.execute(stmt)]
+    return rows, (rows[-1]["id"] if len(rows) == _limit(limit) else None)
+
+def get_user(db, user_id, with_portfolio=False):
+    """The full draft; with_portfolio also loads project and version summaries (two extra queries, not N)."""
+    stmt = select(User).where(User.id == user_id)
+    if with_portfolio:
+        stmt = stmt.options(selectinload(User.projects).load_only(*PROJECT_SUMMARY),
+                            selectinload(User.resumes).load_only(*VERSION_SUMMARY))
+    return db.scalar(stmt)
+
+# --- 2. RESUME VERSIONS ---
+def list_versions(db, user_id, before=None, limit=20):
+    """
+    A user's versions, newest first, without data_dump. `before` is the cursor returned with the
+    previous page: (created_at, id) of its last row. Undated versions sort after every dated one.
+    """
+    stmt = (select(SavedResume).options(load_only(*VERSION_SUMMARY)).where(SavedResume.user_id == user_id)
+            .order_by(SavedResume.created_at.desc(), SavedResume.id.desc()).limit(_limit(limit)))
+    if before is not None:
+        created_at, last_id = before
+        if created_at is None:
+            stmt = stmt.where(SavedResume.created_at.is_(None), SavedResume.id < last_id)
+        else:
+            stmt = stmt.where(or_(tuple_(SavedResume.created_at, SavedResume.id) < tuple_(created_at, last_id),
+                                  SavedResume.created_at.is_(None)))
+    versions = db.scalars(stmt).all()
+    cursor = (versions[-1].created_at, versions[-1].id) if len(versions) == _limit(limit) else None
+    return versions, cursor
+
+def latest_version(db, user_id):
+    """The newest dated version, data_dump included (it's about to be loaded into the editor)."""
+    return db.scalar(select(SavedResume).where(SavedResume.user_id == user_id, SavedResume.created_at.is_not(None))
+                     .order_by(SavedResume.created_at.desc(), SavedResume.id.desc()).limit(1))
+
+def get_version(db, version_id, user_id=None):
+    stmt = select(SavedResume).where(SavedResume.id == version_id)
+    if user_id is not None: stmt = stmt.where(SavedResume.user_id == user_id)
+    return db.scalar(stmt)
+
+# --- 3. PORTFOLIO PROJECTS ---
+def list_projects(db, user_id, after=None, limit=50):
+    """Project titles for the portfolio list, without the STAR text. Returns (projects, cursor)."""
+    stmt = (select(PortfolioProject).options(load_only(*PROJECT_SUMMARY))
+            .where(PortfolioProject.user_id == user_id).order_by(PortfolioProject.id).limit(_limit(limit)))
+    if after is not None: stmt = stmt.where(PortfolioProject.id > after)
+    projects = db.scalars(stmt).all()
+    return projects, (projects[-1].id if len(projects) == _limit(limit) else None)
+
+def get_project(db, project_id, user_id=None):
+    stmt = select(PortfolioProject).where(PortfolioProject.id == project_id)
+    if user_id is not None: stmt = stmt.where(PortfolioProject.user_id == user_id)
+    return db.scalar(stmt)
+
+def projects_by_ids(db, ids):
+    """Full STAR stories for a selection (e.g. search hits), in one IN query, in the order given."""
+    if not ids: return []
+    found = {p.id: p for p in db.scalars(select(PortfolioProject).where(PortfolioProject.id.in_(list(ids))))}
+    return [found[i] for i in ids if i in found]
@@ -0,0 +1,40 @@
+# resume_export.py
+# Editor state (the resume_data dict) to plain text, PDF and DOCX for the dashboard downloads.
+import io
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from fpdf import FPDF
+
+from instrumentation import timed
+
+def reconstruct_resume_text(data):
+    full_text = f"{data['name']}\n{data['email']} | {data['phone']}\n"
+    if data['summary']: full_text += f"\nSummary:\n{data['summary']}\n"
+    if data['skills']: full_text += f"\nSkills:\n{data['skills']}\n"
+    if data['experience']: full_text += f"\nExperience:\n{data['experience']}\n"
+    if data['education']: full_text += f"\nEducation:\n{data['education']}\n"
+    return full_text
+
+@timed("render.docx")
+def create_docx(data):
+    doc = Document()
+    doc.add_heading(data['name'], 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph(f"{data['email']} | {data['phone']} | {data['linkedin']}").alignment = WD_ALIGN_PARAGRAPH.CENTER
+    if data['summary']: doc.add_heading('SUMMARY', 1); doc.add_paragraph(data['summary'])
+    if data['skills']: doc.add_heading('SKILLS', 1); doc.add_paragraph(data['skills'])
+    if data['experience']: doc.add_heading('EXPERIENCE', 1); doc.add_paragraph(data['experience'])
+    if data['education']: doc.add_heading('EDUCATION', 1); doc.add_paragraph(data['education'])
+    buffer = io.BytesIO(); doc.save(buffer); buffer.seek(0); return buffer
+
+@timed("render.pdf")
+def create_pdf(data):
+    pdf = FPDF(); pdf.add_page(); pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, data['name'], ln=True, align='C')
+    pdf.set_font("Arial", "", 10)
+    pdf.cell(0, 5, f"{data['email']} | {data['phone']} | {data['linkedin']}", ln=True, align='C'); pdf.ln(5)
+    def sect(t, b): 
+        if b: 
+            pdf.set_font("Arial","B",12); pdf.cell(0,8,t,ln=True,border='B'); pdf.ln(2)
+            pdf.set_font("Arial","",10); pdf.multi_cell(0,5,b.encode('latin-1','replace').decode('latin-1')); pdf.ln(3)
+    sect("SUMMARY", data['summary']); sect("SKILLS", data['skills']); sect("EXPERIENCE", data['experience']); sect("EDUCATION", data['education'])
+    return bytes(pdf.output())
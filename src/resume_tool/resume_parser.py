@@ -0,0 +1,54 @@
+# resume_parser.py
+# Turns an uploaded resume into text + the fields the dashboard pre-fills.
+import re
+import fitz  # PyMuPDF
+
+from instrumentation import timed
+
+# --- 1. EXTRACTION ---
+@timed("extract.pdf")
+def extract_pdf(data):
+    """PDF bytes (or a file-like object) to plain text; None if it can't be read."""
+    if hasattr(data, "read"): data = data.read()
+    try: return "".join([p.get_text() for p in fitz.open(stream=data, filetype="pdf")])
+    except: return None
+
+# --- 2. INTELLIGENT PARSER ---
+@timed("parse.contact")
+def parse_contact_info(text):
+    data = {"name": "", "email": "", "phone": "", "linkedin": ""}
+    lines = text.split('\n')
+    for line in lines[:5]:
+        if line.strip() and len(line) < 50: data['name'] = line.strip(); break
+    email = re.search(r'[\w\.-]+@[\w\.-]+', text)
+    if email: data['email'] = email.group(0)
+    phone = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    if phone: data['phone'] = phone.group(0)
+    if "linkedin" in text.lower(): data['linkedin'] = "LinkedIn Profile"
+    return data
+
+@timed("parse.sections")
+def parse_resume_sections(text):
+    sections = {"summary": "", "skills": "", "experience": "", "education": ""}
+    lines = text.split('\n')
+    current_section = None
+    buffer = []
+    markers = {
+        "summary": ["professional summary", "profile", "summary", "objective"],
+        "skills": ["skills", "competencies", "technologies", "core competencies"],
+        "experience": ["experience", "work history", "employment", "professional experience"],
+        "education": ["education", "academic", "university", "college"]
+    }
+    for line in lines:
+        clean_line = line.strip().lower()
+        is_header = False
+        for section, keywords in markers.items():
+            if clean_line in keywords or (clean_line.endswith(":") and clean_line.strip(":") in keywords):
+                if current_section: sections[current_section] = "\n".join(buffer).strip()
+                current_section = section
+                buffer = []
+                is_header = True
+                break
+        if not is_header and current_section: buffer.append(line)
+    if current_section: sections[current_section] = "\n".join(buffer).strip()
+    return sections
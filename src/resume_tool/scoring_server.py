@@ -0,0 +1,163 @@
+# scoring_server.py
+# Local scoring API for the Career Scout extension.
+# Run:  python scoring_server.py [--host 127.0.0.1] [--port 8765] [--allow-origin chrome-extension://<id> ...]
+#   POST /analyze  {"resume": "...", "jd": "..."}  -> get_analysis_data
+#   POST /audit    {"resume": "..."}               -> perform_general_audit
+#   GET  /health                                   -> cache + request counters
+# Plain asyncio (no web framework): the NLP model is loaded once and kept warm, results are cached
+# by content hash, and the CPU work runs on one worker thread so the event loop keeps accepting.
+# Browsers only get CORS headers for the extension's origin, so an arbitrary web page can't read resume
+# scores back from localhost. Set the extension's id with --allow-origin or CAREER_SCOUT_ORIGINS (comma
+# separated); left unset, any chrome-extension:// origin is accepted (unpacked ids differ per install).
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from ats_auditor import get_analysis_data, perform_general_audit, get_tokens, clean_text
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CACHE_SIZE = 2048
+MAX_BODY = 1_000_000  # bytes; a resume plus a scraped page is far below this
+EXTENSION_SCHEME = "chrome-extension://"
+
+ROUTES = {
+    "/analyze": lambda p: get_analysis_data(p.get("resume", ""), p.get("jd", "")),
+    "/audit": lambda p: perform_general_audit(p.get("resume", "")),
+}
+
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+def _json_default(obj):
+    # numpy scalars (e.g. the cosine score) aren't JSON-native
+    return obj.item() if hasattr(obj, "item") else str(obj)
+
+def configured_origins():
+    return [o.strip().rstrip("/") for o in os.environ.get("CAREER_SCOUT_ORIGINS", "").split(",") if o.strip()]
+
+class ScoringServer:
+    def __init__(self, cache_size=CACHE_SIZE, allowed_origins=None):
+        self.cache_size = cache_size
+        self.allowed_origins = set(configured_origins() if allowed_origins is None else allowed_origins)
+        self._cache = OrderedDict()
+        # spaCy pipelines aren't safe to share across threads, so scoring is serialized on one worker
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scoring")
+        self.stats = {"requests": 0, "cache_hits": 0, "computed": 0, "errors": 0}
+
+    def warm_up(self):
+        """Loads the NLP model and fills its caches before the first real request."""
+        get_tokens(clean_text("Warm up the pipeline with a short sample sentence about Python projects."))
+
+    async def score(self, route, payload):
+        key = hashlib.sha256(route.encode() + b"\0" + json.dumps(payload, sort_keys=True).encode()).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return cached
+        result = await asyncio.get_running_loop().run_in_executor(self._executor, ROUTES[route], payload)
+        body = json.dumps(result, default=_json_default).encode()
+        self.stats["computed"] += 1
+        self._cache[key] = body
+        if len(self._cache) > self.cache_size: self._cache.popitem(last=False)
+        return body
+
+    def origin_allowed(self, origin):
+        """Requests without an Origin (curl, scripts) aren't from a web page and are always served."""
+        if origin is None: return True
+        if self.allowed_origins: return origin in self.allowed_origins
+        return origin.startswith(EXTENSION_SCHEME)
+
+    # --- HTTP ---
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line: break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""): break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, b'{"error": "payload too large"}', keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                origin = headers.get("origin")
+                if self.origin_allowed(origin):
+                    status, payload = await self._dispatch(method, path.split("?", 1)[0], body)
+                else:
+                    # Refused before any scoring, preflight included: a "simple" text/plain POST skips preflight
+                    status, payload, origin = 403, b'{"error": "origin not allowed"}', None
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive, origin)
+                if not keep_alive: break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, body):
+        self.stats["requests"] += 1
+        if method == "OPTIONS": return 204, b""
+        if method == "GET" and path == "/health":
+            return 200, json.dumps({"status": "ok", "cache_entries": len(self._cache), **self.stats}).encode()
+        if method != "POST" or path not in ROUTES: return 404, b'{"error": "not found"}'
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict): raise ValueError
+        except ValueError:
+            return 400, b'{"error": "body must be a JSON object"}'
+        try:
+            return 200, await self.score(path, payload)
+        except Exception as e:
+            self.stats["errors"] += 1
+            return 500, json.dumps({"error": str(e)}).encode()
+
+    async def _respond(self, writer, status, body, keep_alive=True, origin=None):
+        cors = (f"Access-Control-Allow-Origin: {origin}\r\n"
+                "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                "Access-Control-Allow-Headers: Content-Type\r\n") if origin else ""
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"{cors}Vary: Origin\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, allowed_origins=None):
+    app = ScoringServer(allowed_origins=allowed_origins)
+    t0 = time.perf_counter()
+    await asyncio.get_running_loop().run_in_executor(app._executor, app.warm_up)
+    server = await asyncio.start_server(app.handle, host, port)
+    origins = ", ".join(sorted(app.allowed_origins)) or f"any {EXTENSION_SCHEME} origin"
+    print(f"✅ Scoring API on http://{host}:{port} (model warm in {time.perf_counter() - t0:.1f}s; browser access: {origins})")
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local scoring API for the Career Scout extension")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--allow-origin", action="append", dest="origins",
+                        help="browser origin allowed to call the API, e.g. chrome-extension://<id> (repeatable)")
+    args = parser.parse_args(argv)
+    origins = [o.rstrip("/") for o in args.origins] if args.origins else None
+    try:
+        asyncio.run(serve(args.host, args.port, origins))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,127 @@
+# search_index.py
+# SQLite FTS5 full-text search over portfolio STAR stories and saved resume versions.
+# The FTS tables mirror the source rows through triggers, so they never need a manual reindex:
+#   projects_fts  external-content index over portfolio_projects (title, industry, S/T/A/R)
+#   resumes_fts   the text fields pulled out of saved_resumes.data_dump (JSON), one row per version
+# Search:  python search_index.py <user_id> "kubernetes migration" [--limit 10]
+import sys
+import json
+import argparse
+
+from sqlalchemy import text
+
+PROJECT_COLUMNS = ["title", "industry", "situation", "task", "action", "result"]
+RESUME_FIELDS = ["name", "summary", "skills", "experience", "education", "references"]
+HIGHLIGHT = ("**", "**")  # markdown bold, so snippets render as-is in Streamlit
+TOKENIZER = "porter unicode61 remove_diacritics 2"  # "migrations" finds "migration"
+
+def _resume_body(alias):
+    # Invalid JSON is indexed verbatim instead of failing the write that fired the trigger
+    fields = " || ' ' || ".join(f"coalesce(json_extract({alias}.data_dump, '$.{f}'), '')" for f in RESUME_FIELDS)
+    return f"CASE WHEN json_valid({alias}.data_dump) THEN {fields} ELSE coalesce({alias}.data_dump, '') END"
+
+def _ddl():
+    cols = ", ".join(PROJECT_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in PROJECT_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in PROJECT_COLUMNS)
+    return [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+                {cols}, user_id UNINDEXED, content='portfolio_projects', content_rowid='id', tokenize='{TOKENIZER}')""",
+        f"""CREATE TRIGGER IF NOT EXISTS portfolio_projects_ai AFTER INSERT ON portfolio_projects BEGIN
+                INSERT INTO projects_fts(rowid, {cols}, user_id) VALUES (new.id, {new_cols}, new.user_id);
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS portfolio_projects_ad AFTER DELETE ON portfolio_projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, {cols}, user_id) VALUES ('delete', old.id, {old_cols}, old.user_id);
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS portfolio_projects_au AFTER UPDATE ON portfolio_projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, {cols}, user_id) VALUES ('delete', old.id, {old_cols}, old.user_id);
+                INSERT INTO projects_fts(rowid, {cols}, user_id) VALUES (new.id, {new_cols}, new.user_id);
+            END""",
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+                version_name, body, user_id UNINDEXED, tokenize='{TOKENIZER}')""",
+        f"""CREATE TRIGGER IF NOT EXISTS saved_resumes_ai AFTER INSERT ON saved_resumes BEGIN
+                INSERT INTO resumes_fts(rowid, version_name, body, user_id) VALUES (new.id, new.version_name, {_resume_body('new')}, new.user_id);
+            END""",
+        """CREATE TRIGGER IF NOT EXISTS saved_resumes_ad AFTER DELETE ON saved_resumes BEGIN
+                DELETE FROM resumes_fts WHERE rowid = old.id;
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS saved_resumes_au AFTER UPDATE ON saved_resumes BEGIN
+                DELETE FROM resumes_fts WHERE rowid = old.id;
+                INSERT INTO resumes_fts(rowid, version_name, body, user_id) VALUES (new.id, new.version_name, {_resume_body('new')}, new.user_id);
+            END""",
+    ]
+
+def install(engine):
+    """Creates the FTS tables and triggers if missing, backfilling from existing rows. False if FTS5 isn't compiled in."""
+    with engine.begin() as conn:
+        existing = {r[0] for r in conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('projects_fts', 'resumes_fts')"))}
+        try:
+            for stmt in _ddl(): conn.execute(text(stmt))
+        except Exception as e:
+            if "fts5" in str(e).lower(): return False
+            raise
+        if "projects_fts" not in existing:
+            conn.execute(text("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')"))
+        if "resumes_fts" not in existing:
+            conn.execute(text(f"""INSERT INTO resumes_fts(rowid, version_name, body, user_id)
+                                  SELECT r.id, r.version_name, {_resume_body('r')}, r.user_id FROM saved_resumes r"""))
+    return True
+
+# --- QUERIES ---
+def to_match_query(query):
+    """Free text to an FTS5 query: every word must appear (as a prefix), with no FTS syntax leaking through."""
+    words = [w.replace('"', '""') for w in query.split() if w.strip('"')]
+    return " ".join(f'"{w}"*' for w in words)
+
+def search_projects(db, user_id, query, limit=20):
+    match = to_match_query(query)
+    if not match: return []
+    rows = db.execute(text("""
+        SELECT rowid, title, snippet(projects_fts, -1, :open, :close, '…', 12), bm25(projects_fts)
+        FROM projects_fts WHERE projects_fts MATCH :match AND user_id = :user_id
+        ORDER BY bm25(projects_fts) LIMIT :limit"""),
+        {"match": match, "user_id": user_id, "limit": limit, "open": HIGHLIGHT[0], "close": HIGHLIGHT[1]}).all()
+    return [{"kind": "project", "id": r[0], "title": r[1], "snippet": r[2].strip(), "score": round(-r[3], 4)} for r in rows]
+
+def search_resumes(db, user_id, query, limit=20):
+    match = to_match_query(query)
+    if not match: return []
+    rows = db.execute(text("""
+        SELECT rowid, version_name, snippet(resumes_fts, 1, :open, :close, '…', 12), bm25(resumes_fts)
+        FROM resumes_fts WHERE resumes_fts MATCH :match AND user_id = :user_id
+        ORDER BY bm25(resumes_fts) LIMIT :limit"""),
+        {"match": match, "user_id": user_id, "limit": limit, "open": HIGHLIGHT[0], "close": HIGHLIGHT[1]}).all()
+    return [{"kind": "resume", "id": r[0], "title": r[1], "snippet": r[2].strip(), "score": round(-r[3], 4)} for r in rows]
+
+def _with_relevance(hits):
+    """
+    bm25 depends on each table's own document count and lengths, so a project's score can't be compared
+    with a resume's. Rescales one table's scores to 0..1 (its best hit = 1) as "relevance".
+    """
+    if not hits: return hits
+    lo, hi = min(h["score"] for h in hits), max(h["score"] for h in hits)
+    return [{**h, "relevance": round((h["score"] - lo) / (hi - lo), 4) if hi > lo else 1.0} for h in hits]
+
+def search(db, user_id, query, limit=20):
+    """
+    Projects and resume versions together, best match first. "score" is the raw bm25 (higher = better,
+    only comparable within one kind); the merge orders by "relevance", normalized per table, and a tie
+    keeps each table's own order (projects first).
+    """
+    hits = _with_relevance(search_projects(db, user_id, query, limit)) + _with_relevance(search_resumes(db, user_id, query, limit))
+    return sorted(hits, key=lambda h: h["relevance"], reverse=True)[:limit]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search over projects and saved resumes")
+    parser.add_argument("user_id", type=int)
+    parser.add_argument("query")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    from database import SessionLocal, init_db
+    init_db()
+    with SessionLocal() as db:
+        print(json.dumps(search(db, args.user_id, args.query, args.limit), indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
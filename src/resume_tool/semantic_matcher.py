@@ -0,0 +1,120 @@
+# semantic_matcher.py
+# Optional LSA scorer: hashing vectorizer + TF-IDF + TruncatedSVD, trained offline on a local JD corpus.
+# Build offline:  python semantic_matcher.py build <corpus_dir_or_jsonl> [out_dir]
+# Everything is saved as .npy and memory-mapped at serving time. CPU only, no network.
+import os
+import sys
+import json
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from keyword_weights import iter_corpus
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SEMANTIC_DIR = os.path.join(BASE_DIR, "data", "lsa")
+
+N_FEATURES = 2 ** 16  # hashed vocab; the components matrix is N_FEATURES x N_COMPONENTS float32
+N_COMPONENTS = 128
+
+def make_vectorizer(n_features=N_FEATURES):
+    # Stateless, so serving needs nothing but these settings. Bigrams let "health records" carry weight.
+    return HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None,
+                             ngram_range=(1, 2), stop_words="english")
+
+def _normalize(rows):
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return rows / np.maximum(norms, 1e-12)
+
+# --- 1. OFFLINE BUILDER ---
+def build_model(texts, out_dir=SEMANTIC_DIR, ids=None, n_components=N_COMPONENTS, n_features=N_FEATURES):
+    """Fits the LSA space and an IVF index over the corpus documents, and saves them as .npy."""
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.preprocessing import normalize
+
+    texts = list(texts)
+    if len(texts) < 2: raise ValueError(f"need at least 2 documents to build an LSA space, got {len(texts)}")
+    ids = list(ids) if ids is not None else [str(i) for i in range(len(texts))]
+    counts = make_vectorizer(n_features).transform(texts)
+    df = np.bincount(counts.indices, minlength=n_features)
+    idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+    tfidf = normalize(counts.multiply(idf).tocsr())
+
+    n_components = max(1, min(n_components, tfidf.shape[0] - 1, tfidf.shape[1] - 1))
+    svd = TruncatedSVD(n_components=n_components, algorithm="randomized", random_state=42)
+    doc_vectors = _normalize(svd.fit_transform(tfidf)).astype(np.float32)
+
+    # IVF index: k-means coarse quantizer, docs stored contiguously per list
+    n_lists = max(1, int(np.sqrt(len(texts))))
+    kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=42, n_init=3).fit(doc_vectors)
+    order = np.argsort(kmeans.labels_, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(kmeans.labels_, minlength=n_lists))])
+
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, "idf.npy"), idf)
+    np.save(os.path.join(out_dir, "components.npy"), np.ascontiguousarray(svd.components_.T, dtype=np.float32))
+    np.save(os.path.join(out_dir, "doc_vectors.npy"), doc_vectors[order])
+    np.save(os.path.join(out_dir, "centroids.npy"), _normalize(kmeans.cluster_centers_).astype(np.float32))
+    np.save(os.path.join(out_dir, "list_offsets.npy"), offsets.astype(np.int64))
+    with open(os.path.join(out_dir, "meta.json"), "w") as f:
+        json.dump({"n_features": n_features, "n_components": n_components, "n_docs": len(texts),
+                   "ids": [ids[i] for i in order]}, f)
+    return len(texts), n_components
+
+# --- 2. SERVING ---
+class SemanticModel:
+    def __init__(self, model_dir=SEMANTIC_DIR):
+        load = lambda name: np.load(os.path.join(model_dir, name), mmap_mode="r")
+        self.idf = load("idf.npy")
+        self.components = load("components.npy")
+        self.doc_vectors = load("doc_vectors.npy")
+        self.centroids = load("centroids.npy")
+        self.list_offsets = load("list_offsets.npy")
+        with open(os.path.join(model_dir, "meta.json")) as f:
+            meta = json.load(f)
+        self.ids = meta["ids"]
+        self.vectorizer = make_vectorizer(meta["n_features"])
+
+    def embed(self, texts):
+        """Unit-length LSA vectors for a batch of texts. Only idf/component rows for present terms are read."""
+        counts = self.vectorizer.transform(texts).tocsr()
+        counts.data = counts.data * self.idf[counts.indices]
+        row_norms = np.sqrt(np.asarray(counts.multiply(counts).sum(axis=1))).ravel()
+        counts = counts.multiply(1 / np.maximum(row_norms, 1e-12)[:, None]).tocsr()
+        out = np.zeros((counts.shape[0], self.components.shape[1]), dtype=np.float32)
+        for i in range(counts.shape[0]):
+            start, end = counts.indptr[i], counts.indptr[i + 1]
+            if start == end: continue
+            out[i] = counts.data[start:end] @ self.components[counts.indices[start:end]]
+        return _normalize(out)
+
+    def similarity(self, resume_text, jd_text):
+        """Cosine in LSA space, on the same 0-100 scale as the keyword match score."""
+        r, j = self.embed([resume_text, jd_text])
+        return round(max(0.0, float(r @ j)) * 100, 1)
+
+    def search(self, text, top_k=10, n_probe=4):
+        """Approximate nearest JDs: probe the closest IVF lists, then rank their docs exactly."""
+        q = self.embed([text])[0]
+        lists = np.argsort(-(self.centroids @ q))[:n_probe]
+        candidates = np.concatenate([np.arange(self.list_offsets[l], self.list_offsets[l + 1]) for l in lists])
+        if not len(candidates): return []
+        scores = self.doc_vectors[candidates] @ q
+        best = np.argsort(-scores)[:top_k]
+        return [(self.ids[candidates[i]], round(float(scores[i]) * 100, 1)) for i in best]
+
+_MODEL = None
+
+def get_semantic_model():
+    """Lazily maps the default model; returns None if it hasn't been built."""
+    global _MODEL
+    if _MODEL is None and os.path.exists(os.path.join(SEMANTIC_DIR, "meta.json")):
+        _MODEL = SemanticModel()
+    return _MODEL
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("Usage: python semantic_matcher.py build <corpus_dir_or_jsonl> [out_dir]")
+        sys.exit(1)
+    n_docs, k = build_model(iter_corpus(sys.argv[2]), sys.argv[3] if len(sys.argv) > 3 else SEMANTIC_DIR)
+    print(f"✅ Built LSA model: {n_docs} docs, {k} dimensions")
@@ -1,6 +1,33 @@
+import re
+import ast
+import json
+
 from google import genai
 import streamlit as st
 
+from instrumentation import timed
+
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\(?\d+[.):]|Q\d+[.):])\s*")
+
+def parse_questions(text, limit=3):
+    """
+    Questions from a model reply. Takes the first [...] block as a JSON or Python list when it parses,
+    otherwise one question per line with numbering, bullets and code fences stripped.
+    Commas inside a question never split it.
+    """
+    match = re.search(r"\[.*\]", text, re.S)
+    if match:
+        for loader in (json.loads, ast.literal_eval):
+            try:
+                items = loader(match.group(0))
+            except (ValueError, SyntaxError, TypeError):
+                continue
+            if isinstance(items, list):
+                questions = [str(q).strip() for q in items if str(q).strip()]
+                if questions: return questions[:limit]
+    lines = (_LIST_MARKER.sub("", line).strip().rstrip(",").strip('"').strip() for line in text.splitlines())
+    return [line for line in lines if line and not line.startswith("```") and not line.endswith(":")][:limit]
+
 class AIService:
     def __init__(self, api_key):
         self.api_key = api_key
@@ -15,6 +42,7 @@ class AIService:
     def is_configured(self):
         return bool(self.client)
 
+    @timed("ai.magic_rewrite")
     def magic_rewrite(self, text, role):
         if not self.is_configured(): return "⚠️ Please enter API Key in Sidebar."
         
@@ -38,6 +66,7 @@ class AIService:
         except Exception as e:
             return f"Error: {str(e)}"
 
+    @timed("ai.generate_cover_letter")
     def generate_cover_letter(self, resume_text, job_description):
         if not self.is_configured(): return "⚠️ Please enter API Key in Sidebar."
         
@@ -65,11 +94,12 @@ class AIService:
         except Exception as e:
             return f"Error: {str(e)}"
 
-    def simulate_interview(self, job_description):
+    @timed("ai.simulate_interview")
+    def simulate_interview(self, job_description, count=3):
         if not self.is_configured(): return ["⚠️ Please enter API Key in Sidebar."]
         
         prompt = f"""
-        Based on the following Job Description, generate 3 challenging interview questions 
+        Based on the following Job Description, generate {count} challenging interview questions 
         that a hiring manager would ask.
         
         JOB DESCRIPTION:
@@ -83,12 +113,11 @@ class AIService:
                 model='gemini-flash-latest',
                 contents=prompt
             )
-            text = response.text.replace("[", "").replace("]", "").replace('"', "")
-            questions = [q.strip() for q in text.split(",")]
-            return questions[:3]
+            return parse_questions(response.text, count)
         except Exception as e:
             return [f"Error: {str(e)}"]
 
+    @timed("ai.critique_answer")
     def critique_answer(self, question, user_answer):
         if not self.is_configured(): return "⚠️ Config Error."
         
@@ -61,4 +61,18 @@ def get_coach_advice(role):
         "focus": "Results over Duties",
         "tip": "Don't just say what you did. Say what you *achieved*. Did you save time? Save money? Make a customer happy?",
         "book_ref": "💡 *Rule:* Every bullet point should have a Number (%, $, or count)."
-    })
\ No newline at end of file
+    })
+
+def get_smart_tip(role):
+    """
+    (category, tip) for a career path or job title: the coaching advice above when the role is one of
+    the career paths, otherwise the first tip of the advice pack the title resolves to.
+    """
+    coach = get_coach_advice(role)
+    if role in get_career_paths() and coach["focus"] != "Results over Duties":
+        return coach["focus"], coach["tip"]
+    from advice_registry import get_registry
+    pack = get_registry().resolve(role or "")
+    if pack and pack.get("tips"):
+        return pack["name"], pack["tips"][0]
+    return coach["focus"], coach["tip"]
\ No newline at end of file
@@ -4,6 +4,9 @@ from docx import Document
 from fpdf import FPDF
 import fitz  # PyMuPDF
 
+from instrumentation import timed
+
+@timed("extract.file")
 def extract_text_from_file(uploaded_file):
     text = ""
     try:
@@ -24,6 +27,7 @@ def sanitize_text(text):
     for char, r in replacements.items(): text = text.replace(char, r)
     return text.encode('latin-1', 'replace').decode('latin-1')
 
+@timed("render.pdf")
 def generate_pdf(data):
     pdf = FPDF()
     pdf.add_page()
@@ -48,6 +52,7 @@ def generate_pdf(data):
             pdf.ln(5)
     return bytes(pdf.output())
 
+@timed("render.docx")
 def generate_docx(data):
     doc = Document()
     doc.add_heading(data.get("name", ""), 0)
@@ -64,6 +69,7 @@ def generate_docx(data):
     buffer.seek(0)
     return buffer
 
+@timed("parse.dict")
 def parse_resume_to_dict(text):
     data = {"name": "", "email": "", "phone": "", "linkedin": "", "summary": "", "experience": "", "skills": "", "references": ""}
     if not text: return data
@@ -0,0 +1,138 @@
+# token_ids.py
+# Compact keyword sets for corpus-scale matching: terms are interned once in a shared Vocabulary
+# and every document becomes a sorted, unique int32 array. A TokenCorpus packs all documents into
+# one flat array plus offsets (CSR layout), so 100k JDs cost a few bytes per keyword instead of a
+# Python set of str objects, and overlap against one resume is a single vectorized pass.
+import os
+import json
+import numpy as np
+
+# --- 1. VOCABULARY ---
+class Vocabulary:
+    def __init__(self, terms=()):
+        self.terms = []
+        self._ids = {}
+        for t in terms: self.intern(t)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def intern(self, term):
+        tid = self._ids.get(term)
+        if tid is None:
+            tid = self._ids[term] = len(self.terms)
+            self.terms.append(term)
+        return tid
+
+    def encode(self, tokens, add=True):
+        """Sorted unique int32 ids for a token collection. With add=False unknown terms are dropped."""
+        if add: ids = [self.intern(t) for t in tokens]
+        else: ids = [i for i in map(self._ids.get, tokens) if i is not None]
+        return np.unique(np.array(ids, dtype=np.int32))
+
+    def decode(self, ids):
+        return [self.terms[i] for i in ids]
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.terms, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+# --- 2. SET OPERATIONS ---
+def common_ids(resume_ids, jd_ids):
+    return np.intersect1d(resume_ids, jd_ids, assume_unique=True)
+
+def missing_ids(resume_ids, jd_ids):
+    """JD terms the resume doesn't have."""
+    return np.setdiff1d(jd_ids, resume_ids, assume_unique=True)
+
+def overlap_score(n_common, n_resume, n_jd):
+    """
+    The keyword match score from overlap counts alone. score_token_sets vectorizes the two sets
+    with CountVectorizer, where every term counts once, so its cosine is |A & B| / sqrt(|A| * |B|).
+    Works element-wise on arrays.
+    """
+    denom = np.sqrt(np.asarray(n_resume, dtype=np.float64) * np.asarray(n_jd, dtype=np.float64))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.round(np.where(denom > 0, np.asarray(n_common) / denom, 0.0) * 100, 1)
+
+def compare(resume_ids, jd_ids, vocab):
+    """Same shape as ats_auditor.score_token_sets (common sorted, missing rarest-first)."""
+    from keyword_weights import rank_keywords
+    common = common_ids(resume_ids, jd_ids)
+    return {"match_score": float(overlap_score(len(common), len(resume_ids), len(jd_ids))),
+            "common_keywords": sorted(vocab.decode(common)),
+            "missing_keywords": rank_keywords(vocab.decode(missing_ids(resume_ids, jd_ids)))}
+
+# --- 3. CORPUS ---
+class TokenCorpus:
+    """Many documents' id arrays in one flat int32 buffer; doc(i) is a zero-copy view."""
+
+    def __init__(self, vocab=None):
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self._chunks = []  # id arrays added since the last pack
+        self._ids = np.zeros(0, dtype=np.int32)
+        self._offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self):
+        return len(self._offsets) - 1 + len(self._chunks)
+
+    def add(self, tokens):
+        self._chunks.append(self.vocab.encode(tokens))
+        return len(self) - 1
+
+    def _pack(self):
+        if not self._chunks: return
+        lengths = np.array([len(c) for c in self._chunks], dtype=np.int64)
+        self._ids = np.concatenate([self._ids, *self._chunks])
+        self._offsets = np.concatenate([self._offsets, self._offsets[-1] + np.cumsum(lengths)])
+        self._chunks = []
+
+    def doc(self, i):
+        self._pack()
+        return self._ids[self._offsets[i]:self._offsets[i + 1]]
+
+    def lengths(self):
+        self._pack()
+        return np.diff(self._offsets)
+
+    def overlap_counts(self, resume_ids):
+        """|resume & doc| for every document at once."""
+        self._pack()
+        # Membership through a dense lookup table: one gather over the flat buffer, no sorting
+        member = np.zeros(max(len(self.vocab), int(resume_ids.max()) + 1 if len(resume_ids) else 0), dtype=bool)
+        member[resume_ids] = True
+        running = np.concatenate([[0], np.cumsum(member[self._ids], dtype=np.int64)])
+        return running[self._offsets[1:]] - running[self._offsets[:-1]]
+
+    def match_scores(self, resume_ids, n_resume=None):
+        """
+        Keyword match score of one resume against every document, same scale as get_analysis_data.
+        Pass n_resume when the ids were encoded with add=False, so dropped terms still count in its size.
+        """
+        n_resume = len(resume_ids) if n_resume is None else n_resume
+        return overlap_score(self.overlap_counts(resume_ids), n_resume, self.lengths())
+
+    def nbytes(self):
+        self._pack()
+        return self._ids.nbytes + self._offsets.nbytes
+
+    # --- PERSISTENCE ---
+    def save(self, out_dir):
+        self._pack()
+        os.makedirs(out_dir, exist_ok=True)
+        np.save(os.path.join(out_dir, "ids.npy"), self._ids)
+        np.save(os.path.join(out_dir, "offsets.npy"), self._offsets)
+        self.vocab.save(os.path.join(out_dir, "vocab.json"))
+
+    @classmethod
+    def load(cls, out_dir, mmap=True):
+        corpus = cls(Vocabulary.load(os.path.join(out_dir, "vocab.json")))
+        mode = "r" if mmap else None
+        corpus._ids = np.load(os.path.join(out_dir, "ids.npy"), mmap_mode=mode)
+        corpus._offsets = np.load(os.path.join(out_dir, "offsets.npy"), mmap_mode=mode)
+        return corpus